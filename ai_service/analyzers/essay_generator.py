@@ -11,6 +11,7 @@ from ai_service.config import Settings
 from ai_service.models.article import AnalysisResult, ArticleCollection
 from ai_service.models.contracts import AnalysisOutput, NewsItem, DeepWebSource, FundamentalsData
 from ai_service.pipeline.base import PipelineContext, PipelineStep
+from ai_service.processors.near_duplicates import NearDuplicateIndex
 
 logger = logging.getLogger(__name__)
 
@@ -114,22 +115,27 @@ class EssayGenerator(PipelineStep[ArticleCollection, AnalysisResult]):
         # Build mainstream news section (ALL unique articles with summaries)
         news_section = "No recent mainstream news."
         if news_context:
-            # Deduplicate by title (fuzzy match via lowercase strip)
-            seen_titles = set()
+            # Collapse syndicated copies of the same story (near-duplicate title/summary)
+            index: NearDuplicateIndex[NewsItem] = NearDuplicateIndex()
             unique_items: list[NewsItem | str] = []
             for item in news_context:
                 if isinstance(item, dict):
-                    title = item.get('title', '').lower().strip()
-                    if title and title not in seen_titles:
-                        seen_titles.add(title)
+                    title = item.get('title', '').strip()
+                    if not title:
+                        continue
+                    _, is_new = index.add(item, title, item.get('summary'), item.get('source', 'News'))
+                    if is_new:
                         unique_items.append(item)
                 else:
                     unique_items.append(item)
+            copies = {id(cluster.canonical): cluster.size for cluster in index.clusters}
             
             items: list[str] = []
             for item in unique_items:  # ALL unique articles
                 if isinstance(item, dict):
                     source = item.get('source', 'News')
+                    if copies.get(id(item), 1) > 1:
+                        source = f"{source}, {copies[id(item)]} sources"
                     title = item.get('title', 'Unknown')
                     summary = (item.get('summary') or '')[:300]  # Include summary content
                     if summary:
@@ -4,10 +4,13 @@ Provides REST endpoints for the C++ Engine to interact with the AI Service.
 """
 
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import Optional, Literal, List
+from typing import AsyncIterator, Optional, Literal, List
 from datetime import datetime
+import json
 import logging
+import time
 
 from ai_service.analyzers.base_client import AIError
 from ai_service.analyzers.essay_generator import EssayGenerator
@@ -16,6 +19,7 @@ from ai_service.models.article import (
     Article,
     ArticleCollection
 )
+from ai_service.news_store import get_news_store
 
 logger = logging.getLogger(__name__)
 
@@ -230,13 +234,16 @@ class DBQueryRequest(BaseModel):
     limit: int = 100
 
 
-# ==================== In-Memory Cache ====================
-# Simple cache for Engine-submitted data (would be Redis in production)
+# ==================== Caches ====================
+# News lives in the persistent news store (ai_service/news_store.py);
+# analyses are cached in memory.
 
-_news_cache: list[NewsItem] = []
 _analysis_cache: dict[str, AnalysisResponse] = {}
 _analysis_hash_cache: dict[str, str] = {}  # cache_key -> content_hash
 
+# Newest stored items per analysis request
+ANALYSIS_MAX_NEWS = 500
+
 
 def _compute_news_hash(articles: list) -> str:
     """Compute MD5 hash of news content to detect changes."""
@@ -247,12 +254,7 @@ def _compute_news_hash(articles: list) -> str:
 
 def _get_fresh_news(ticker: Optional[str] = None, max_age_hours: int = 24) -> list[NewsItem]:
     """Get only fresh news items (within max_age_hours)."""
-    from datetime import timedelta
-    cutoff = datetime.now() - timedelta(hours=max_age_hours)
-    items = _news_cache
-    if ticker:
-        items = [n for n in items if n.ticker.upper() == ticker.upper()]
-    return [n for n in items if n.fetched_at and n.fetched_at >= cutoff]
+    return [NewsItem(**n._asdict()) for n in get_news_store().fresh(ticker, max_age_hours)]
 
 
 class RateLimitStatus(BaseModel):
@@ -304,16 +306,10 @@ async def submit_news(submission: NewsSubmission):
     Engine calls this after fetching from RSS/APIs.
     Optionally triggers AI analysis.
     """
-    global _news_cache
-    
-    # Store in cache
-    _news_cache.extend(submission.items)
-    
-    # Limit cache size
-    if len(_news_cache) > 1000:
-        _news_cache = _news_cache[-500:]
+    # Store (duplicates by ticker + canonical URL are skipped)
+    stored = get_news_store().add_many(submission.items)
     
-    logger.info(f"Received {len(submission.items)} news items from engine")
+    logger.info(f"Received {len(submission.items)} news items from engine ({stored} new)")
     
     analysis_triggered = False
     if submission.request_analysis and len(submission.items) > 0:
@@ -338,12 +334,91 @@ async def get_cached_news(
     
     Engine can query back processed news.
     """
-    items = _news_cache
+    store = get_news_store()
+    items = store.latest([ticker] if ticker else None, limit=limit)
     
-    if ticker:
-        items = [n for n in items if n.ticker.upper() == ticker.upper()]
+    return {"items": [NewsItem(**n._asdict()) for n in items], "total": store.count(ticker)}
+
+
+class NewsSearchHit(BaseModel):
+    """One ranked full-text search hit."""
+    ticker: str
+    title: str
+    source: str
+    url: Optional[str] = None
+    published: Optional[datetime] = None
+    snippet: str
+    score: float  # BM25, lower is better
+
+
+class NewsSearchResponse(BaseModel):
+    """Full-text search results, best match first."""
+    query: str
+    hits: list[NewsSearchHit]
+    took_ms: float
+
+
+@router.get("/news/search", response_model=NewsSearchResponse)
+async def search_news(
+    q: str = Query(..., min_length=1, description="Search words; 'word*' matches a prefix"),
+    ticker: Optional[str] = Query(None, description="Filter by ticker"),
+    since: Optional[datetime] = Query(None, description="Published at or after"),
+    until: Optional[datetime] = Query(None, description="Published before"),
+    limit: int = Query(20, ge=1, le=200, description="Max hits to return")
+):
+    """
+    Full-text search over stored news (title, summary, article content).
     
-    return {"items": items[-limit:], "total": len(items)}
+    Ranked by BM25 with title matches weighted highest; each hit carries a
+    snippet with the matched words in <b>...</b>.
+    """
+    started = time.perf_counter()
+    hits = get_news_store().search(q, ticker=ticker, since=since, until=until, limit=limit)
+    return NewsSearchResponse(
+        query=q,
+        hits=[NewsSearchHit(**hit._asdict()) for hit in hits],
+        took_ms=round((time.perf_counter() - started) * 1000, 2),
+    )
+
+
+class SentimentWindow(BaseModel):
+    """StockTwits message counts over one rolling window."""
+    bullish: int
+    bearish: int
+    unlabeled: int
+    total: int
+    bullish_ratio: Optional[float] = None  # Bullish share of labelled messages
+
+
+class SentimentResponse(BaseModel):
+    """Rolling StockTwits sentiment of a ticker (served from memory)."""
+    ticker: str
+    windows: dict[str, SentimentWindow]
+    last_message_id: Optional[int] = None
+    updated_at: Optional[datetime] = None
+
+
+@router.get("/sentiment/{ticker}", response_model=SentimentResponse)
+async def get_sentiment(ticker: str):
+    """
+    Bullish/bearish StockTwits message counts over the last 1h and 24h.
+    
+    Maintained by the incremental StockTwits consumer as news is fetched or
+    ingested; this endpoint never calls StockTwits itself.
+    """
+    from ai_service.fetchers.stocktwits_fetcher import get_stocktwits_consumer
+    consumer = get_stocktwits_consumer()
+    ticker = ticker.upper()
+    updated = consumer.sentiment.last_update.get(ticker)
+    return SentimentResponse(
+        ticker=ticker,
+        windows={
+            name: SentimentWindow(**counts._asdict(), total=counts.total, bullish_ratio=counts.bullish_ratio)
+            for name, counts in consumer.sentiment.get(ticker).items()
+        },
+        last_message_id=consumer.get_cursor(ticker),
+        updated_at=datetime.fromtimestamp(updated) if updated else None,
+    )
 
 
 @router.post("/analyze", response_model=AnalysisResponse)
@@ -360,10 +435,7 @@ async def request_analysis(request: AnalysisRequest):
     cache_key = f"{'-'.join(sorted(request.tickers))}:{normalize_language(request.language)}"
     
     # Build article collection from cached news
-    relevant_news = [
-        n for n in _news_cache 
-        if n.ticker.upper() in [t.upper() for t in request.tickers]
-    ]
+    relevant_news = get_news_store().latest(request.tickers, limit=ANALYSIS_MAX_NEWS)
     
     # OPTIMIZATION: Check if news content has changed since last analysis
     current_hash = _compute_news_hash(relevant_news) if relevant_news else "empty"
@@ -481,14 +553,30 @@ async def store_record(record: DBRecordRequest):
 @router.delete("/cache")
 async def clear_cache():
     """Clear all caches (for testing/maintenance)."""
-    global _news_cache, _analysis_cache, _analysis_hash_cache
-    _news_cache = []
+    global _analysis_cache, _analysis_hash_cache
+    get_news_store().clear()
     _analysis_cache = {}
     _analysis_hash_cache = {}
     logger.info("🗑️ All caches cleared")
     return {"cleared": True}
 
 
+def cache_fetched_news(news_items) -> None:
+    """Add fetched items to the news store. Also the ingestion scheduler's sink."""
+    get_news_store().add_many(news_items)
+
+
+def _fetched_payload(item) -> dict:
+    """JSON shape of one fetched item, shared by /fetch and /fetch/stream."""
+    return {
+        "ticker": item.ticker,
+        "title": item.title,
+        "source": item.source,
+        "url": item.url,
+        "published": item.published.isoformat() if item.published else None
+    }
+
+
 @router.post("/fetch")
 async def fetch_news(request: FetchRequest):
     """
@@ -501,48 +589,31 @@ async def fetch_news(request: FetchRequest):
     
     Returns fetched items and adds them to cache.
     """
-    global _news_cache
-    
     try:
         from ai_service.fetchers import get_fetcher
         
-        fetcher = get_fetcher()
-        news_items = await fetcher.fetch_multiple_tickers(
-            request.tickers, 
-            max_per_ticker=request.max_per_ticker
-        )
+        from ai_service.fetchers.scheduler import get_ingestion_scheduler
         
-        # Convert to NewsItem and add to cache
-        for item in news_items:
-            news_item = NewsItem(
-                ticker=item.ticker,
-                title=item.title,
-                source=item.source,
-                url=item.url,
-                published=item.published,
-                summary=item.summary
+        # Serve warm data when the ingestion scheduler already covers every ticker
+        scheduler = get_ingestion_scheduler()
+        warm = [scheduler.get_warm_news(t, request.max_per_ticker) for t in request.tickers] if scheduler else [None]
+        if all(batch is not None for batch in warm):
+            news_items = [item for batch in warm if batch for item in batch]
+            logger.info(f"Serving {len(news_items)} warm news items for {request.tickers}")
+        else:
+            fetcher = get_fetcher()
+            news_items = await fetcher.fetch_multiple_tickers(
+                request.tickers, 
+                max_per_ticker=request.max_per_ticker
             )
-            _news_cache.append(news_item)
-        
-        # Limit cache size
-        if len(_news_cache) > 1000:
-            _news_cache = _news_cache[-500:]
+            cache_fetched_news(news_items)
         
         logger.info(f"Fetched {len(news_items)} news items for {request.tickers}")
         
         return {
             "fetched": len(news_items),
             "tickers": request.tickers,
-            "items": [
-                {
-                    "ticker": item.ticker,
-                    "title": item.title,
-                    "source": item.source,
-                    "url": item.url,
-                    "published": item.published.isoformat() if item.published else None
-                }
-                for item in news_items  # Return all items
-            ]
+            "items": [_fetched_payload(item) for item in news_items]  # Return all items
         }
         
     except ImportError as e:
@@ -556,6 +627,60 @@ async def fetch_news(request: FetchRequest):
         raise HTTPException(status_code=500, detail=f"Fetch failed: {e}")
 
 
+@router.post("/fetch/stream")
+async def fetch_news_stream(
+    request: FetchRequest,
+    stream_format: Literal["ndjson", "sse"] = Query("ndjson", alias="format", description="ndjson or sse (Server-Sent Events)"),
+):
+    """
+    Streaming variant of /fetch.
+    
+    Emits one frame per finished source as soon as its items are parsed:
+        {"type": "items", "source": "AAPL / Yahoo RSS", "items": [...]}
+    followed by a final frame:
+        {"type": "summary", "fetched": 42, "tickers": [...], "sources": 9, "elapsed_ms": 812}
+    A failure mid-stream ends with {"type": "error", "detail": "..."} instead.
+    Items are added to the cache as they arrive.
+    """
+    from ai_service.fetchers import get_fetcher
+    
+    fetcher = get_fetcher()
+    
+    def frame(payload: dict) -> str:
+        data = json.dumps(payload, ensure_ascii=False)
+        return f"event: {payload['type']}\ndata: {data}\n\n" if stream_format == "sse" else data + "\n"
+    
+    async def frames() -> AsyncIterator[str]:
+        started = time.monotonic()
+        fetched = 0
+        sources = 0
+        try:
+            async for label, items in fetcher.stream_multiple_tickers(
+                request.tickers, max_per_ticker=request.max_per_ticker
+            ):
+                cache_fetched_news(items)
+                fetched += len(items)
+                sources += 1
+                yield frame({"type": "items", "source": label, "items": [_fetched_payload(i) for i in items]})
+        except Exception as e:
+            logger.error(f"Streaming fetch failed: {e}")
+            yield frame({"type": "error", "detail": f"Fetch failed: {e}"})
+            return
+        
+        logger.info(f"Streamed {fetched} news items from {sources} sources for {request.tickers}")
+        yield frame({
+            "type": "summary",
+            "fetched": fetched,
+            "tickers": request.tickers,
+            "sources": sources,
+            "elapsed_ms": round((time.monotonic() - started) * 1000),
+        })
+    
+    media_type = "text/event-stream" if stream_format == "sse" else "application/x-ndjson"
+    # X-Accel-Buffering: stop reverse proxies from holding back frames
+    return StreamingResponse(frames(), media_type=media_type, headers={"X-Accel-Buffering": "no", "Cache-Control": "no-cache"})
+
+
 @router.get("/sectors/performance", response_model=list[SectorPerformance])
 async def get_sectors(
     period: str = Query("1d", description="Time period for performance (1d, 1w, 1m, 1y)")
@@ -0,0 +1,259 @@
+"""Disk-backed cache of extracted article bodies.
+
+Deep-item upgrades and browser extraction fetch the same analysis pages
+for every report, across tickers and days. `ArticleCache` stores the
+extracted text once per URL in SQLite:
+
+- keyed by the SHA-256 of the canonical URL (tracking parameters, case
+  of scheme/host and trailing slashes do not create new entries);
+- text compressed with zstd (`zstandard`), or zlib where it is not
+  installed; each row records its codec, so both can be read back;
+- fetch metadata (URL, content type, kind, fetch time, raw size) kept
+  alongside;
+- a TTL per kind: news pages change or get corrected, PDF filings do not;
+- LRU eviction (by last access) once the compressed bodies exceed
+  `max_bytes`.
+
+Only successful extractions are cached; failures are retried next time.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from types import ModuleType
+from typing import Callable, NamedTuple, Optional
+from urllib.parse import urlsplit
+
+from ai_service.config import Settings
+from ai_service.news_store import canonical_url
+
+zstandard: Optional[ModuleType]
+try:
+    import zstandard as _zstandard
+    zstandard = _zstandard
+except ImportError:  # zlib fallback
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+NEWS = "news"
+PDF = "pdf"
+
+ZSTD = "zstd"
+ZLIB = "zlib"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS article_cache (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    content_type TEXT,
+    codec TEXT NOT NULL,
+    body BLOB NOT NULL,
+    raw_size INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_article_cache_access ON article_cache (last_access);
+"""
+
+
+class CachedArticle(NamedTuple):
+    url: str
+    text: str
+    kind: str
+    content_type: Optional[str]
+    fetched_at: float  # Epoch seconds
+
+
+def cache_key(url: str) -> str:
+    """Content address of a URL: SHA-256 of its canonical form."""
+    return hashlib.sha256(canonical_url(url, "").encode("utf-8")).hexdigest()
+
+
+def article_kind(url: str, content_type: Optional[str] = None) -> str:
+    """PDF (filings, reports) or news page, by content type or extension."""
+    if content_type and "pdf" in content_type.lower():
+        return PDF
+    return PDF if urlsplit(url).path.lower().endswith(".pdf") else NEWS
+
+
+def _compress(text: str, level: int) -> tuple[str, bytes]:
+    data = text.encode("utf-8")
+    if zstandard is not None:
+        return ZSTD, zstandard.ZstdCompressor(level=level).compress(data)
+    return ZLIB, zlib.compress(data, min(level, 9))
+
+
+def _decompress(codec: str, body: bytes) -> str:
+    if codec == ZSTD:
+        if zstandard is None:
+            raise ValueError("zstandard is not installed")
+        return zstandard.ZstdDecompressor().decompress(body).decode("utf-8")
+    return zlib.decompress(body).decode("utf-8")
+
+
+class ArticleCache:
+    """SQLite article-body cache with per-kind TTLs and size-bounded LRU eviction."""
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 256 * 1024 * 1024,
+        news_ttl_hours: float = 72.0,
+        pdf_ttl_hours: float = 720.0,
+        level: int = 6,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            path: SQLite file path, or ":memory:" (tests)
+            max_bytes: Compressed bodies kept before least recently used entries are evicted
+            news_ttl_hours: Lifetime of news/HTML pages
+            pdf_ttl_hours: Lifetime of PDF documents
+            level: Compression level
+            clock: Current epoch seconds (tests)
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttl_seconds = {NEWS: news_ttl_hours * 3600, PDF: pdf_ttl_hours * 3600}
+        self.level = level
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._bytes = self._conn.execute("SELECT COALESCE(SUM(LENGTH(body)), 0) FROM article_cache").fetchone()[0]
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evicted = 0
+
+    def get(self, url: str) -> Optional[CachedArticle]:
+        """Cached article of a URL, or None if missing or past its TTL."""
+        if not url:
+            return None
+        key = cache_key(url)
+        now = self._clock()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, kind, content_type, codec, body, fetched_at FROM article_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            stored_url, kind, content_type, codec, body, fetched_at = row
+            if now - fetched_at > self.ttl_seconds.get(kind, self.ttl_seconds[NEWS]):
+                self._delete(key, len(body))
+                self.expired += 1
+                self.misses += 1
+                return None
+            try:
+                text = _decompress(codec, body)
+            except Exception as e:
+                logger.warning(f"Article cache: unreadable entry for {stored_url} ({e}), dropping it")
+                self._delete(key, len(body))
+                self.misses += 1
+                return None
+            with self._conn:
+                self._conn.execute("UPDATE article_cache SET last_access = ? WHERE key = ?", (now, key))
+            self.hits += 1
+        return CachedArticle(stored_url, text, kind, content_type, fetched_at)
+
+    def put(self, url: str, text: str, content_type: Optional[str] = None) -> None:
+        """Store extracted text of a URL (replaces an existing entry)."""
+        if not url or not text:
+            return
+        key = cache_key(url)
+        codec, body = _compress(text, self.level)
+        now = self._clock()
+        with self._lock:
+            previous = self._conn.execute("SELECT LENGTH(body) FROM article_cache WHERE key = ?", (key,)).fetchone()
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO article_cache "
+                    "(key, url, kind, content_type, codec, body, raw_size, fetched_at, last_access) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, url, article_kind(url, content_type), content_type, codec, body, len(text), now, now),
+                )
+            self._bytes += len(body) - (previous[0] if previous else 0)
+            if self._bytes > self.max_bytes:
+                self._evict()
+
+    def _delete(self, key: str, size: int) -> None:
+        with self._conn:
+            self._conn.execute("DELETE FROM article_cache WHERE key = ?", (key,))
+        self._bytes -= size
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the cache fits max_bytes (lock held)."""
+        rows = self._conn.execute("SELECT key, LENGTH(body) FROM article_cache ORDER BY last_access").fetchall()
+        victims = []
+        for key, size in rows:
+            if self._bytes <= self.max_bytes:
+                break
+            victims.append((key,))
+            self._bytes -= size
+        with self._conn:
+            self._conn.executemany("DELETE FROM article_cache WHERE key = ?", victims)
+        self.evicted += len(victims)
+        logger.debug(f"Article cache: evicted {len(victims)} entries")
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM article_cache").fetchone()[0]
+
+    def get_stats(self) -> dict[str, object]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": self.count(),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "codec": ZSTD if zstandard is not None else ZLIB,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+            "expired": self.expired,
+            "evicted": self.evicted,
+        }
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM article_cache")
+            self._bytes = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_cache: Optional[ArticleCache] = None
+
+
+def get_article_cache() -> ArticleCache:
+    """Get or create the process-wide article cache from Settings."""
+    global _cache
+    if _cache is None:
+        settings = Settings()
+        path = settings.article_cache_path
+        if not path:
+            from ai_service.database import DATA_DIR
+            path = os.path.join(DATA_DIR, "article_cache.db")
+        _cache = ArticleCache(
+            path,
+            max_bytes=int(settings.article_cache_max_mb * 1024 * 1024),
+            news_ttl_hours=settings.article_cache_news_ttl_hours,
+            pdf_ttl_hours=settings.article_cache_pdf_ttl_hours,
+        )
+    return _cache
+
+
+def set_article_cache(cache: ArticleCache) -> None:
+    """Replace the process-wide cache (e.g. an in-memory cache in tests)."""
+    global _cache
+    _cache = cache
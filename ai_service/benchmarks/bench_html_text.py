@@ -0,0 +1,50 @@
+"""Benchmark: html_to_text vs. BeautifulSoup get_text() on feed entries.
+
+Uses the feed fragment corpus in ai_service/tests/fixtures/feed_fragments.json.
+
+Run from the repository root:
+    python -m ai_service.benchmarks.bench_html_text
+"""
+
+import json
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from ai_service.processors.html_text import html_to_text_batch
+
+CORPUS_PATH = Path(__file__).resolve().parents[1] / "tests" / "fixtures" / "feed_fragments.json"
+ROUNDS = 20
+
+
+def _beautifulsoup(texts: list[str]) -> list[str]:
+    return [BeautifulSoup(text, "html.parser").get_text() for text in texts]
+
+
+def _timed(func, texts: list[str]) -> float:
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        func(texts)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    corpus: list[str] = json.loads(CORPUS_PATH.read_text())
+    # One large feed: the corpus repeated to ~1000 fragments
+    texts = corpus * (1000 // len(corpus))
+    mismatches = [text for text, fast, soup in zip(texts, html_to_text_batch(texts), _beautifulsoup(texts)) if fast != soup]
+    if mismatches:
+        raise SystemExit(f"html_to_text differs from BeautifulSoup on {len(set(mismatches))} fragments: {sorted(set(mismatches))[:3]!r}")
+
+    soup_seconds = _timed(_beautifulsoup, texts)
+    fast_seconds = _timed(html_to_text_batch, texts)
+    per_round = len(texts)
+    print(f"{per_round} fragments x {ROUNDS} rounds")
+    print(f"BeautifulSoup: {soup_seconds * 1e6 / (per_round * ROUNDS):8.2f} us/fragment")
+    print(f"html_to_text:  {fast_seconds * 1e6 / (per_round * ROUNDS):8.2f} us/fragment")
+    print(f"Speedup:       {soup_seconds / fast_seconds:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Benchmark: lxml main-content extraction vs. BeautifulSoup whole-page get_text().
+
+Compares throughput and output length (a proxy for prompt tokens) on the
+stored corpus of financial news pages in ai_service/tests/fixtures/news_pages.
+The BeautifulSoup path is the previous ContentFetcher HTML extraction.
+
+Run from the repository root:
+    python -m ai_service.benchmarks.bench_main_content
+"""
+
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from ai_service.processors.main_content import extract_main_content
+
+CORPUS_DIR = Path(__file__).resolve().parents[1] / "tests" / "fixtures" / "news_pages"
+ROUNDS = 50
+
+
+def _beautifulsoup(html: bytes) -> str:
+    soup = BeautifulSoup(html, "html.parser")
+    for element in soup(["script", "style", "header", "footer", "nav", "noscript", "meta"]):
+        element.extract()
+    text = soup.get_text(separator=" ")
+    lines = (line.strip() for line in text.splitlines())
+    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+    return "\n".join(chunk for chunk in chunks if chunk)[:10000]
+
+
+def _main_content(html: bytes) -> str:
+    return extract_main_content(html).text[:10000]
+
+
+def _timed(func, pages: list[bytes]) -> float:
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        for html in pages:
+            func(html)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    corpus = {path.stem: path.read_bytes() for path in sorted(CORPUS_DIR.glob("*.html"))}
+    pages = list(corpus.values())
+    print(f"{len(pages)} pages x {ROUNDS} rounds")
+    print(f"{'page':<18} {'soup chars':>10} {'main chars':>10} {'reduction':>10}")
+    soup_total = main_total = 0
+    for name, html in corpus.items():
+        soup_chars, main_chars = len(_beautifulsoup(html)), len(_main_content(html))
+        soup_total += soup_chars
+        main_total += main_chars
+        print(f"{name:<18} {soup_chars:>10} {main_chars:>10} {1 - main_chars / soup_chars:>9.0%}")
+    print(f"{'total':<18} {soup_total:>10} {main_total:>10} {1 - main_total / soup_total:>9.0%}")
+    print(f"~tokens/page:      {soup_total / len(pages) / 4:>10.0f} {main_total / len(pages) / 4:>10.0f}")
+
+    soup_seconds = _timed(_beautifulsoup, pages)
+    main_seconds = _timed(_main_content, pages)
+    count = len(pages) * ROUNDS
+    print(f"BeautifulSoup get_text: {soup_seconds * 1e3 / count:8.3f} ms/page")
+    print(f"lxml main content:      {main_seconds * 1e3 / count:8.3f} ms/page")
+    print(f"Speedup:                {soup_seconds / main_seconds:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -51,6 +51,70 @@ class Settings(BaseSettings):
     # Service Configuration
     default_language: str = Field("German", validation_alias="DEFAULT_LANGUAGE")
     max_articles_for_ai: int = Field(20, validation_alias="MAX_ARTICLES_FOR_AI")
+
+    # News Fetching Configuration
+    news_source_timeout_seconds: float = Field(12.0, validation_alias="NEWS_SOURCE_TIMEOUT")
+    news_fetch_deadline_seconds: float = Field(20.0, validation_alias="NEWS_FETCH_DEADLINE")
+    stocktwits_per_batch: int = Field(3, validation_alias="STOCKTWITS_PER_BATCH")  # Tickers polled per multi-ticker fetch
+    feed_cache_ttl_seconds: float = Field(60.0, validation_alias="FEED_CACHE_TTL")
+    feed_cache_max_feeds: int = Field(500, validation_alias="FEED_CACHE_MAX_FEEDS")
+    feed_parse_workers: int = Field(2, validation_alias="FEED_PARSE_WORKERS")  # 0 = parse in-thread
+    feed_parse_pool_min_bytes: int = Field(32768, validation_alias="FEED_PARSE_POOL_MIN_BYTES")
+    source_breaker_failure_threshold: int = Field(3, validation_alias="SOURCE_BREAKER_THRESHOLD")
+    source_breaker_cooldown_seconds: float = Field(300.0, validation_alias="SOURCE_BREAKER_COOLDOWN")
+    yfinance_workers: int = Field(4, validation_alias="YFINANCE_WORKERS")
+    yfinance_batch_window_seconds: float = Field(0.05, validation_alias="YFINANCE_BATCH_WINDOW")
+    yfinance_max_batch: int = Field(20, validation_alias="YFINANCE_MAX_BATCH")
+
+    # News Store (SQLite, WAL); empty path = <app data dir>/news_store.db
+    news_store_path: str = Field("", validation_alias="NEWS_STORE_PATH")
+    news_store_hot_hours: float = Field(24.0, validation_alias="NEWS_STORE_HOT_HOURS")
+    news_store_retention_days: float = Field(30.0, validation_alias="NEWS_STORE_RETENTION_DAYS")
+
+    # Article Body Cache (SQLite, zstd); empty path = <app data dir>/article_cache.db
+    article_cache_path: str = Field("", validation_alias="ARTICLE_CACHE_PATH")
+    article_cache_max_mb: float = Field(256.0, validation_alias="ARTICLE_CACHE_MAX_MB")  # Compressed size
+    article_cache_news_ttl_hours: float = Field(72.0, validation_alias="ARTICLE_CACHE_NEWS_TTL_HOURS")
+    article_cache_pdf_ttl_hours: float = Field(720.0, validation_alias="ARTICLE_CACHE_PDF_TTL_HOURS")
+
+    # Background Ingestion (empty watchlist = disabled; never runs in DEV_MODE)
+    ingest_watchlist: str = Field("", validation_alias="INGEST_WATCHLIST")  # "AAPL,MSFT,..."
+    ingest_interval_seconds: float = Field(300.0, validation_alias="INGEST_INTERVAL")
+    ingest_source_intervals: str = Field("Reddit=900,General=600", validation_alias="INGEST_SOURCE_INTERVALS")
+    ingest_jitter: float = Field(0.2, validation_alias="INGEST_JITTER")
+    ingest_warm_max_age: float = Field(3.0, validation_alias="INGEST_WARM_MAX_AGE")  # In poll intervals
+
+    # Browser Pool (shared headless Chromium for article extraction)
+    browser_pool_contexts: int = Field(3, validation_alias="BROWSER_POOL_CONTEXTS")
+    browser_pool_max_pages_per_context: int = Field(50, validation_alias="BROWSER_POOL_MAX_PAGES_PER_CONTEXT")
+    browser_pool_prewarm: bool = Field(True, validation_alias="BROWSER_POOL_PREWARM")  # Launch on startup (not in DEV_MODE)
+    browser_block_resources: bool = Field(True, validation_alias="BROWSER_BLOCK_RESOURCES")
+    browser_block_resource_types: str = Field("image,media,font", validation_alias="BROWSER_BLOCK_RESOURCE_TYPES")
+    browser_block_domains: str = Field("", validation_alias="BROWSER_BLOCK_DOMAINS")  # Added to the built-in ad/tracker list
+    content_max_html_bytes: int = Field(2_000_000, validation_alias="CONTENT_MAX_HTML_BYTES")  # Download cut here
+    content_max_pdf_bytes: int = Field(20_000_000, validation_alias="CONTENT_MAX_PDF_BYTES")  # Larger PDFs are skipped
+    pdf_workers: int = Field(2, validation_alias="PDF_WORKERS")  # 0 = extract in-thread (no time limit)
+    pdf_timeout_seconds: float = Field(20.0, validation_alias="PDF_TIMEOUT")  # Per document; the worker is killed after
+    pdf_max_pages: int = Field(5, validation_alias="PDF_MAX_PAGES")
+    pdf_jobs_per_worker: int = Field(20, validation_alias="PDF_JOBS_PER_WORKER")  # Then the worker is replaced
+    deep_fetch_concurrency: int = Field(4, validation_alias="DEEP_FETCH_CONCURRENCY")
+    deep_summary_budget: int = Field(3, validation_alias="DEEP_SUMMARY_BUDGET")  # AI summaries per report
+    deep_upgrade_deadline_seconds: float = Field(45.0, validation_alias="DEEP_UPGRADE_DEADLINE")
+    content_http_min_score: float = Field(0.5, validation_alias="CONTENT_HTTP_MIN_SCORE")  # Below: extract with the browser
+
+    # HTTP Connection Pool (shared async client for all fetchers)
+    http_max_connections: int = Field(100, validation_alias="HTTP_MAX_CONNECTIONS")
+    http_max_keepalive_connections: int = Field(20, validation_alias="HTTP_MAX_KEEPALIVE")
+    http_keepalive_expiry_seconds: float = Field(30.0, validation_alias="HTTP_KEEPALIVE_EXPIRY")
+    http2_enabled: bool = Field(True, validation_alias="HTTP2_ENABLED")
+
+    # Per-host fetch throttling ("host=rate:burst:max_in_flight,...")
+    fetch_host_limits: str = Field("", validation_alias="FETCH_HOST_LIMITS")
+    fetch_default_rate: float = Field(5.0, validation_alias="FETCH_DEFAULT_RATE")
+    fetch_default_burst: int = Field(10, validation_alias="FETCH_DEFAULT_BURST")
+    fetch_default_max_in_flight: int = Field(8, validation_alias="FETCH_DEFAULT_MAX_IN_FLIGHT")
+    fetch_max_retry_after_seconds: float = Field(10.0, validation_alias="FETCH_MAX_RETRY_AFTER")
+    fetch_max_wait_seconds: float = Field(15.0, validation_alias="FETCH_MAX_WAIT")  # Longer waits fail fast
     
     # Feature Flags
     enable_browser_extraction: bool = Field(True, validation_alias="ENABLE_BROWSER_EXTRACTION")
@@ -8,14 +8,20 @@ Supports:
 
 import asyncio
 import logging
+import time
 from datetime import datetime
-from typing import Optional
-from dataclasses import dataclass
+from typing import AsyncIterator, Callable, Collection, Coroutine, Optional
+from dataclasses import dataclass, field
 
-import feedparser
-import yfinance as yf
-from bs4 import BeautifulSoup
-import requests
+import httpx
+
+from ai_service.fetchers.feed_cache import FeedCache, FeedEntry
+from ai_service.fetchers.feed_parser import FeedParserPool, get_feed_parser
+from ai_service.fetchers.http_client import rate_limited_get
+from ai_service.fetchers.rate_limiter import HostThrottled
+from ai_service.fetchers.source_health import SourceHealthRegistry, SourceUnavailableError
+from ai_service.fetchers.yfinance_gateway import YFinanceGateway, get_yfinance_gateway
+from ai_service.processors.near_duplicates import NearDuplicateIndex
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +35,11 @@ class FetchedNews:
     url: Optional[str] = None
     published: Optional[datetime] = None
     summary: Optional[str] = None
+    syndicated_by: list[str] = field(default_factory=list)  # Sources of collapsed near-duplicates
+
+
+# A pending fetch from one source
+SourceCall = Coroutine[object, object, list[FetchedNews]]
 
 
 class NewsFetcher:
@@ -78,18 +89,55 @@ class NewsFetcher:
         "ABSI": "Absci",
     }
     
-    def __init__(self, timeout: int = 10):
+    # Ticker-independent feeds that are keyword-filtered per ticker
+    GENERAL_FEEDS = ["marketwatch", "reuters_business", "cnbc"]
+    
+    # Labels of the per-ticker sources built by _ticker_sources, in priority order
+    TICKER_SOURCES = [
+        "Google Finance", "Google Company", "Yahoo RSS", "Seeking Alpha", "Benzinga",
+        "yfinance", "Reddit", "StockTwits",
+    ]
+    
+    def __init__(
+        self,
+        timeout: int = 10,
+        source_timeout: float = 12.0,
+        deadline: float = 20.0,
+        feed_cache: Optional[FeedCache] = None,
+        source_health: Optional[SourceHealthRegistry] = None,
+        feed_parser: Optional[FeedParserPool] = None,
+        yfinance: Optional[YFinanceGateway] = None,
+        stocktwits_per_batch: int = 3,
+    ):
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.feed_cache = feed_cache or FeedCache()
+        self.source_health = source_health or SourceHealthRegistry()
+        self.feed_parser = feed_parser or FeedParserPool(workers=0)
+        self.yfinance = yfinance or get_yfinance_gateway()
+        self.source_timeout = source_timeout  # Max seconds a single source may take
+        self.deadline = deadline  # Max seconds for all sources of one ticker
+        # api.stocktwits.com allows ~1 request/s: multi-ticker fetches poll only this many tickers
+        self.stocktwits_per_batch = stocktwits_per_batch
+        self.headers = {
             "User-Agent": "Mozilla/5.0 (compatible; StockNewsPro/2.0; +https://stocknewspro.app)"
-        })
+        }
     
-    async def fetch_for_ticker(self, ticker: str, max_items: int = 30) -> list[FetchedNews]:
+    async def fetch_for_ticker(
+        self,
+        ticker: str,
+        max_items: int = 30,
+        include_general: bool = True,
+        include_reddit: bool = True,
+        include_stocktwits: bool = True,
+    ) -> list[FetchedNews]:
         """
         Fetch news from 10+ sources for a ticker.
         
-        Sources (in order):
+        All sources are launched concurrently. Each source gets `source_timeout`
+        seconds, the whole fan-out gets `deadline` seconds; sources still running
+        at the deadline are cancelled and the ticker proceeds with what arrived.
+        
+        Sources (in priority order, used for de-duplication):
         1. Google Finance RSS (ticker-based)
         2. Google News (company name-based)
         3. Yahoo Finance RSS
@@ -97,79 +145,171 @@ class NewsFetcher:
         5. Benzinga
         6. yfinance library
         7. Reddit communities
-        8. General financial RSS feeds (filtered)
+        8. StockTwits (new messages since the last poll)
+        9. General financial RSS feeds (filtered)
+        
+        Pass include_general=False / include_reddit=False when the caller fetches
+        the general feeds / Reddit once for a whole batch (see fetch_multiple_tickers),
+        include_stocktwits=False for tickers beyond the batch's StockTwits cap.
         """
-        all_news = []
         company_name = self.COMPANY_NAMES.get(ticker.upper(), ticker)
+        sources = self._ticker_sources(ticker, company_name, max_items, include_general)
+        if not include_reddit and "Reddit" in sources:
+            sources.pop("Reddit").close()
+        if not include_stocktwits and "StockTwits" in sources:
+            sources.pop("StockTwits").close()
         
-        # 1. Google Finance RSS (usually best results)
-        google_news = await self._fetch_rss(ticker, "google_finance", max_items)
-        all_news.extend(google_news)
-        logger.info(f"Google Finance: {len(google_news)} items for {ticker}")
-        
-        # 2. Google News with company name
-        google_company = await self._fetch_rss_with_company(company_name, "google_company", max_items // 2)
-        all_news.extend(google_company)
-        logger.info(f"Google Company: {len(google_company)} items for {company_name}")
-        
-        # 3. Yahoo Finance RSS
-        yahoo_news = await self._fetch_rss(ticker, "yahoo_finance", max_items // 2)
-        all_news.extend(yahoo_news)
-        logger.info(f"Yahoo RSS: {len(yahoo_news)} items for {ticker}")
-        
-        # 4. Seeking Alpha
-        sa_news = await self._fetch_rss(ticker, "seeking_alpha", max_items // 3)
-        all_news.extend(sa_news)
-        logger.info(f"Seeking Alpha: {len(sa_news)} items for {ticker}")
-        
-        # 5. Benzinga
-        bz_news = await self._fetch_rss(ticker, "benzinga", max_items // 3)
-        all_news.extend(bz_news)
-        logger.info(f"Benzinga: {len(bz_news)} items for {ticker}")
-        
-        # 6. yfinance library
-        yf_news = await self._fetch_yfinance(ticker, max_items // 2)
-        all_news.extend(yf_news)
-        logger.info(f"yfinance: {len(yf_news)} items for {ticker}")
-        
-        # 7. Reddit (community posts/rumors)
-        try:
-            from ai_service.fetchers.reddit_fetcher import get_reddit_fetcher
-            reddit_fetcher = get_reddit_fetcher()
-            reddit_posts = await reddit_fetcher.fetch_for_ticker(ticker, max_items // 3)
-            for post in reddit_posts:
-                all_news.append(FetchedNews(
-                    ticker=post.ticker,
-                    title=f"[Reddit] {post.title}",
-                    source=f"r/{post.subreddit}",
-                    url=post.url,
-                    published=post.published,
-                    summary=post.selftext
-                ))
-            logger.info(f"Reddit: {len(reddit_posts)} posts for {ticker}")
-        except Exception as e:
-            logger.warning(f"Reddit integration failed: {e}")
-        
-        # 8. General financial RSS (filtered by ticker/company name)
-        for feed_name in ["marketwatch", "reuters_business", "cnbc"]:
-            try:
-                general_news = await self._fetch_general_rss(ticker, company_name, feed_name, 5)
-                all_news.extend(general_news)
-            except Exception as e:
-                logger.debug(f"General RSS fetch failed ({feed_name}): {e}")
-        
-        # Remove duplicates based on title
-        seen_titles = set()
-        unique_news = []
-        for item in all_news:
-            title_key = item.title.lower()[:50]
-            if title_key not in seen_titles:
-                seen_titles.add(title_key)
-                unique_news.append(item)
+        results: dict[str, list[FetchedNews]] = {}
+        async for label, items in self._run_sources(sources, ticker):
+            results[label] = items
+        
+        # Merge in priority order so de-duplication does not depend on arrival order
+        all_news = [item for label in sources if label in results for item in results[label]]
+        
+        unique_news = self._dedupe(all_news)
         
         logger.info(f"TOTAL unique news for {ticker}: {len(unique_news)} items from multiple sources")
         return unique_news
     
+    @staticmethod
+    def _dedupe(items: list[FetchedNews]) -> list[FetchedNews]:
+        """Collapse syndicated copies of a story, keeping the first (highest-priority) one."""
+        index: NearDuplicateIndex[FetchedNews] = NearDuplicateIndex()
+        unique_news = []
+        for item in items:
+            cluster, is_new = index.add(item, item.title, item.summary, item.source)
+            if is_new:
+                unique_news.append(item)
+            else:
+                cluster.canonical.syndicated_by.append(item.source)
+        return unique_news
+    
+    def _ticker_sources(self, ticker: str, company_name: str, max_items: int, include_general: bool = True) -> dict[str, SourceCall]:
+        """Build the per-ticker source coroutines, keyed by log label in priority order."""
+        sources: dict[str, SourceCall] = {
+            "Google Finance": self._fetch_rss(ticker, "google_finance", max_items),
+            "Google Company": self._fetch_rss_with_company(company_name, "google_company", max_items // 2),
+            "Yahoo RSS": self._fetch_rss(ticker, "yahoo_finance", max_items // 2),
+            "Seeking Alpha": self._fetch_rss(ticker, "seeking_alpha", max_items // 3),
+            "Benzinga": self._fetch_rss(ticker, "benzinga", max_items // 3),
+            "yfinance": self._fetch_yfinance(ticker, max_items // 2),
+            "Reddit": self._fetch_reddit(ticker, max_items // 3),
+            "StockTwits": self._fetch_stocktwits(ticker, max_items // 3),
+        }
+        if include_general:
+            for feed_name in self.GENERAL_FEEDS:
+                sources[feed_name] = self._fetch_general_rss(ticker, company_name, feed_name, 5)
+        return sources
+    
+    def ticker_source_labels(self) -> list[str]:
+        """Labels of the per-ticker sources, in priority order."""
+        return list(self.TICKER_SOURCES)
+    
+    async def fetch_ticker_sources(
+        self, ticker: str, labels: Collection[str], max_items: int = 30
+    ) -> AsyncIterator[tuple[str, list[FetchedNews]]]:
+        """Run only the given per-ticker sources, yielding (label, items) as each completes."""
+        company_name = self.COMPANY_NAMES.get(ticker.upper(), ticker)
+        sources = self._ticker_sources(ticker, company_name, max_items, include_general=False)
+        for label in [label for label in sources if label not in labels]:
+            sources.pop(label).close()
+        async for label, items in self._run_sources(sources, ticker):
+            yield label, items
+    
+    async def _run_sources(
+        self, sources: dict[str, SourceCall], ticker: str
+    ) -> AsyncIterator[tuple[str, list[FetchedNews]]]:
+        """Run source coroutines concurrently and yield (label, items) as each completes.
+        
+        A failing or timed-out source yields nothing; it never cancels the others.
+        """
+        tasks = {
+            asyncio.create_task(asyncio.wait_for(coro, timeout=self.source_timeout)): label
+            for label, coro in sources.items()
+        }
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.deadline
+        pending = set(tasks)
+        
+        try:
+            while pending:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    label = tasks[task]
+                    try:
+                        items = task.result()
+                    except asyncio.TimeoutError:
+                        logger.warning(f"{label}: timed out after {self.source_timeout}s for {ticker}")
+                        continue
+                    except Exception as e:
+                        logger.warning(f"{label} fetch failed for {ticker}: {e}")
+                        continue
+                    logger.info(f"{label}: {len(items)} items for {ticker}")
+                    yield label, items
+        finally:
+            if pending:
+                logger.warning(
+                    f"Fetch deadline ({self.deadline}s) hit for {ticker}, dropping: "
+                    + ", ".join(sorted(tasks[t] for t in pending))
+                )
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+    
+    async def _fetch_reddit(self, ticker: str, max_items: int) -> list[FetchedNews]:
+        """Fetch Reddit community posts/rumors as news items."""
+        from ai_service.fetchers.reddit_fetcher import get_reddit_fetcher
+        reddit_fetcher = get_reddit_fetcher()
+        reddit_posts = await reddit_fetcher.fetch_for_ticker(ticker, max_items)
+        return [
+            FetchedNews(
+                ticker=post.ticker,
+                title=f"[Reddit] {post.title}",
+                source=f"r/{post.subreddit}",
+                url=post.url,
+                published=post.published,
+                summary=post.selftext
+            )
+            for post in reddit_posts
+        ]
+    
+    async def _fetch_stocktwits(self, ticker: str, max_items: int) -> list[FetchedNews]:
+        """Poll StockTwits incrementally; new messages update the rolling sentiment, the most liked become news."""
+        from ai_service.fetchers.stocktwits_fetcher import get_stocktwits_consumer
+        messages = await get_stocktwits_consumer().poll(ticker)
+        messages.sort(key=lambda m: m.likes, reverse=True)
+        return [
+            FetchedNews(
+                ticker=ticker,
+                title=f"[StockTwits] {message.body[:150]}",
+                source="StockTwits",
+                url=message.url,
+                published=message.published,
+                summary=message.body if len(message.body) > 150 else None
+            )
+            for message in messages[:max_items]
+        ]
+    
+    async def _fetch_reddit_batch(self, companies: dict[str, str], max_items: int) -> list[FetchedNews]:
+        """Fetch Reddit posts for all tickers of a batch with combined queries."""
+        from ai_service.fetchers.reddit_fetcher import get_reddit_fetcher
+        reddit_posts = await get_reddit_fetcher().fetch_for_tickers(list(companies), max_items, companies)
+        return [
+            FetchedNews(
+                ticker=post.ticker,
+                title=f"[Reddit] {post.title}",
+                source=f"r/{post.subreddit}",
+                url=post.url,
+                published=post.published,
+                summary=post.selftext
+            )
+            for posts in reddit_posts.values()
+            for post in posts
+        ]
+    
     async def _fetch_rss_with_company(self, company_name: str, feed_name: str, max_items: int) -> list[FetchedNews]:
         """Fetch RSS with company name instead of ticker."""
         if feed_name not in self.RSS_FEEDS:
@@ -183,34 +323,52 @@ class NewsFetcher:
     
     async def _fetch_general_rss(self, ticker: str, company_name: str, feed_name: str, max_items: int) -> list[FetchedNews]:
         """Fetch general RSS and filter for relevant articles."""
+        return await self._fetch_general_routed(feed_name, {ticker: company_name}, max_items)
+    
+    async def _fetch_general_routed(self, feed_name: str, companies: dict[str, str], max_items: int) -> list[FetchedNews]:
+        """Fetch a ticker-independent feed once and route its entries to every matching ticker.
+        
+        Args:
+            feed_name: Key in RSS_FEEDS
+            companies: Ticker -> company name for all tickers to route to
+            max_items: Max items per ticker from this feed
+        """
         if feed_name not in self.RSS_FEEDS:
             return []
         
-        url = self.RSS_FEEDS[feed_name]
-        all_items = await self._fetch_rss_url(url, feed_name, ticker, max_items * 3)
+        try:
+            entries = await self._load_feed_entries(self.RSS_FEEDS[feed_name], feed_name)
+        except Exception as e:
+            logger.debug(f"RSS URL fetch failed ({feed_name}): {e}")
+            return []
         
-        # Filter to only relevant articles
-        keywords = [ticker.lower(), company_name.lower()]
-        relevant = [
-            item for item in all_items 
-            if any(kw in item.title.lower() or (item.summary and kw in item.summary.lower()) for kw in keywords)
+        routed = self._route_entries(entries[:max_items * 3], companies)
+        source = feed_name.replace("_", " ").title()
+        return [
+            self._to_news(entry, ticker, source)
+            for ticker, matched in routed.items()
+            for entry in matched[:max_items]
         ]
+    
+    def _route_entries(self, entries: list[FeedEntry], companies: dict[str, str]) -> dict[str, list[FeedEntry]]:
+        """Assign entries to every ticker whose symbol or company alias they mention.
         
-        return relevant[:max_items]
+        Uses one multi-pattern scan per entry, independent of the number of tickers.
+        """
+        from ai_service.processors.ticker_matcher import get_ticker_matcher
+        matcher = get_ticker_matcher(companies)
+        routed: dict[str, list[FeedEntry]] = {ticker: [] for ticker in companies}
+        for entry in entries:
+            for ticker in matcher.match_all(entry.title, entry.summary):
+                routed[ticker].append(entry)
+        return routed
     
     async def _fetch_yfinance(self, ticker: str, max_items: int) -> list[FetchedNews]:
-        """Fetch news via yfinance library."""
+        """Fetch news via yfinance library (batched with other tickers by the gateway)."""
         news_items = []
         
         try:
-            loop = asyncio.get_event_loop()
-            
-            # yfinance calls can be blocking
-            def fetch_yf_news():
-                t = yf.Ticker(ticker)
-                return t.news
-            
-            news = await loop.run_in_executor(None, fetch_yf_news)
+            news = await self.yfinance.news(ticker)
             
             if not news:
                 return []
@@ -236,99 +394,119 @@ class NewsFetcher:
     
     async def _fetch_rss(self, ticker: str, feed_name: str, max_items: int) -> list[FetchedNews]:
         """Fetch news from RSS feed."""
-        news_items = []
-        
         if feed_name not in self.RSS_FEEDS:
             return []
         
         url = self.RSS_FEEDS[feed_name].format(ticker=ticker)
         
         try:
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            
-            feed = feedparser.parse(response.text)
-            
-            for entry in feed.entries[:max_items]:
-                # Parse published date
-                published = None
-                if hasattr(entry, "published_parsed") and entry.published_parsed:
-                    try:
-                        published = datetime(*entry.published_parsed[:6])
-                    except Exception as e:
-                        logger.debug(f"Failed to parse RSS published date: {e}")
-                
-                # Clean title
-                title = entry.get("title", "No title")
-                if hasattr(title, "replace"):
-                    title = BeautifulSoup(title, "html.parser").get_text()
-                
-                # Get summary
-                summary = entry.get("summary", "")
-                if summary:
-                    summary = BeautifulSoup(summary, "html.parser").get_text()[:300]
-                
-                news_items.append(FetchedNews(
-                    ticker=ticker,
-                    title=title,
-                    source=feed_name.replace("_", " ").title(),
-                    url=entry.get("link", ""),
-                    published=published,
-                    summary=summary or None
-                ))
-                
+            return await self._fetch_feed(url, feed_name, ticker, max_items)
+        except SourceUnavailableError as e:
+            logger.debug(f"RSS fetch skipped for {ticker}: {e}")
+            return []
         except Exception as e:
             logger.warning(f"RSS fetch failed for {ticker} ({feed_name}): {e}")
-        
-        return news_items
+            return []
     
     async def _fetch_rss_url(self, url: str, source_name: str, ticker: str, max_items: int) -> list[FetchedNews]:
         """Fetch news from a direct RSS URL."""
-        news_items = []
-        
         try:
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            
-            feed = feedparser.parse(response.text)
-            
-            for entry in feed.entries[:max_items]:
-                # Parse published date
-                published = None
-                if hasattr(entry, "published_parsed") and entry.published_parsed:
-                    try:
-                        published = datetime(*entry.published_parsed[:6])
-                    except Exception as e:
-                        logger.debug(f"Failed to parse RSS URL published date: {e}")
-                
-                # Clean title
-                title = entry.get("title", "No title")
-                if hasattr(title, "replace"):
-                    title = BeautifulSoup(title, "html.parser").get_text()
-                
-                # Get summary
-                summary = entry.get("summary", "")
-                if summary:
-                    summary = BeautifulSoup(summary, "html.parser").get_text()[:300]
-                
-                news_items.append(FetchedNews(
-                    ticker=ticker,
-                    title=title,
-                    source=source_name.replace("_", " ").title(),
-                    url=entry.get("link", ""),
-                    published=published,
-                    summary=summary or None
-                ))
-                
+            return await self._fetch_feed(url, source_name, ticker, max_items)
         except Exception as e:
             logger.debug(f"RSS URL fetch failed ({source_name}): {e}")
+            return []
+    
+    async def _fetch_feed(self, url: str, source_name: str, ticker: str, max_items: int) -> list[FetchedNews]:
+        """Load one feed (cached or via the shared async client). Raises on HTTP errors."""
+        entries = await self._load_feed_entries(url, source_name)
+        source = source_name.replace("_", " ").title()
+        return [self._to_news(entry, ticker, source) for entry in entries[:max_items]]
+    
+    @staticmethod
+    def _to_news(entry: FeedEntry, ticker: str, source: str) -> FetchedNews:
+        return FetchedNews(
+            ticker=ticker,
+            title=entry.title,
+            source=source,
+            url=entry.link,
+            published=entry.published,
+            summary=entry.summary
+        )
+    
+    async def _load_feed_entries(self, url: str, source: str) -> list[FeedEntry]:
+        """Return parsed entries for a feed URL using conditional GET.
+        
+        Inside the cache TTL floor no request is made; afterwards the feed is
+        revalidated with its ETag/Last-Modified and a 304 reuses the parsed entries.
+        Network requests go through the source's circuit breaker, which raises
+        SourceUnavailableError while the source is open. Only 5xx, transport
+        and parse errors count as breaker failures; cancellation (source
+        timeout, fetch deadline), local throttling and 4xx answers do not.
+        Templated feeds 404 for tickers they don't cover, and the breaker is
+        per source, so one uncovered ticker must not skip the feed for the
+        rest. Latency is
+        measured from the moment the rate limiter lets the request through.
+        """
+        fresh = self.feed_cache.fresh_entries(url)
+        if fresh is not None:
+            return fresh
         
-        return news_items
+        circuit = self.source_health.get(source)
+        if not circuit.allow():
+            raise SourceUnavailableError(f"circuit open for {source}")
+        
+        started: Optional[float] = None
+        
+        def start_clock() -> None:
+            nonlocal started
+            started = time.monotonic()
+        
+        try:
+            entries = await self._revalidate_feed(url, start_clock)
+        except (asyncio.CancelledError, HostThrottled):
+            circuit.release()
+            raise
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code < 500:
+                circuit.release()
+            else:
+                circuit.record_failure(time.monotonic() - started if started is not None else 0.0)
+            raise
+        except Exception:
+            circuit.record_failure(time.monotonic() - started if started is not None else 0.0)
+            raise
+        circuit.record_success(time.monotonic() - started if started is not None else 0.0, len(entries))
+        return entries
+    
+    async def _revalidate_feed(self, url: str, on_acquired: Optional[Callable[[], None]] = None) -> list[FeedEntry]:
+        """Conditional GET of a feed, refreshing the feed cache."""
+        cached = self.feed_cache.get(url)
+        headers = {**self.headers, **self.feed_cache.conditional_headers(cached)}
+        response = await rate_limited_get(url, on_acquired, headers=headers, timeout=self.timeout)
+        
+        if response.status_code == 304 and cached is not None:
+            self.feed_cache.mark_not_modified(url)
+            return cached.entries
+        
+        response.raise_for_status()
+        entries = await self.feed_parser.parse(response.content)
+        self.feed_cache.store(
+            url, entries,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        return entries
     
     async def fetch_multiple_tickers(self, tickers: list[str], max_per_ticker: int = 5) -> list[FetchedNews]:
         """
         Fetch news for multiple tickers concurrently.
         
+        Ticker-independent feeds (GENERAL_FEEDS) are fetched once for the whole
+        batch and their entries routed to all requested tickers in one pass.
+        Reddit is searched with combined multi-ticker queries per subreddit.
+        StockTwits is polled for the first `stocktwits_per_batch` tickers only;
+        the ingestion scheduler keeps watchlist tickers' StockTwits data warm.
+        
         Args:
             tickers: List of stock tickers
             max_per_ticker: Max items per ticker
@@ -336,20 +514,101 @@ class NewsFetcher:
         Returns:
             Combined list of news items
         """
-        tasks = [self.fetch_for_ticker(t, max_per_ticker) for t in tickers]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        companies = {t: self.COMPANY_NAMES.get(t.upper(), t) for t in tickers}
+        tasks = [
+            self.fetch_for_ticker(
+                t, max_per_ticker, include_general=False, include_reddit=False,
+                include_stocktwits=i < self.stocktwits_per_batch,
+            )
+            for i, t in enumerate(tickers)
+        ]
+        # Batch-wide sources run under the same source timeout and deadline as per-ticker ones
+        reddit_batch = self._collect_sources(
+            {"Reddit": self._fetch_reddit_batch(companies, max_per_ticker // 3)}, f"{len(tickers)} tickers"
+        )
+        results = await asyncio.gather(*tasks, reddit_batch, self.fetch_general_batch(companies), return_exceptions=True)
+        *ticker_results, reddit_result, general_result = results
+        
+        # Batch-wide sources, in priority order (Reddit before the general feeds)
+        batch_by_ticker: dict[str, list[FetchedNews]] = {}
+        for name, batch_result in (("Reddit", reddit_result), ("General feed", general_result)):
+            if isinstance(batch_result, list):
+                for item in batch_result:
+                    batch_by_ticker.setdefault(item.ticker, []).append(item)
+            elif isinstance(batch_result, BaseException):
+                logger.error(f"{name} fetch error: {batch_result}")
         
         all_news = []
-        for result in results:
+        for ticker, result in zip(tickers, ticker_results):
+            ticker_news: list[FetchedNews] = []
             if isinstance(result, list):
-                all_news.extend(result)
-            elif isinstance(result, Exception):
+                ticker_news = result
+            elif isinstance(result, BaseException):
                 logger.error(f"Fetch error: {result}")
+            all_news.extend(self._dedupe(ticker_news + batch_by_ticker.pop(ticker, [])))
         
         # Sort by published date (newest first)
         all_news.sort(key=lambda x: x.published or datetime.min, reverse=True)
         
         return all_news
+    
+    async def stream_multiple_tickers(
+        self, tickers: list[str], max_per_ticker: int = 5
+    ) -> AsyncIterator[tuple[str, list[FetchedNews]]]:
+        """
+        Stream news for multiple tickers as each source completes.
+        
+        Yields (label, items) per finished source, e.g. ("AAPL / Yahoo RSS", [...]),
+        under the same per-source timeout and global deadline as fetch_multiple_tickers.
+        Near-duplicates are suppressed per ticker in arrival order: an item already
+        sent is never retracted, so a syndicated copy from a lower-priority source
+        can win if it arrives first.
+        """
+        companies = {t: self.COMPANY_NAMES.get(t.upper(), t) for t in tickers}
+        sources: dict[str, SourceCall] = {}
+        batch_reddit = False
+        for i, (ticker, company_name) in enumerate(companies.items()):
+            for label, coro in self._ticker_sources(ticker, company_name, max_per_ticker, include_general=False).items():
+                if label == "Reddit":
+                    coro.close()  # Searched once for all tickers below
+                    batch_reddit = True
+                    continue
+                if label == "StockTwits" and i >= self.stocktwits_per_batch:
+                    coro.close()
+                    continue
+                sources[f"{ticker} / {label}"] = coro
+        if batch_reddit:
+            sources["batch / Reddit"] = self._fetch_reddit_batch(companies, max_per_ticker // 3)
+        for feed_name in self.GENERAL_FEEDS:
+            sources[f"general / {feed_name}"] = self._fetch_general_routed(feed_name, companies, max_per_ticker)
+        
+        indexes: dict[str, NearDuplicateIndex[FetchedNews]] = {}
+        async for label, items in self._run_sources(sources, f"{len(tickers)} tickers"):
+            fresh = []
+            for item in items:
+                index = indexes.setdefault(item.ticker, NearDuplicateIndex())
+                cluster, is_new = index.add(item, item.title, item.summary, item.source)
+                if is_new:
+                    fresh.append(item)
+                else:
+                    cluster.canonical.syndicated_by.append(item.source)
+            if fresh:
+                yield label, fresh
+    
+    async def fetch_general_batch(self, companies: dict[str, str], max_items: int = 5) -> list[FetchedNews]:
+        """Fetch each general feed once and route entries to all tickers of the batch."""
+        sources: dict[str, SourceCall] = {
+            feed_name: self._fetch_general_routed(feed_name, companies, max_items)
+            for feed_name in self.GENERAL_FEEDS
+        }
+        return await self._collect_sources(sources, f"{len(companies)} tickers")
+    
+    async def _collect_sources(self, sources: dict[str, SourceCall], ticker: str) -> list[FetchedNews]:
+        """Run sources via _run_sources and concatenate the items of those that finished."""
+        news: list[FetchedNews] = []
+        async for _, items in self._run_sources(sources, ticker):
+            news.extend(items)
+        return news
 
 
 # Singleton instance
@@ -373,5 +632,18 @@ def get_fetcher():
         return get_mock_fetcher()
     
     if _fetcher is None:
-        _fetcher = NewsFetcher()
+        _fetcher = NewsFetcher(
+            source_timeout=settings.news_source_timeout_seconds,
+            deadline=settings.news_fetch_deadline_seconds,
+            feed_cache=FeedCache(
+                ttl_floor_seconds=settings.feed_cache_ttl_seconds,
+                max_feeds=settings.feed_cache_max_feeds,
+            ),
+            source_health=SourceHealthRegistry(
+                failure_threshold=settings.source_breaker_failure_threshold,
+                cooldown_seconds=settings.source_breaker_cooldown_seconds,
+            ),
+            feed_parser=get_feed_parser(),
+            stocktwits_per_batch=settings.stocktwits_per_batch,
+        )
     return _fetcher
@@ -1,21 +1,64 @@
-
+import codecs
 import logging
+import re
 import requests
-import io
-from bs4 import BeautifulSoup
-from typing import Optional
+from typing import Iterator, Optional
+
+from lxml import etree
+
+from ai_service.article_cache import ArticleCache
 from ai_service.config import Settings
+from ai_service.fetchers.pdf_extractor import get_pdf_extractor
+from ai_service.fetchers.rate_limiter import get_rate_limiter_registry
+from ai_service.processors.main_content import extract_main_content_from_tree
 
 logger = logging.getLogger(__name__)
 
+MAX_TEXT_CHARS = 10000  # Limit to 10k chars to save tokens
+CHUNK_BYTES = 64 * 1024
+SNIFF_BYTES = 1024
+# Stop downloading once this much paragraph text arrived (headroom for main-content scoring)
+EARLY_STOP_CHARS = 3 * MAX_TEXT_CHARS
+
+PDF_TYPE = "application/pdf"
+HTML_TYPE = "text/html"
+
+_HTML_MARKERS = (b"<!doctype html", b"<html", b"<head", b"<body")
+_META_CHARSET = re.compile(rb"""<meta[^>]+charset=["']?([\w-]+)""", re.IGNORECASE)
+
+def sniff_content_type(first_bytes: bytes, header: str = "") -> str:
+    """Content type from the leading bytes (magic numbers), falling back to the header."""
+    head = first_bytes[:SNIFF_BYTES].lstrip(b"\xef\xbb\xbf \t\r\n").lower()
+    if head.startswith(b"%pdf-"):
+        return PDF_TYPE
+    if any(marker in head for marker in _HTML_MARKERS):
+        return HTML_TYPE
+    return header.split(";")[0].strip().lower() or "application/octet-stream"
+
+
+def _is_text(content_type: str) -> bool:
+    return content_type.startswith("text/") or "html" in content_type or "xml" in content_type
+
+
 class ContentFetcher:
     """
     Fetches full text content from URLs for Deep Analysis.
     Handles HTML scrubbing and PDF extraction.
+    With an ArticleCache, extracted text is served from and stored in it.
+
+    Bodies are streamed: the type is sniffed from the first bytes, HTML is
+    fed chunk by chunk into lxml's pull parser and the download stops once
+    EARLY_STOP_CHARS of paragraph text arrived or the byte ceiling is reached,
+    so memory per fetch is bounded by CONTENT_MAX_HTML_BYTES / CONTENT_MAX_PDF_BYTES.
+    PDFs whose Content-Length exceeds the ceiling are dropped after the first chunk.
+    Only the page's main content is returned (see processors.main_content).
     """
-    
-    def __init__(self, settings: Settings = None):
+
+    def __init__(self, settings: Settings = None, cache: Optional[ArticleCache] = None):
         self.settings = settings or Settings()
+        self.cache = cache
+        self.max_html_bytes = self.settings.content_max_html_bytes
+        self.max_pdf_bytes = self.settings.content_max_pdf_bytes
         self.session = requests.Session()
         self.session.headers.update({
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
@@ -25,73 +68,157 @@ class ContentFetcher:
         """Fetch and extract cleaner text from a URL (HTML or PDF)."""
         if not url:
             return None
-            
+        if self.cache is not None:
+            cached = self.cache.get(url)
+            if cached is not None:
+                return cached.text
+        text, content_type = self._fetch_text(url)
+        if text and self.cache is not None:
+            self.cache.put(url, text, content_type)
+        return text
+
+    def _fetch_text(self, url: str) -> tuple[Optional[str], Optional[str]]:
+        """Extracted text and content type of a URL."""
+        response = None
         try:
-            # Handle PDF detection (simple extension check for now)
-            if url.lower().endswith('.pdf'):
-                return self._fetch_pdf(url)
-            
-            response = self.session.get(url, timeout=10)
+            response = self._get(url, timeout=15)
             if response.status_code != 200:
                 logger.warning(f"Failed to fetch {url}: Status {response.status_code}")
-                return None
-                
-            # Check content type header for PDF check
-            content_type = response.headers.get('Content-Type', '').lower()
-            if 'application/pdf' in content_type:
-                return self._extract_pdf_from_bytes(response.content)
-            
-            return self._extract_html_text(response.text)
-            
+                return None, None
+
+            chunks = response.iter_content(CHUNK_BYTES)
+            first = next(chunks, b"")
+            content_type = sniff_content_type(first, response.headers.get('Content-Type', ''))
+            if content_type == PDF_TYPE:
+                declared = _content_length(response)
+                if declared is not None and declared > self.max_pdf_bytes:
+                    logger.warning(f"PDF {url} declares {declared} bytes, over {self.max_pdf_bytes}, skipped")
+                    return None, content_type
+                pdf_bytes = self._read_bounded(first, chunks, self.max_pdf_bytes)
+                if pdf_bytes is None:
+                    logger.warning(f"PDF {url} exceeds {self.max_pdf_bytes} bytes, skipped")
+                    return None, content_type
+                return self._extract_pdf_from_bytes(pdf_bytes), content_type
+            if not _is_text(content_type):
+                logger.info(f"Skipping {url}: unsupported content type {content_type}")
+                return None, content_type
+
+            return self._stream_html_text(first, chunks, self._encoding(response, first)), content_type
+
         except Exception as e:
             logger.warning(f"Fetch error for {url}: {e}")
-            return None
+            return None, None
+        finally:
+            if response is not None:
+                response.close()
+
+    def fetch_html(self, url: str) -> Optional[str]:
+        """Fetch a page's raw HTML with one GET (None for errors and non-HTML responses).
 
-    def _extract_html_text(self, html_content: str) -> str:
-        """Parse HTML and extract visible text."""
+        Pages larger than CONTENT_MAX_HTML_BYTES are cut at the ceiling.
+        """
+        if not url:
+            return None
+        response = None
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # Remove scripts, styles, metadata
-            for element in soup(["script", "style", "header", "footer", "nav", "noscript", "meta"]):
-                element.extract()
-            
-            # Get text
-            text = soup.get_text(separator=' ')
-            
-            # Clean whitespace
-            lines = (line.strip() for line in text.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            clean_text = '\n'.join(chunk for chunk in chunks if chunk)
-            
-            return clean_text[:10000] # Limit to 10k chars to save tokens
-            
+            response = self._get(url, timeout=10)
+            if response.status_code != 200:
+                logger.info(f"Failed to fetch {url}: Status {response.status_code}")
+                return None
+            chunks = response.iter_content(CHUNK_BYTES)
+            first = next(chunks, b"")
+            if sniff_content_type(first, response.headers.get('Content-Type', '')) != HTML_TYPE:
+                return None
+            decoder = codecs.getincrementaldecoder(self._encoding(response, first))(errors="replace")
+            parts = []
+            for chunk in self._bounded_chunks(first, chunks, self.max_html_bytes):
+                parts.append(decoder.decode(chunk))
+            parts.append(decoder.decode(b"", final=True))
+            return "".join(parts)
         except Exception as e:
-            logger.warning(f"HTML parse error: {e}")
-            return ""
+            logger.info(f"Fetch error for {url}: {e}")
+            return None
+        finally:
+            if response is not None:
+                response.close()
+
+    def _get(self, url: str, timeout: int) -> requests.Response:
+        """Streaming GET under the shared per-host rate limiter (called from worker threads).
 
-    def _fetch_pdf(self, url: str) -> Optional[str]:
-        """Fetch PDF and extract text."""
+        Only the headers are read; the caller consumes and closes the body.
+        """
+        limiter = get_rate_limiter_registry().for_url(url)
+        with limiter.acquire_sync():
+            response = self.session.get(url, timeout=timeout, stream=True)
+        limiter.record_response(response.status_code, response.headers.get("Retry-After"))
+        return response
+
+    @staticmethod
+    def _encoding(response: requests.Response, first: bytes) -> str:
+        """Charset from the Content-Type header, else a <meta charset>, else UTF-8."""
+        if "charset" in response.headers.get('Content-Type', '').lower() and response.encoding:
+            encoding = response.encoding
+        else:
+            match = _META_CHARSET.search(first[:SNIFF_BYTES * 4])
+            encoding = match.group(1).decode("ascii") if match else "utf-8"
         try:
-            response = self.session.get(url, timeout=15)
-            if response.status_code == 200:
-                return self._extract_pdf_from_bytes(response.content)
-        except Exception as e:
-            logger.warning(f"PDF fetch error {url}: {e}")
-        return None
+            codecs.lookup(encoding)
+            return encoding
+        except LookupError:
+            return "utf-8"
 
-    def _extract_pdf_from_bytes(self, pdf_bytes: bytes) -> str:
-        """Extract text from PDF bytes using pypdf."""
+    @staticmethod
+    def _bounded_chunks(first: bytes, chunks: Iterator[bytes], max_bytes: int) -> Iterator[bytes]:
+        """The body's chunks, cut at max_bytes."""
+        received = 0
+        for chunk in _prepend(first, chunks):
+            if not chunk:
+                continue
+            chunk = chunk[:max_bytes - received]
+            received += len(chunk)
+            yield chunk
+            if received >= max_bytes:
+                return
+
+    def _read_bounded(self, first: bytes, chunks: Iterator[bytes], max_bytes: int) -> Optional[bytes]:
+        """The whole body, or None if it is larger than max_bytes."""
+        buffer = bytearray()
+        for chunk in _prepend(first, chunks):
+            buffer += chunk
+            if len(buffer) > max_bytes:
+                return None
+        return bytes(buffer)
+
+    def _stream_html_text(self, first: bytes, chunks: Iterator[bytes], encoding: str) -> str:
+        """Parse HTML as it arrives and return its main content; stops reading once enough text arrived."""
+        parser = etree.HTMLPullParser(events=("end",), tag="p", encoding=encoding)
+        paragraph_chars = 0
         try:
-            from pypdf import PdfReader
-            
-            f = io.BytesIO(pdf_bytes)
-            reader = PdfReader(f)
-            text = ""
-            for page in reader.pages[:5]: # First 5 pages only
-                text += page.extract_text() + "\n"
-                
-            return text[:10000]
+            for chunk in self._bounded_chunks(first, chunks, self.max_html_bytes):
+                parser.feed(chunk)
+                for _, paragraph in parser.read_events():
+                    paragraph_chars += sum(len(text) for text in paragraph.itertext())
+                if paragraph_chars >= EARLY_STOP_CHARS:
+                    break
+            root = parser.close()
         except Exception as e:
-            logger.warning(f"PDF extract error: {e}")
+            logger.warning(f"HTML parse error: {e}")
             return ""
+        return extract_main_content_from_tree(root).text[:MAX_TEXT_CHARS]
+
+    def _extract_pdf_from_bytes(self, pdf_bytes: bytes) -> str:
+        """Extract text from PDF bytes in the isolated PDF worker pool (time-limited)."""
+        return get_pdf_extractor().extract(pdf_bytes)
+
+
+def _content_length(response: requests.Response) -> Optional[int]:
+    """Body size announced by the Content-Length header, if any."""
+    try:
+        return int(response.headers.get('Content-Length', ''))
+    except ValueError:
+        return None
+
+
+def _prepend(first: bytes, chunks: Iterator[bytes]) -> Iterator[bytes]:
+    yield first
+    yield from chunks
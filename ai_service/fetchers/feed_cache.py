@@ -0,0 +1,102 @@
+"""Conditional-GET cache for RSS/Atom feeds.
+
+Stores the ETag/Last-Modified validators and the already parsed entries
+per feed URL. Within the TTL floor a feed is served without any network
+call; after that the fetcher revalidates with If-None-Match /
+If-Modified-Since and reuses the parsed entries on 304 Not Modified.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class FeedEntry(NamedTuple):
+    """Ticker-independent, already cleaned feed entry."""
+    title: str
+    link: str
+    summary: Optional[str]
+    published: Optional[datetime]
+
+
+@dataclass
+class CachedFeed:
+    """Parsed feed plus the validators needed to revalidate it."""
+    entries: list[FeedEntry]
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    validated_at: float = 0.0  # time.monotonic() of last 200/304
+
+
+class FeedCache:
+    """LRU cache of parsed feeds keyed by URL."""
+
+    def __init__(self, ttl_floor_seconds: float = 60.0, max_feeds: int = 500):
+        self.ttl_floor_seconds = ttl_floor_seconds
+        self.max_feeds = max_feeds
+        self._feeds: OrderedDict[str, CachedFeed] = OrderedDict()
+        self.hits = 0  # Served within TTL floor, no request
+        self.revalidated = 0  # 304 Not Modified
+        self.misses = 0  # Full download + parse
+
+    def get(self, url: str) -> Optional[CachedFeed]:
+        feed = self._feeds.get(url)
+        if feed is not None:
+            self._feeds.move_to_end(url)
+        return feed
+
+    def fresh_entries(self, url: str) -> Optional[list[FeedEntry]]:
+        """Entries of a feed still inside the TTL floor (no revalidation needed), else None."""
+        feed = self.get(url)
+        if feed is None or time.monotonic() - feed.validated_at >= self.ttl_floor_seconds:
+            return None
+        self.hits += 1
+        return feed.entries
+
+    def conditional_headers(self, feed: Optional[CachedFeed]) -> dict[str, str]:
+        """Validator headers for a conditional GET (empty if nothing is cached)."""
+        headers: dict[str, str] = {}
+        if feed is None:
+            return headers
+        if feed.etag:
+            headers["If-None-Match"] = feed.etag
+        if feed.last_modified:
+            headers["If-Modified-Since"] = feed.last_modified
+        return headers
+
+    def mark_not_modified(self, url: str) -> None:
+        """Record a 304: keep the entries, restart the TTL floor."""
+        feed = self._feeds.get(url)
+        if feed is not None:
+            feed.validated_at = time.monotonic()
+            self.revalidated += 1
+
+    def store(self, url: str, entries: list[FeedEntry], etag: Optional[str], last_modified: Optional[str]) -> None:
+        """Store a freshly downloaded and parsed feed."""
+        self._feeds[url] = CachedFeed(
+            entries=entries,
+            etag=etag,
+            last_modified=last_modified,
+            validated_at=time.monotonic(),
+        )
+        self._feeds.move_to_end(url)
+        self.misses += 1
+        while len(self._feeds) > self.max_feeds:
+            evicted, _ = self._feeds.popitem(last=False)
+            logger.debug(f"Feed cache evicted {evicted}")
+
+    def clear(self) -> None:
+        self._feeds.clear()
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "feeds": len(self._feeds),
+            "hits": self.hits,
+            "revalidated": self.revalidated,
+            "misses": self.misses,
+        }
@@ -0,0 +1,145 @@
+"""Feed parsing, optionally offloaded to a process pool.
+
+feedparser is pure Python and CPU-bound; parsing many large feeds on the
+event loop thread serialises ingestion on one core. `FeedParserPool`
+ships raw feed bytes to worker processes and gets compact `FeedEntry`
+tuples back. Feeds below `min_pool_bytes` are parsed in-thread, where
+the pickling round-trip would cost more than the parse itself.
+
+Workers use the "spawn" start method so they never inherit the event
+loop, HTTP client or locks of the serving process.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from typing import Optional
+
+import feedparser
+
+from ai_service.config import Settings
+from ai_service.fetchers.feed_cache import FeedEntry
+from ai_service.processors.html_text import html_to_text_batch
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_MAX_CHARS = 300
+
+
+def parse_feed(content: bytes) -> list[FeedEntry]:
+    """Parse raw feed bytes into cleaned, ticker-independent entries.
+
+    Top-level so it can run in a worker process.
+    """
+    feed = feedparser.parse(content)
+
+    raw_titles = []
+    raw_summaries = []
+    for entry in feed.entries:
+        title = entry.get("title", "No title")
+        raw_titles.append(title if isinstance(title, str) else str(title))
+        raw_summaries.append(entry.get("summary", ""))
+
+    # Strip tags/entities for the whole feed at once
+    titles = html_to_text_batch(raw_titles)
+    summaries = html_to_text_batch(raw_summaries)
+
+    entries = []
+    for entry, title, summary in zip(feed.entries, titles, summaries):
+        # Parse published date
+        published = None
+        if hasattr(entry, "published_parsed") and entry.published_parsed:
+            try:
+                published = datetime(*entry.published_parsed[:6])
+            except Exception as e:
+                logger.debug(f"Failed to parse RSS published date: {e}")
+
+        entries.append(FeedEntry(
+            title=title,
+            link=entry.get("link", ""),
+            summary=summary[:SUMMARY_MAX_CHARS] or None,
+            published=published,
+        ))
+
+    return entries
+
+
+class FeedParserPool:
+    """Parses feeds in worker processes, small feeds in-thread."""
+
+    def __init__(self, workers: int = 2, min_pool_bytes: int = 32_768):
+        """
+        Args:
+            workers: Worker processes; 0 disables the pool (always in-thread)
+            min_pool_bytes: Feeds smaller than this are parsed in-thread
+        """
+        self.workers = workers
+        self.min_pool_bytes = min_pool_bytes
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self.pooled = 0
+        self.inline = 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            logger.info(f"Started feed parser pool with {self.workers} workers")
+        return self._executor
+
+    async def parse(self, content: bytes) -> list[FeedEntry]:
+        """Parse raw feed bytes, in the pool when the feed is large enough."""
+        if self.workers <= 0 or len(content) < self.min_pool_bytes:
+            self.inline += 1
+            return parse_feed(content)
+
+        loop = asyncio.get_running_loop()
+        try:
+            entries = await loop.run_in_executor(self._get_executor(), parse_feed, content)
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM-killed); recreate the pool next time
+            logger.warning("Feed parser pool broke, parsing in-thread")
+            self.shutdown()
+            self.inline += 1
+            return parse_feed(content)
+        self.pooled += 1
+        return entries
+
+    def shutdown(self) -> None:
+        """Stop the worker processes (they are restarted on demand)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "workers": self.workers,
+            "min_pool_bytes": self.min_pool_bytes,
+            "pooled": self.pooled,
+            "inline": self.inline,
+        }
+
+
+_pool: Optional[FeedParserPool] = None
+
+
+def get_feed_parser() -> FeedParserPool:
+    """Get or create the process-wide feed parser from Settings."""
+    global _pool
+    if _pool is None:
+        settings = Settings()
+        _pool = FeedParserPool(
+            workers=settings.feed_parse_workers,
+            min_pool_bytes=settings.feed_parse_pool_min_bytes,
+        )
+    return _pool
+
+
+def shutdown_feed_parser() -> None:
+    """Stop the shared parser pool (called on app shutdown)."""
+    if _pool is not None:
+        _pool.shutdown()
@@ -7,6 +7,8 @@ import yfinance as yf
 import json
 
 from ai_service.config import Settings
+from ai_service.fetchers.http_client import rate_limited_get
+from ai_service.fetchers.yfinance_gateway import get_yfinance_gateway
 from ai_service.analyzers.provider_factory import ProviderFactory
 from ai_service.models.contracts import FundamentalsData, PriceHistoryResult, PriceDataPoint, EventItem
 
@@ -29,7 +31,6 @@ class HistoricAnalyzer:
         """Fetch fundamental data (P/E, PEG, Analysts, etc.) with fallbacks."""
         import asyncio
         import os
-        import requests
         from datetime import datetime
         
         # Simple file-based cache to avoid Rate Limits (429)
@@ -49,17 +50,12 @@ class HistoricAnalyzer:
             except Exception as e:
                 logger.warning(f"Cache read failed, ignoring: {e}")
 
-        loop = asyncio.get_event_loop()
         fundamentals: FundamentalsData = {}
         
-        # Try 1: yfinance with retry
+        # Try 1: yfinance with retry (batched with concurrent lookups by the gateway)
         for attempt in range(3):
             try:
-                def fetch_info():
-                    stock = yf.Ticker(ticker)
-                    return stock.info
-
-                info = await loop.run_in_executor(None, fetch_info)
+                info = await get_yfinance_gateway().info(ticker)
                 
                 if info and len(info) > 5:  # Valid response
                     fundamentals = {
@@ -89,7 +85,7 @@ class HistoricAnalyzer:
         if not fundamentals.get("pe_ratio"):
             try:
                 url = f"https://query1.finance.yahoo.com/v7/finance/quote?symbols={ticker}"
-                resp = await loop.run_in_executor(None, lambda: requests.get(url, timeout=10, headers={"User-Agent": "Mozilla/5.0"}))
+                resp = await rate_limited_get(url, timeout=10, headers={"User-Agent": "Mozilla/5.0"})
                 if resp.status_code == 200:
                     data = resp.json()
                     quote = data.get("quoteResponse", {}).get("result", [{}])[0]
@@ -109,7 +105,7 @@ class HistoricAnalyzer:
                 fmp_key = self.settings.fmp_api_key
                 # Use /stable/ endpoint (v3 is legacy and no longer works for new users)
                 url = f"https://financialmodelingprep.com/stable/profile?symbol={ticker}&apikey={fmp_key}"
-                resp = await loop.run_in_executor(None, lambda: requests.get(url, timeout=10))
+                resp = await rate_limited_get(url, timeout=10)
                 if resp.status_code == 200:
                     data = resp.json()
                     if data and len(data) > 0:
@@ -129,7 +125,7 @@ class HistoricAnalyzer:
                 
                 # Also get price target consensus from FMP
                 target_url = f"https://financialmodelingprep.com/stable/price-target-consensus?symbol={ticker}&apikey={fmp_key}"
-                resp2 = await loop.run_in_executor(None, lambda: requests.get(target_url, timeout=10))
+                resp2 = await rate_limited_get(target_url, timeout=10)
                 if resp2.status_code == 200:
                     targets = resp2.json()
                     if targets and len(targets) > 0:
@@ -147,7 +143,7 @@ class HistoricAnalyzer:
             try:
                 fh_key = self.settings.finnhub_api_key
                 url = f"https://finnhub.io/api/v1/stock/metric?symbol={ticker}&metric=all&token={fh_key}"
-                resp = await loop.run_in_executor(None, lambda: requests.get(url, timeout=10))
+                resp = await rate_limited_get(url, timeout=10)
                 if resp.status_code == 200:
                     data = resp.json()
                     metric = data.get("metric", {})
@@ -268,11 +264,8 @@ class HistoricAnalyzer:
             return {}
 
     async def _run_request(self, url: str, params: Dict[str, str], headers: Dict[str, str]):
-        """Async wrapper for requests."""
-        import requests
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, lambda: requests.get(url, params=params, headers=headers, timeout=10))
+        """GET via the shared async HTTP client under the per-host rate limiter."""
+        return await rate_limited_get(url, params=params, headers=headers, timeout=10)
 
     async def _fetch_yfinance(self, ticker: str, period: str) -> PriceHistoryResult:
         """Fallback to yfinance library."""
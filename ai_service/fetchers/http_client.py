@@ -0,0 +1,106 @@
+"""Shared async HTTP transport for all fetchers.
+
+One pooled `httpx.AsyncClient` is kept per event loop. httpx pools
+connections per origin, so every host gets its own keep-alive
+connections inside the global limits configured in Settings.
+HTTP/2 is negotiated when the optional `h2` package is installed.
+"""
+
+import asyncio
+import logging
+import weakref
+from typing import Callable, Optional
+
+import httpx
+
+from ai_service.config import Settings
+from ai_service.fetchers.rate_limiter import get_rate_limiter_registry
+
+logger = logging.getLogger(__name__)
+
+# httpx clients are bound to the loop they were first used on
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def build_http_client(
+    settings: Optional[Settings] = None,
+    transport: Optional[httpx.AsyncBaseTransport] = None,
+) -> httpx.AsyncClient:
+    """Create a pooled AsyncClient from Settings.
+
+    Args:
+        settings: Pool configuration (defaults to environment Settings)
+        transport: Optional transport override (used by tests)
+    """
+    settings = settings or Settings()
+    limits = httpx.Limits(
+        max_connections=settings.http_max_connections,
+        max_keepalive_connections=settings.http_max_keepalive_connections,
+        keepalive_expiry=settings.http_keepalive_expiry_seconds,
+    )
+    http2 = settings.http2_enabled and transport is None and _http2_available()
+    return httpx.AsyncClient(
+        limits=limits,
+        http2=http2,
+        transport=transport,
+        follow_redirects=True,
+        timeout=httpx.Timeout(10.0),
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared AsyncClient for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = build_http_client()
+        _clients[loop] = client
+        logger.debug("Created shared HTTP client for event loop")
+    return client
+
+
+def set_http_client(client: httpx.AsyncClient) -> None:
+    """Install a client for the running event loop (e.g. a mock transport in tests)."""
+    _clients[asyncio.get_running_loop()] = client
+
+
+async def close_http_client() -> None:
+    """Close the shared client of the running event loop (called on app shutdown)."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None and not client.is_closed:
+        await client.aclose()
+        logger.info("Closed shared HTTP client")
+
+
+async def rate_limited_get(
+    url: str, on_acquired: Optional[Callable[[], None]] = None, **kwargs
+) -> httpx.Response:
+    """GET through the shared client under the per-host rate limiter.
+
+    A 429/503 with a short Retry-After (<= FETCH_MAX_RETRY_AFTER) is retried
+    once after the wait; longer blocks return the throttled response and keep
+    the host paused for all fetchers. `on_acquired` is called each time the
+    limiter lets a request through (e.g. to start a latency clock).
+    """
+    registry = get_rate_limiter_registry()
+    limiter = registry.for_url(url)
+    client = get_http_client()
+
+    for attempt in range(2):
+        async with limiter.acquire():
+            if on_acquired is not None:
+                on_acquired()
+            response = await client.get(url, **kwargs)
+        delay = limiter.record_response(response.status_code, response.headers.get("Retry-After"))
+        if delay is None or delay > registry.max_retry_after or attempt == 1:
+            return response
+        logger.info(f"Retrying {limiter.host} after Retry-After of {delay:.0f}s")
+    return response
@@ -0,0 +1,257 @@
+"""PDF text extraction in an isolated, recycled process pool.
+
+pypdf is pure Python; a malformed or pathological filing can pin a core
+for minutes or leak memory. `PdfExtractorPool` runs every extraction in a
+worker process:
+
+- at most `workers` jobs are submitted at once (callers beyond that wait
+  for a slot), so a job's wall-clock limit starts when a worker is free for
+  it, not while it queues; on timeout the pool is terminated (killing the
+  stuck worker) and recreated on the next job. Jobs that were running in
+  the killed pool are resubmitted once;
+- workers are replaced after `jobs_per_worker` jobs, so leaks are contained;
+- documents over `max_bytes` are rejected without being shipped, and only
+  the first `max_pages` pages / `max_chars` characters are extracted;
+- `shutdown()` is the cancellation path: it kills the workers and releases
+  every waiting caller immediately with empty text.
+
+Callers block in worker threads (ContentFetcher runs via asyncio.to_thread),
+never longer than `timeout` per document once it is submitted. Workers use the "spawn" start
+method so they never inherit the serving process's loop, clients or locks.
+"""
+
+import io
+import logging
+import multiprocessing
+import multiprocessing.pool
+import threading
+from typing import Callable, Optional
+
+from ai_service.config import Settings
+
+logger = logging.getLogger(__name__)
+
+STARTUP_TIMEOUT_SECONDS = 60.0
+
+
+def extract_pdf_text(pdf_bytes: bytes, max_pages: int = 5, max_chars: int = 10000) -> str:
+    """Text of the first pages of a PDF.
+
+    Top-level so it can run in a worker process.
+    """
+    from pypdf import PdfReader
+
+    reader = PdfReader(io.BytesIO(pdf_bytes))
+    parts: list[str] = []
+    chars = 0
+    for page in reader.pages[:max_pages]:
+        text = page.extract_text() or ""
+        parts.append(text)
+        chars += len(text) + 1
+        if chars >= max_chars:
+            break
+    return "\n".join(parts)[:max_chars]
+
+
+def _ping() -> bool:
+    return True
+
+
+class _PoolRestarted(Exception):
+    """The pool running a job was terminated before the job finished."""
+
+
+class _Job:
+    def __init__(self, pool: Optional[multiprocessing.pool.Pool]):
+        self.pool = pool
+        self.done = threading.Event()
+        self.text: Optional[str] = None
+        self.error: Optional[BaseException] = None
+
+    def resolve(self, text: str) -> None:
+        self.text = text
+        self.done.set()
+
+    def fail(self, error: BaseException) -> None:
+        self.error = error
+        self.done.set()
+
+
+class PdfExtractorPool:
+    """Extracts PDF text in worker processes with per-document time limits."""
+
+    def __init__(
+        self,
+        workers: int = 2,
+        timeout: float = 20.0,
+        max_pages: int = 5,
+        max_chars: int = 10000,
+        max_bytes: int = 20_000_000,
+        jobs_per_worker: int = 20,
+        extract_func: Callable[[bytes, int, int], str] = extract_pdf_text,
+    ):
+        """
+        Args:
+            workers: Worker processes; 0 extracts in-thread (no isolation or time limit)
+            timeout: Wall-clock seconds per document before its worker is killed
+            max_pages: Pages extracted per document
+            max_chars: Characters returned per document
+            max_bytes: Larger documents are rejected
+            jobs_per_worker: Documents a worker handles before it is replaced
+            extract_func: Top-level extraction function run in the workers (tests)
+        """
+        self.workers = workers
+        self.timeout = timeout
+        self.max_pages = max_pages
+        self.max_chars = max_chars
+        self.max_bytes = max_bytes
+        self.jobs_per_worker = jobs_per_worker
+        self._extract_func = extract_func
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max(workers, 1))  # Submitted jobs <= workers
+        self._pool: Optional[multiprocessing.pool.Pool] = None
+        self._pending: set[_Job] = set()
+        self._shutdowns = 0  # Callers queued for a slot across a shutdown give up
+        self.extracted = 0
+        self.failed = 0
+        self.timeouts = 0
+        self.oversized = 0
+        self.restarts = 0
+
+    def _get_pool(self) -> multiprocessing.pool.Pool:
+        """The running pool, started on demand (lock held).
+
+        Waits until a worker answers, so interpreter startup is not charged
+        against the first document's time limit.
+        """
+        if self._pool is None:
+            pool = multiprocessing.get_context("spawn").Pool(self.workers, maxtasksperchild=self.jobs_per_worker)
+            try:
+                pool.apply_async(_ping).get(timeout=STARTUP_TIMEOUT_SECONDS)
+            except Exception:
+                pool.terminate()
+                raise
+            self._pool = pool
+            logger.info(f"Started PDF extractor pool with {self.workers} workers")
+        return self._pool
+
+    def extract(self, pdf_bytes: bytes) -> str:
+        """Text of a PDF, or "" if it is too large, broken, too slow or cancelled."""
+        if len(pdf_bytes) > self.max_bytes:
+            self.oversized += 1
+            logger.warning(f"PDF of {len(pdf_bytes)} bytes exceeds {self.max_bytes}, skipped")
+            return ""
+        if self.workers <= 0:
+            try:
+                text = self._extract_func(pdf_bytes, self.max_pages, self.max_chars)
+            except Exception as e:
+                self.failed += 1
+                logger.warning(f"PDF extract error: {e}")
+                return ""
+            self.extracted += 1
+            return text
+
+        for attempt in range(2):
+            try:
+                text = self._run(pdf_bytes)
+            except _PoolRestarted:
+                if attempt == 0:
+                    logger.info("PDF extractor pool restarted during a job, resubmitting it")
+                    continue
+                self.failed += 1
+                return ""
+            except TimeoutError:
+                self.timeouts += 1
+                logger.warning(f"PDF extraction exceeded {self.timeout}s, worker killed")
+                return ""
+            except Exception as e:
+                self.failed += 1
+                logger.warning(f"PDF extract error: {e}")
+                return ""
+            self.extracted += 1
+            return text
+        return ""
+
+    def _run(self, pdf_bytes: bytes) -> str:
+        shutdowns = self._shutdowns
+        with self._slots:
+            if shutdowns != self._shutdowns:
+                raise RuntimeError("PDF extractor shut down")
+            with self._lock:
+                pool = self._get_pool()
+                job = _Job(pool)
+                self._pending.add(job)
+                pool.apply_async(
+                    self._extract_func,
+                    (pdf_bytes, self.max_pages, self.max_chars),
+                    callback=job.resolve,
+                    error_callback=job.fail,
+                )
+            try:
+                if not job.done.wait(self.timeout):
+                    if self._terminate(pool):
+                        self.restarts += 1
+                    raise TimeoutError
+            finally:
+                with self._lock:
+                    self._pending.discard(job)
+        if job.error is not None:
+            raise job.error
+        return job.text or ""
+
+    def _terminate(self, pool: Optional[multiprocessing.pool.Pool] = None) -> bool:
+        """Kill a pool's workers (the current one if None) and release the jobs waiting on it."""
+        with self._lock:
+            if self._pool is None or (pool is not None and pool is not self._pool):
+                return False  # Already replaced
+            pool, self._pool = self._pool, None
+            waiting = [job for job in self._pending if job.pool is pool]
+        for job in waiting:
+            job.fail(_PoolRestarted())
+        pool.terminate()
+        return True
+
+    def shutdown(self) -> None:
+        """Kill the workers and release all waiting callers (restarted on demand)."""
+        with self._lock:
+            self._shutdowns += 1
+            waiting = list(self._pending)
+        for job in waiting:
+            job.pool = None  # Not resubmitted
+            job.fail(RuntimeError("PDF extractor shut down"))
+        self._terminate()
+
+    def get_stats(self) -> dict[str, object]:
+        return {
+            "workers": self.workers,
+            "timeout": self.timeout,
+            "extracted": self.extracted,
+            "failed": self.failed,
+            "timeouts": self.timeouts,
+            "oversized": self.oversized,
+            "restarts": self.restarts,
+        }
+
+
+_extractor: Optional[PdfExtractorPool] = None
+
+
+def get_pdf_extractor() -> PdfExtractorPool:
+    """Get or create the process-wide PDF extractor from Settings."""
+    global _extractor
+    if _extractor is None:
+        settings = Settings()
+        _extractor = PdfExtractorPool(
+            workers=settings.pdf_workers,
+            timeout=settings.pdf_timeout_seconds,
+            max_pages=settings.pdf_max_pages,
+            max_bytes=settings.content_max_pdf_bytes,
+            jobs_per_worker=settings.pdf_jobs_per_worker,
+        )
+    return _extractor
+
+
+def shutdown_pdf_extractor() -> None:
+    """Stop the shared PDF workers (called on app shutdown)."""
+    if _extractor is not None:
+        _extractor.shutdown()
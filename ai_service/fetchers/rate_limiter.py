@@ -0,0 +1,278 @@
+"""Per-host rate limiting for outbound fetcher requests.
+
+Each host gets a token bucket (requests/sec + burst) and a cap on
+concurrent in-flight requests. A 429/503 response blocks the host until
+its Retry-After has passed, for every fetcher sharing the registry.
+Callers never wait longer than `max_wait`: a longer token queue or block
+raises HostThrottled instead of sleeping, and a cancelled waiter gives its
+token back.
+
+Limits are configured per host via Settings.fetch_host_limits, e.g.
+"news.google.com=2:5:4,www.reddit.com=0.5:2:2" (rate:burst:max_in_flight).
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Iterator, Optional
+from urllib.parse import urlsplit
+
+from ai_service.config import Settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class HostLimit:
+    """Throttling parameters for one host."""
+    rate: float  # Sustained requests per second
+    burst: int  # Bucket size (requests allowed back-to-back)
+    max_in_flight: int  # Concurrent requests
+
+    def __post_init__(self) -> None:
+        if self.rate <= 0 or self.burst < 1 or self.max_in_flight < 1:
+            raise ValueError(f"Invalid host limit {self}: rate must be > 0, burst and max_in_flight >= 1")
+
+
+# Conservative defaults for the hosts that throttle us first
+DEFAULT_HOST_LIMITS: dict[str, HostLimit] = {
+    "news.google.com": HostLimit(rate=2.0, burst=5, max_in_flight=4),
+    "www.reddit.com": HostLimit(rate=0.5, burst=4, max_in_flight=2),
+    "feeds.finance.yahoo.com": HostLimit(rate=2.0, burst=5, max_in_flight=4),
+    "query1.finance.yahoo.com": HostLimit(rate=2.0, burst=5, max_in_flight=4),
+    "api.stocktwits.com": HostLimit(rate=1.0, burst=3, max_in_flight=2),
+}
+
+# Block applied on 429 when the server sends no Retry-After
+DEFAULT_BACKOFF_SECONDS = 10.0
+# Longest block a Retry-After can impose (guards against bogus dates)
+MAX_BLOCK_SECONDS = 900.0
+
+
+class HostThrottled(Exception):
+    """The host cannot be requested within the caller's maximum wait."""
+
+    def __init__(self, host: str, delay: float):
+        super().__init__(f"{host} is throttled for another {delay:.1f}s")
+        self.host = host
+        self.delay = delay
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class HostRateLimiter:
+    """Token bucket plus in-flight cap for a single host.
+
+    Usable from coroutines (`acquire`) and from worker threads
+    (`acquire_sync`); both share the same bucket and Retry-After block.
+    The in-flight cap is enforced separately for each calling style.
+    """
+
+    def __init__(self, host: str, limit: HostLimit, max_wait: float = 15.0):
+        self.host = host
+        self.limit = limit
+        self.max_wait = max_wait  # Longer waits raise HostThrottled
+        self._lock = threading.Lock()
+        self._tokens = float(limit.burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._thread_slots = threading.BoundedSemaphore(limit.max_in_flight)
+        self._async_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+        self.requests = 0
+        self.throttled = 0  # 429/503 responses seen
+        self.rejected = 0  # Acquires refused for exceeding max_wait
+
+    def _reserve(self) -> float:
+        """Take one token and return how long the caller must wait before using it.
+
+        Raises HostThrottled (without taking a token) if that wait exceeds max_wait.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(float(self.limit.burst), self._tokens + (now - self._updated) * self.limit.rate)
+            self._updated = now
+            balance = self._tokens - 1.0  # Negative balance = queued reservations
+            wait = max(-balance / self.limit.rate if balance < 0 else 0.0, self._blocked_until - now)
+            if wait > self.max_wait:
+                self.rejected += 1
+                raise HostThrottled(self.host, wait)
+            self._tokens = balance
+            self.requests += 1
+            return wait
+
+    def _refund(self) -> None:
+        """Give back a reserved token whose wait was abandoned (e.g. cancelled)."""
+        with self._lock:
+            self._tokens = min(float(self.limit.burst), self._tokens + 1.0)
+            self.requests -= 1
+
+    def _slots(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        slots = self._async_slots.get(loop)
+        if slots is None:
+            slots = asyncio.Semaphore(self.limit.max_in_flight)
+            self._async_slots[loop] = slots
+        return slots
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[None]:
+        """Wait for an in-flight slot and a token (async callers).
+
+        Raises HostThrottled if the wait would exceed max_wait.
+        """
+        async with self._slots():
+            delay = self._reserve()
+            if delay > 0:
+                logger.debug(f"Rate limiting {self.host}: waiting {delay:.2f}s")
+                try:
+                    await asyncio.sleep(delay)
+                except BaseException:
+                    self._refund()
+                    raise
+            yield
+
+    @contextmanager
+    def acquire_sync(self) -> Iterator[None]:
+        """Wait for an in-flight slot and a token (threaded callers).
+
+        Raises HostThrottled if the wait would exceed max_wait.
+        """
+        with self._thread_slots:
+            delay = self._reserve()
+            if delay > 0:
+                logger.debug(f"Rate limiting {self.host}: waiting {delay:.2f}s")
+                try:
+                    time.sleep(delay)
+                except BaseException:
+                    self._refund()
+                    raise
+            yield
+
+    def record_response(self, status_code: int, retry_after: Optional[str] = None) -> Optional[float]:
+        """Feed back a response; on 429/503 block the host. Returns the block in seconds.
+
+        Blocks are capped at MAX_BLOCK_SECONDS.
+        """
+        if status_code not in (429, 503):
+            return None
+        delay = parse_retry_after(retry_after)
+        if delay is None:
+            if status_code == 503:
+                return None  # Plain outage, not throttling
+            delay = DEFAULT_BACKOFF_SECONDS
+        delay = min(delay, MAX_BLOCK_SECONDS)
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+            self.throttled += 1
+        logger.warning(f"{self.host} throttled us (HTTP {status_code}), pausing requests for {delay:.0f}s")
+        return delay
+
+    def get_status(self) -> dict[str, float]:
+        with self._lock:
+            blocked = max(0.0, self._blocked_until - time.monotonic())
+            return {
+                "rate": self.limit.rate,
+                "burst": self.limit.burst,
+                "max_in_flight": self.limit.max_in_flight,
+                "blocked_seconds": round(blocked, 1),
+                "requests": self.requests,
+                "throttled": self.throttled,
+                "rejected": self.rejected,
+            }
+
+
+def parse_host_limits(spec: str) -> dict[str, HostLimit]:
+    """Parse "host=rate:burst:max_in_flight,..." into HostLimits.
+
+    Malformed parts and non-positive values (e.g. a rate of 0) are skipped.
+    """
+    limits: dict[str, HostLimit] = {}
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            host, values = part.split("=", 1)
+            rate, burst, in_flight = values.split(":")
+            limits[host.strip().lower()] = HostLimit(float(rate), int(burst), int(in_flight))
+        except ValueError:
+            logger.warning(f"Ignoring invalid host limit '{part}'")
+    return limits
+
+
+class RateLimiterRegistry:
+    """Hands out one shared HostRateLimiter per host."""
+
+    def __init__(
+        self,
+        limits: Optional[dict[str, HostLimit]] = None,
+        default: Optional[HostLimit] = None,
+        max_retry_after: float = 10.0,
+        max_wait: float = 15.0,
+    ):
+        self.limits = {**DEFAULT_HOST_LIMITS, **(limits or {})}
+        self.default = default or HostLimit(rate=5.0, burst=10, max_in_flight=8)
+        self.max_retry_after = max_retry_after  # Longest Retry-After worth waiting for inline
+        self.max_wait = max_wait  # Longest wait for a token before HostThrottled
+        self._limiters: dict[str, HostRateLimiter] = {}
+        self._lock = threading.Lock()
+
+    def for_host(self, host: str) -> HostRateLimiter:
+        host = host.lower()
+        with self._lock:
+            limiter = self._limiters.get(host)
+            if limiter is None:
+                limiter = HostRateLimiter(host, self.limits.get(host, self.default), self.max_wait)
+                self._limiters[host] = limiter
+            return limiter
+
+    def for_url(self, url: str) -> HostRateLimiter:
+        return self.for_host(urlsplit(url).hostname or "")
+
+    def get_status(self) -> dict[str, dict[str, float]]:
+        with self._lock:
+            limiters = list(self._limiters.values())
+        return {limiter.host: limiter.get_status() for limiter in limiters}
+
+
+_registry: Optional[RateLimiterRegistry] = None
+
+
+def get_rate_limiter_registry() -> RateLimiterRegistry:
+    """Get or create the process-wide limiter registry from Settings."""
+    global _registry
+    if _registry is None:
+        settings = Settings()
+        _registry = RateLimiterRegistry(
+            limits=parse_host_limits(settings.fetch_host_limits),
+            default=HostLimit(
+                rate=settings.fetch_default_rate,
+                burst=settings.fetch_default_burst,
+                max_in_flight=settings.fetch_default_max_in_flight,
+            ),
+            max_retry_after=settings.fetch_max_retry_after_seconds,
+            max_wait=settings.fetch_max_wait_seconds,
+        )
+    return _registry
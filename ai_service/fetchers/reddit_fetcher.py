@@ -1,10 +1,12 @@
 """Reddit news fetcher for stock-related posts and rumors."""
 
+import asyncio
 import logging
 from datetime import datetime
-from typing import List, Optional, Union
+from typing import Dict, List, Mapping, Optional, Union
 from dataclasses import dataclass
-import requests
+
+from ai_service.fetchers.http_client import rate_limited_get
 
 logger = logging.getLogger(__name__)
 
@@ -27,70 +29,158 @@ class RedditFetcher:
     
     SUBREDDITS = ["stocks", "investing", "wallstreetbets", "stockmarket"]
     
+    # Reddit rejects search queries longer than this
+    QUERY_MAX_CHARS = 512
+    # Max listing size per request
+    LISTING_LIMIT = 100
+    
     def __init__(self, timeout: int = 10):
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             "User-Agent": "StockNewsPro/1.0 (Reddit News Aggregator)"
-        })
+        }
 
     async def fetch_for_ticker(self, ticker: str, max_items: int = 10) -> List[RedditPost]:
         """
         Search Reddit for posts mentioning the ticker.
         Uses Reddit's public JSON API (no auth required for read).
+        Subreddits are searched concurrently under the shared reddit.com rate limit.
         """
-        posts = []
+        results = await asyncio.gather(*(
+            self._search(subreddit, ticker, max_items) for subreddit in self.SUBREDDITS
+        ))
         
-        for subreddit in self.SUBREDDITS:
-            try:
-                # Reddit JSON API: search within subreddit
-                url = f"https://www.reddit.com/r/{subreddit}/search.json"
-                params: dict[str, Union[str, int]] = {
-                    "q": ticker,
-                    "restrict_sr": "on",
-                    "sort": "new",
-                    "limit": max_items,
-                    "t": "week"  # Last week
-                }
-                
-                response = self.session.get(url, params=params, timeout=self.timeout)
-                
-                if response.status_code == 429:
-                    logger.warning(f"Reddit rate limit hit for r/{subreddit}")
-                    continue
-                    
-                response.raise_for_status()
-                data = response.json()
-                
-                for child in data.get("data", {}).get("children", []):
-                    post_data = child.get("data", {})
-                    
-                    # Parse timestamp
-                    created = post_data.get("created_utc")
-                    published = datetime.fromtimestamp(created) if created else None
-                    
-                    posts.append(RedditPost(
-                        ticker=ticker,
-                        title=post_data.get("title", "No title"),
-                        subreddit=subreddit,
-                        score=post_data.get("score", 0),
-                        url=f"https://reddit.com{post_data.get('permalink', '')}",
-                        published=published,
-                        selftext=post_data.get("selftext", "")[:500] if post_data.get("selftext") else None,
-                        num_comments=post_data.get("num_comments", 0),
-                        is_rumor=True
-                    ))
-                    
-                logger.info(f"Reddit r/{subreddit}: {len([p for p in posts if p.subreddit == subreddit])} posts for {ticker}")
-                
-            except Exception as e:
-                logger.warning(f"Reddit fetch failed for r/{subreddit}: {e}")
+        posts = []
+        for subreddit, children in zip(self.SUBREDDITS, results):
+            subreddit_posts = [self._to_post(ticker, subreddit, post_data) for post_data in children]
+            logger.info(f"Reddit r/{subreddit}: {len(subreddit_posts)} posts for {ticker}")
+            posts.extend(subreddit_posts)
         
         # Sort by score (popularity)
         posts.sort(key=lambda x: x.score, reverse=True)
         
         return posts[:max_items]
 
+    async def fetch_for_tickers(
+        self,
+        tickers: List[str],
+        max_items: int = 10,
+        company_names: Optional[Mapping[str, str]] = None,
+    ) -> Dict[str, List[RedditPost]]:
+        """
+        Batch mode: search many tickers with combined OR queries.
+        
+        Tickers are packed into as few "A OR B OR ..." queries as fit
+        QUERY_MAX_CHARS; every (subreddit, query) pair runs concurrently under
+        the shared reddit.com rate limit. Posts are attributed back to every
+        ticker of their query whose $SYMBOL, symbol or company name they mention.
+        
+        Args:
+            tickers: Stock tickers
+            max_items: Max posts per ticker (as in fetch_for_ticker)
+            company_names: Ticker -> company name used for attribution
+            
+        Returns:
+            Ticker -> posts sorted by score
+        """
+        from ai_service.processors.ticker_matcher import get_ticker_matcher
+        
+        tickers = list(dict.fromkeys(tickers))
+        names = company_names or {}
+        matcher = get_ticker_matcher({t: names.get(t, t) for t in tickers})
+        groups = build_queries(tickers, self.QUERY_MAX_CHARS)
+        
+        requests = [(subreddit, group) for group in groups for subreddit in self.SUBREDDITS]
+        results = await asyncio.gather(*(
+            self._search(subreddit, " OR ".join(group), min(self.LISTING_LIMIT, max_items * len(group)))
+            for subreddit, group in requests
+        ))
+        
+        posts: Dict[str, List[RedditPost]] = {ticker: [] for ticker in tickers}
+        seen: set[tuple[str, str]] = set()
+        for (subreddit, group), children in zip(requests, results):
+            for post_data in children:
+                if len(group) == 1:
+                    # Single-ticker query: Reddit's match is the attribution
+                    matched = set(group)
+                else:
+                    matched = matcher.match_all(post_data.get("title"), post_data.get("selftext")) & set(group)
+                for ticker in matched:
+                    post = self._to_post(ticker, subreddit, post_data)
+                    if (ticker, post.url) not in seen:
+                        seen.add((ticker, post.url))
+                        posts[ticker].append(post)
+        
+        for ticker_posts in posts.values():
+            ticker_posts.sort(key=lambda x: x.score, reverse=True)
+            del ticker_posts[max_items:]
+        
+        logger.info(
+            f"Reddit batch: {sum(len(p) for p in posts.values())} posts for {len(tickers)} tickers "
+            f"in {len(requests)} requests"
+        )
+        return posts
+
+    async def _search(self, subreddit: str, query: str, limit: int) -> List[dict]:
+        """Raw post data of one subreddit search (last week, newest first); [] on failure."""
+        try:
+            # Reddit JSON API: search within subreddit
+            url = f"https://www.reddit.com/r/{subreddit}/search.json"
+            params: dict[str, Union[str, int]] = {
+                "q": query,
+                "restrict_sr": "on",
+                "sort": "new",
+                "limit": limit,
+                "t": "week"  # Last week
+            }
+            
+            response = await rate_limited_get(url, params=params, headers=self.headers, timeout=self.timeout)
+            
+            if response.status_code == 429:
+                logger.warning(f"Reddit rate limit hit for r/{subreddit}")
+                return []
+                
+            response.raise_for_status()
+            data = response.json()
+            return [child.get("data", {}) for child in data.get("data", {}).get("children", [])]
+            
+        except Exception as e:
+            logger.warning(f"Reddit fetch failed for r/{subreddit}: {e}")
+            return []
+
+    @staticmethod
+    def _to_post(ticker: str, subreddit: str, post_data: dict) -> RedditPost:
+        # Parse timestamp
+        created = post_data.get("created_utc")
+        published = datetime.fromtimestamp(created) if created else None
+        
+        return RedditPost(
+            ticker=ticker,
+            title=post_data.get("title", "No title"),
+            subreddit=subreddit,
+            score=post_data.get("score", 0),
+            url=f"https://reddit.com{post_data.get('permalink', '')}",
+            published=published,
+            selftext=post_data.get("selftext", "")[:500] if post_data.get("selftext") else None,
+            num_comments=post_data.get("num_comments", 0),
+            is_rumor=True
+        )
+
+
+def build_queries(tickers: List[str], max_chars: int = RedditFetcher.QUERY_MAX_CHARS) -> List[List[str]]:
+    """Pack tickers into groups whose "A OR B OR ..." query fits max_chars."""
+    groups: List[List[str]] = []
+    length = 0
+    for ticker in tickers:
+        extra = len(ticker) + (len(" OR ") if groups and groups[-1] else 0)
+        if groups and groups[-1] and length + extra <= max_chars:
+            groups[-1].append(ticker)
+            length += extra
+        else:
+            groups.append([ticker])
+            length = len(ticker)
+    return groups
+
 
 # Singleton
 _reddit_fetcher: Optional[RedditFetcher] = None
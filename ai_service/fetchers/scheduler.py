@@ -0,0 +1,300 @@
+"""Background ingestion of watchlist news.
+
+`IngestionScheduler` polls every (ticker, source) pair of the configured
+watchlist on its own interval, so request handlers can read warm news
+instead of paying the full fan-out latency per request.
+
+- Intervals come from INGEST_INTERVAL (default) and INGEST_SOURCE_INTERVALS
+  ("Reddit=900,General=600"); every next poll is jittered by
+  +/- INGEST_JITTER so sources never fire in lockstep.
+- A cursor per (ticker, source) keeps the high-water mark (newest published
+  timestamp) and recently seen item IDs; only new items are stored and
+  passed to the sink.
+- The ticker-independent general feeds are polled once for the whole
+  watchlist under the "General" label.
+- Warm news is only served while every per-ticker source has completed a
+  poll within INGEST_WARM_MAX_AGE of its intervals; after that (e.g. a
+  source whose polls keep failing) callers fetch live again.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Collection, Optional
+
+from ai_service.config import Settings
+from ai_service.fetchers import FetchedNews, NewsFetcher, get_fetcher
+
+logger = logging.getLogger(__name__)
+
+GENERAL_LABEL = "General"
+
+# Seen IDs remembered per (ticker, source) cursor
+CURSOR_SEEN_LIMIT = 500
+
+# Bounds for the scheduler's idle sleep
+MIN_SLEEP_SECONDS = 0.5
+MAX_SLEEP_SECONDS = 30.0
+
+NewsSink = Callable[[list[FetchedNews]], None]
+
+
+def _item_id(item: FetchedNews) -> str:
+    return item.url or item.title.lower()
+
+
+@dataclass
+class SourceCursor:
+    """High-water mark and recently seen IDs of one (ticker, source)."""
+    high_water: Optional[datetime] = None
+    seen: "OrderedDict[str, None]" = field(default_factory=OrderedDict)
+
+    def take_new(self, items: list[FetchedNews]) -> list[FetchedNews]:
+        """Filter items to those not ingested before and advance the cursor."""
+        fresh = []
+        for item in items:
+            item_id = _item_id(item)
+            if item_id in self.seen:
+                continue
+            # Older than the high-water mark: only trust the seen window while it is not full
+            if item.published and self.high_water and item.published < self.high_water and len(self.seen) >= CURSOR_SEEN_LIMIT:
+                continue
+            self.seen[item_id] = None
+            fresh.append(item)
+        while len(self.seen) > CURSOR_SEEN_LIMIT:
+            self.seen.popitem(last=False)
+        published = [item.published for item in fresh if item.published]
+        if published:
+            newest = max(published)
+            self.high_water = max(self.high_water, newest) if self.high_water else newest
+        return fresh
+
+
+def parse_source_intervals(spec: str) -> dict[str, float]:
+    """Parse "Source=seconds,..." (invalid parts are skipped)."""
+    intervals: dict[str, float] = {}
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            label, seconds = part.split("=", 1)
+            intervals[label.strip()] = float(seconds)
+        except ValueError:
+            logger.warning(f"Ignoring invalid source interval '{part}'")
+    return intervals
+
+
+class IngestionScheduler:
+    """Polls a watchlist per (ticker, source) with jittered intervals."""
+
+    def __init__(
+        self,
+        fetcher: NewsFetcher,
+        watchlist: Collection[str],
+        interval_seconds: float = 300.0,
+        source_intervals: Optional[dict[str, float]] = None,
+        jitter: float = 0.2,
+        warm_max_age: float = 3.0,
+        max_items: int = 30,
+        warm_max_items: int = 200,
+        sink: Optional[NewsSink] = None,
+        rng: Optional[random.Random] = None,
+    ):
+        """
+        Args:
+            fetcher: Fetcher whose sources are polled
+            watchlist: Tickers to keep warm
+            interval_seconds: Poll interval for sources without an override
+            source_intervals: Source label -> poll interval
+            jitter: Relative jitter applied to every interval (0.2 = +/-20%)
+            warm_max_age: Warm news expires when a source's last poll is older than this many intervals
+            max_items: Items requested per source poll
+            warm_max_items: New items kept in memory per ticker
+            sink: Called with every batch of new items (e.g. the news cache)
+        """
+        self.fetcher = fetcher
+        self.watchlist = [t.upper() for t in watchlist]
+        self.interval_seconds = interval_seconds
+        self.source_intervals = source_intervals or {}
+        self.jitter = jitter
+        self.warm_max_age = warm_max_age
+        self.max_items = max_items
+        self.sink = sink
+        self._rng = rng or random.Random()
+
+        self._labels = fetcher.ticker_source_labels() + [GENERAL_LABEL]
+        self._cursors: dict[tuple[str, str], SourceCursor] = {}
+        self._warm: dict[str, deque[FetchedNews]] = {t: deque(maxlen=warm_max_items) for t in self.watchlist}
+        self._polled_at: dict[tuple[str, str], float] = {}  # time.monotonic() of the last completed poll
+        self._due: dict[tuple[str, str], float] = {}
+        self._in_flight: set[tuple[str, str]] = set()
+        self._polls: set[asyncio.Task[None]] = set()
+        self._task: Optional[asyncio.Task[None]] = None
+        self.polls_completed = 0
+        self.items_ingested = 0
+
+    def _interval(self, label: str) -> float:
+        return self.source_intervals.get(label, self.interval_seconds)
+
+    def _schedule(self, key: tuple[str, str], now: float, first: bool = False) -> None:
+        interval = self._interval(key[1])
+        if first:
+            # Spread the initial polls instead of firing everything at startup
+            self._due[key] = now + self._rng.uniform(0, interval * self.jitter)
+        else:
+            self._due[key] = now + interval * self._rng.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def _keys(self) -> list[tuple[str, str]]:
+        keys = [(ticker, label) for ticker in self.watchlist for label in self._labels if label != GENERAL_LABEL]
+        return keys + [("*", GENERAL_LABEL)]
+
+    def start(self) -> None:
+        """Start polling in the running event loop."""
+        if self._task is not None:
+            return
+        now = asyncio.get_running_loop().time()
+        for key in self._keys():
+            self._schedule(key, now, first=True)
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"Ingestion scheduler started for {len(self.watchlist)} tickers, {len(self._labels)} sources each")
+
+    async def stop(self) -> None:
+        """Cancel the loop and any polls in flight."""
+        tasks = [t for t in [self._task, *self._polls] if t is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+        self._polls.clear()
+        self._in_flight.clear()
+        logger.info("Ingestion scheduler stopped")
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            now = loop.time()
+            due = [key for key, at in self._due.items() if at <= now and key not in self._in_flight]
+            by_ticker: dict[str, list[str]] = {}
+            for ticker, label in due:
+                by_ticker.setdefault(ticker, []).append(label)
+            for ticker, labels in by_ticker.items():
+                self._spawn(ticker, labels)
+
+            waiting = [at for key, at in self._due.items() if key not in self._in_flight]
+            sleep = min(waiting) - loop.time() if waiting else MAX_SLEEP_SECONDS
+            await asyncio.sleep(min(max(sleep, MIN_SLEEP_SECONDS), MAX_SLEEP_SECONDS))
+
+    def _spawn(self, ticker: str, labels: list[str]) -> None:
+        keys = [(ticker, label) for label in labels]
+        self._in_flight.update(keys)
+        poll = self._poll_general() if ticker == "*" else self._poll_ticker(ticker, labels)
+        task = asyncio.create_task(poll)
+        self._polls.add(task)
+
+        def finished(done: asyncio.Task[None]) -> None:
+            self._polls.discard(done)
+            self._in_flight.difference_update(keys)
+            if not done.cancelled() and done.exception() is None:
+                polled_at = time.monotonic()
+                self._polled_at.update((key, polled_at) for key in keys)
+            now = asyncio.get_running_loop().time()
+            for key in keys:
+                self._schedule(key, now)
+            if not done.cancelled() and done.exception() is not None:
+                logger.warning(f"Ingestion poll for {ticker} failed: {done.exception()}")
+
+        task.add_done_callback(finished)
+
+    async def _poll_ticker(self, ticker: str, labels: list[str]) -> None:
+        async for label, items in self.fetcher.fetch_ticker_sources(ticker, labels, self.max_items):
+            self._ingest(ticker, label, items)
+        self.polls_completed += 1
+
+    async def _poll_general(self) -> None:
+        companies = {t: self.fetcher.COMPANY_NAMES.get(t, t) for t in self.watchlist}
+        items = await self.fetcher.fetch_general_batch(companies, self.max_items)
+        by_ticker: dict[str, list[FetchedNews]] = {}
+        for item in items:
+            by_ticker.setdefault(item.ticker.upper(), []).append(item)
+        for ticker, ticker_items in by_ticker.items():
+            self._ingest(ticker, GENERAL_LABEL, ticker_items)
+        self.polls_completed += 1
+
+    def _ingest(self, ticker: str, label: str, items: list[FetchedNews]) -> None:
+        cursor = self._cursors.setdefault((ticker, label), SourceCursor())
+        fresh = cursor.take_new(items)
+        if not fresh:
+            return
+        warm = self._warm.get(ticker)
+        if warm is not None:
+            warm.extend(fresh)
+        self.items_ingested += len(fresh)
+        logger.debug(f"Ingested {len(fresh)} new items for {ticker} from {label}")
+        if self.sink is not None:
+            try:
+                self.sink(fresh)
+            except Exception as e:
+                logger.warning(f"Ingestion sink failed: {e}")
+
+    def is_warm(self, ticker: str) -> bool:
+        """Whether every per-ticker source of a watched ticker was polled within warm_max_age intervals."""
+        ticker = ticker.upper()
+        if ticker not in self._warm:
+            return False
+        now = time.monotonic()
+        for label in self._labels:
+            if label == GENERAL_LABEL:
+                continue
+            polled_at = self._polled_at.get((ticker, label))
+            # The loop wakes at most every MIN_SLEEP_SECONDS, so shorter intervals are not kept
+            max_age = max(self._interval(label), MIN_SLEEP_SECONDS) * self.warm_max_age
+            if polled_at is None or now - polled_at > max_age:
+                return False
+        return True
+
+    def get_warm_news(self, ticker: str, max_items: int = 50) -> Optional[list[FetchedNews]]:
+        """Warm news for a watched ticker (newest first), None until it is warm or once it is stale."""
+        ticker = ticker.upper()
+        if not self.is_warm(ticker):
+            return None
+        items = NewsFetcher._dedupe(list(reversed(self._warm[ticker])))
+        items.sort(key=lambda n: n.published or datetime.min, reverse=True)
+        return items[:max_items]
+
+    def get_status(self) -> dict[str, object]:
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "watchlist": self.watchlist,
+            "sources": self._labels,
+            "warm_tickers": [t for t in self.watchlist if self.is_warm(t)],
+            "polls_completed": self.polls_completed,
+            "items_ingested": self.items_ingested,
+            "in_flight": len(self._in_flight),
+        }
+
+
+_scheduler: Optional[IngestionScheduler] = None
+
+
+def get_ingestion_scheduler() -> Optional[IngestionScheduler]:
+    """Get or create the scheduler from Settings (None if no watchlist or in DEV_MODE)."""
+    global _scheduler
+    if _scheduler is None:
+        settings = Settings()
+        watchlist = [t.strip() for t in settings.ingest_watchlist.split(",") if t.strip()]
+        if not watchlist or settings.dev_mode:
+            return None
+        _scheduler = IngestionScheduler(
+            fetcher=get_fetcher(),
+            watchlist=watchlist,
+            interval_seconds=settings.ingest_interval_seconds,
+            source_intervals=parse_source_intervals(settings.ingest_source_intervals),
+            jitter=settings.ingest_jitter,
+            warm_max_age=settings.ingest_warm_max_age,
+        )
+    return _scheduler
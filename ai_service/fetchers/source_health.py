@@ -0,0 +1,164 @@
+"""Circuit breakers and health statistics for news sources.
+
+Every source in NewsFetcher.RSS_FEEDS gets a breaker. After
+`failure_threshold` consecutive failures it opens and the source is
+skipped without a request. Once `cooldown_seconds` have passed one
+half-open probe is let through; success closes the breaker, failure
+opens it again.
+
+Alongside, per-source success rate, p50/p95 latency and item yield are
+tracked and exposed via GET /health/sources.
+"""
+
+import logging
+import time
+from collections import deque
+from enum import Enum
+from typing import Optional, TypedDict
+
+logger = logging.getLogger(__name__)
+
+# Samples kept per source for latency/yield statistics
+STATS_WINDOW = 200
+
+
+class SourceUnavailableError(Exception):
+    """Raised when a source is skipped because its circuit is open."""
+
+
+class BreakerState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class SourceStatus(TypedDict):
+    state: str
+    consecutive_failures: int
+    requests: int
+    successes: int
+    failures: int
+    rejected: int
+    success_rate: Optional[float]
+    latency_p50_ms: Optional[float]
+    latency_p95_ms: Optional[float]
+    avg_items: Optional[float]
+    retry_in_seconds: Optional[float]
+
+
+def _percentile(sorted_values: list[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+class SourceCircuit:
+    """Circuit breaker plus rolling statistics for one source."""
+
+    def __init__(self, name: str, failure_threshold: int = 3, cooldown_seconds: float = 300.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.state = BreakerState.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+
+        self.requests = 0
+        self.successes = 0
+        self.failures = 0
+        self.rejected = 0
+        self._outcomes: deque[bool] = deque(maxlen=STATS_WINDOW)
+        self._latencies: deque[float] = deque(maxlen=STATS_WINDOW)
+        self._yields: deque[int] = deque(maxlen=STATS_WINDOW)
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now (reserves the half-open probe)."""
+        if self.state == BreakerState.OPEN:
+            if time.monotonic() - self.opened_at < self.cooldown_seconds:
+                self.rejected += 1
+                return False
+            self.state = BreakerState.HALF_OPEN
+            self._probe_in_flight = False
+            logger.info(f"Source {self.name}: half-open, sending probe")
+        if self.state == BreakerState.HALF_OPEN:
+            if self._probe_in_flight:
+                self.rejected += 1
+                return False
+            self._probe_in_flight = True
+        return True
+
+    def record_success(self, latency: float, items: int) -> None:
+        self._record(True, latency)
+        self.successes += 1
+        self._yields.append(items)
+        self.consecutive_failures = 0
+        if self.state != BreakerState.CLOSED:
+            logger.info(f"Source {self.name}: probe succeeded, circuit closed")
+        self.state = BreakerState.CLOSED
+        self._probe_in_flight = False
+
+    def record_failure(self, latency: float) -> None:
+        self._record(False, latency)
+        self.failures += 1
+        self.consecutive_failures += 1
+        self._probe_in_flight = False
+        if self.state == BreakerState.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != BreakerState.OPEN:
+                logger.warning(
+                    f"Source {self.name}: circuit opened after {self.consecutive_failures} failures, "
+                    f"skipping for {self.cooldown_seconds:.0f}s"
+                )
+            self.state = BreakerState.OPEN
+            self.opened_at = time.monotonic()
+
+    def release(self) -> None:
+        """End a request that neither succeeded nor failed (cancelled or throttled locally)."""
+        self._probe_in_flight = False
+
+    def _record(self, ok: bool, latency: float) -> None:
+        self.requests += 1
+        self._outcomes.append(ok)
+        self._latencies.append(latency)
+
+    def get_status(self) -> SourceStatus:
+        latencies = sorted(self._latencies)
+        p50 = _percentile(latencies, 50)
+        p95 = _percentile(latencies, 95)
+        retry_in = None
+        if self.state == BreakerState.OPEN:
+            retry_in = round(max(0.0, self.cooldown_seconds - (time.monotonic() - self.opened_at)), 1)
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self.consecutive_failures,
+            "requests": self.requests,
+            "successes": self.successes,
+            "failures": self.failures,
+            "rejected": self.rejected,
+            "success_rate": round(sum(self._outcomes) / len(self._outcomes), 3) if self._outcomes else None,
+            "latency_p50_ms": round(p50 * 1000, 1) if p50 is not None else None,
+            "latency_p95_ms": round(p95 * 1000, 1) if p95 is not None else None,
+            "avg_items": round(sum(self._yields) / len(self._yields), 1) if self._yields else None,
+            "retry_in_seconds": retry_in,
+        }
+
+
+class SourceHealthRegistry:
+    """Holds one SourceCircuit per source name."""
+
+    def __init__(self, failure_threshold: int = 3, cooldown_seconds: float = 300.0):
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self._circuits: dict[str, SourceCircuit] = {}
+
+    def get(self, source: str) -> SourceCircuit:
+        circuit = self._circuits.get(source)
+        if circuit is None:
+            circuit = SourceCircuit(source, self.failure_threshold, self.cooldown_seconds)
+            self._circuits[source] = circuit
+        return circuit
+
+    def get_status(self) -> dict[str, SourceStatus]:
+        return {name: circuit.get_status() for name, circuit in sorted(self._circuits.items())}
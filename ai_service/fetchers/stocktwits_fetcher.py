@@ -1,10 +1,14 @@
 """StockTwits fetcher for real-time trader sentiment."""
 
+import asyncio
 import logging
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 from dataclasses import dataclass
-import requests
+
+from ai_service.fetchers.http_client import rate_limited_get
+from ai_service.news_store import NewsStore, get_news_store
+from ai_service.processors.rolling_sentiment import RollingSentiment
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +23,7 @@ class StockTwit:
     published: Optional[datetime] = None
     likes: int = 0
     is_rumor: bool = True
+    message_id: int = 0
 
 
 class StockTwitsFetcher:
@@ -26,67 +31,159 @@ class StockTwitsFetcher:
     
     BASE_URL = "https://api.stocktwits.com/api/2/streams/symbol"
     
+    # Messages per stream page (API maximum)
+    PAGE_SIZE = 30
+    
     def __init__(self, timeout: int = 10):
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             "User-Agent": "StockNewsPro/1.0"
-        })
+        }
 
     async def fetch_for_ticker(self, ticker: str, max_items: int = 15) -> List[StockTwit]:
         """
         Fetch messages for a ticker from StockTwits.
         Uses the free public API (no auth needed).
         """
-        messages = []
+        messages = (await self._get_page(ticker, {}) or [])[:max_items]
+        logger.info(f"StockTwits: {len(messages)} messages for {ticker}")
+        return messages
+
+    async def fetch_since(self, ticker: str, since_id: Optional[int] = None, max_pages: int = 5) -> List[StockTwit]:
+        """
+        Fetch only messages newer than since_id (newest first).
+        
+        Without since_id this is the latest page. With it, older pages are
+        followed ("max" cursor) while they are full, up to max_pages, so a
+        burst of messages between two polls is not cut off at one page.
+        """
+        if since_id is None:
+            return await self._get_page(ticker, {}) or []
         
+        messages: List[StockTwit] = []
+        params: Dict[str, int] = {"since": since_id}
+        for _ in range(max_pages):
+            page = await self._get_page(ticker, params)
+            if not page:
+                break
+            messages.extend(m for m in page if m.message_id > since_id)
+            oldest = min(m.message_id for m in page)
+            if len(page) < self.PAGE_SIZE or oldest <= since_id + 1:
+                break
+            params = {"since": since_id, "max": oldest - 1}
+        return messages
+
+    async def _get_page(self, ticker: str, params: Dict[str, int]) -> Optional[List[StockTwit]]:
+        """One page of a symbol stream (newest first); None on errors."""
         try:
             url = f"{self.BASE_URL}/{ticker}.json"
-            response = self.session.get(url, timeout=self.timeout)
+            response = await rate_limited_get(url, params=params, headers=self.headers, timeout=self.timeout)
             
             if response.status_code == 404:
                 logger.info(f"StockTwits: No stream for {ticker}")
-                return []
+                return None
                 
             if response.status_code == 429:
                 logger.warning("StockTwits rate limit hit")
-                return []
+                return None
                 
             response.raise_for_status()
             data = response.json()
-            
-            for msg in data.get("messages", [])[:max_items]:
-                # Parse timestamp
-                created = msg.get("created_at")
-                published = None
-                if created:
-                    try:
-                        published = datetime.strptime(created, "%Y-%m-%dT%H:%M:%SZ")
-                    except Exception as e:
-                        logger.debug(f"Failed to parse StockTwits date: {e}")
-                
-                # Extract sentiment
-                entities = msg.get("entities", {})
-                sentiment_data = entities.get("sentiment")
-                sentiment = sentiment_data.get("basic") if sentiment_data else None
-                
-                messages.append(StockTwit(
-                    ticker=ticker,
-                    body=msg.get("body", ""),
-                    username=msg.get("user", {}).get("username", "anonymous"),
-                    sentiment=sentiment,
-                    url=f"https://stocktwits.com/{msg.get('user', {}).get('username', '')}/message/{msg.get('id', '')}",
-                    published=published,
-                    likes=msg.get("likes", {}).get("total", 0),
-                    is_rumor=True
-                ))
-            
-            logger.info(f"StockTwits: {len(messages)} messages for {ticker}")
+            return [self._to_twit(ticker, msg) for msg in data.get("messages", [])]
             
         except Exception as e:
             logger.warning(f"StockTwits fetch failed for {ticker}: {e}")
+            return None
+
+    @staticmethod
+    def _to_twit(ticker: str, msg: dict) -> StockTwit:
+        # Parse timestamp
+        created = msg.get("created_at")
+        published = None
+        if created:
+            try:
+                published = datetime.strptime(created, "%Y-%m-%dT%H:%M:%SZ")
+            except Exception as e:
+                logger.debug(f"Failed to parse StockTwits date: {e}")
         
-        return messages
+        # Extract sentiment
+        entities = msg.get("entities") or {}
+        sentiment_data = entities.get("sentiment")
+        sentiment = sentiment_data.get("basic") if sentiment_data else None
+        
+        return StockTwit(
+            ticker=ticker,
+            body=msg.get("body", ""),
+            username=msg.get("user", {}).get("username", "anonymous"),
+            sentiment=sentiment,
+            url=f"https://stocktwits.com/{msg.get('user', {}).get('username', '')}/message/{msg.get('id', '')}",
+            published=published,
+            likes=msg.get("likes", {}).get("total", 0),
+            is_rumor=True,
+            message_id=int(msg.get("id") or 0),
+        )
+
+
+class StockTwitsConsumer:
+    """
+    Incremental StockTwits consumption with persisted since-ID cursors.
+    
+    Each poll requests only messages newer than the symbol's cursor, feeds
+    them into the rolling sentiment aggregate and advances the cursor in
+    the news store, so restarts resume where the last poll stopped. The
+    aggregate itself lives in memory and refills from new messages.
+    """
+    
+    CURSOR_SOURCE = "stocktwits"
+    
+    def __init__(
+        self,
+        fetcher: Optional[StockTwitsFetcher] = None,
+        cursor_store: Optional[NewsStore] = None,
+        sentiment: Optional[RollingSentiment] = None,
+    ):
+        self.fetcher = fetcher or get_stocktwits_fetcher()
+        self._cursor_store = cursor_store
+        self.sentiment = sentiment or RollingSentiment()
+        self._cursors: Dict[str, int] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+    
+    @property
+    def cursor_store(self) -> NewsStore:
+        if self._cursor_store is None:
+            self._cursor_store = get_news_store()
+        return self._cursor_store
+    
+    def get_cursor(self, ticker: str) -> Optional[int]:
+        ticker = ticker.upper()
+        if ticker not in self._cursors:
+            stored = self.cursor_store.get_cursor(self.CURSOR_SOURCE, ticker)
+            if stored is None:
+                return None
+            self._cursors[ticker] = int(stored)
+        return self._cursors[ticker]
+    
+    async def poll(self, ticker: str) -> List[StockTwit]:
+        """Fetch messages posted since the last poll (oldest first) and count their sentiment."""
+        ticker = ticker.upper()
+        # One poll per symbol at a time, so overlapping callers never count a message twice
+        async with self._locks.setdefault(ticker, asyncio.Lock()):
+            since_id = self.get_cursor(ticker)
+            messages = await self.fetcher.fetch_since(ticker, since_id)
+            fresh = sorted(
+                (m for m in messages if since_id is None or m.message_id > since_id),
+                key=lambda m: m.message_id,
+            )
+            if not fresh:
+                return []
+            
+            for message in fresh:
+                self.sentiment.add(ticker, message.sentiment, message.published)
+            newest = fresh[-1].message_id
+            self._cursors[ticker] = newest
+            self.cursor_store.set_cursor(self.CURSOR_SOURCE, ticker, str(newest))
+        logger.info(f"StockTwits: {len(fresh)} new messages for {ticker} (cursor {newest})")
+        return fresh
 
 
 # Singleton
@@ -97,3 +194,12 @@ def get_stocktwits_fetcher() -> StockTwitsFetcher:
     if _stocktwits_fetcher is None:
         _stocktwits_fetcher = StockTwitsFetcher()
     return _stocktwits_fetcher
+
+
+_stocktwits_consumer: Optional[StockTwitsConsumer] = None
+
+def get_stocktwits_consumer() -> StockTwitsConsumer:
+    global _stocktwits_consumer
+    if _stocktwits_consumer is None:
+        _stocktwits_consumer = StockTwitsConsumer()
+    return _stocktwits_consumer
@@ -0,0 +1,200 @@
+"""Batched, de-duplicated access to the yfinance library.
+
+Every `yf.Ticker` call is blocking and used to run on the default executor,
+one symbol per job. `YFinanceGateway` instead:
+
+- builds every `yf.Ticker` on one shared HTTP session (yfinance would
+  otherwise open a new session per Ticker), so a watchlist refresh reuses
+  the warm connection and cookie/crumb instead of racing N handshakes;
+- collects requests arriving within `batch_window` seconds and submits
+  them together to its own bounded thread pool (`max_workers`). Yahoo has
+  no multi-symbol news/info endpoint, so each symbol is still one request;
+  they run in parallel up to the pool size and each caller is resolved as
+  soon as its symbol is read. The bound keeps yfinance from starving the
+  default executor and from fanning out into a 429 storm;
+- shares one in-flight future per (kind, symbol), so concurrent callers
+  asking for the same symbol trigger a single Yahoo request.
+
+Failures are per symbol: one bad ticker (even one yfinance refuses to
+construct, like "") fails only its own callers.
+"""
+
+import asyncio
+import functools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+import yfinance as yf
+from yfinance.data import new_session
+
+from ai_service.config import Settings
+
+logger = logging.getLogger(__name__)
+
+# Request kinds and how each one is read from a yf.Ticker
+NEWS = "news"
+INFO = "info"
+_READERS: dict[str, Callable[[yf.Ticker], object]] = {
+    NEWS: lambda t: t.news,
+    INFO: lambda t: t.info,
+}
+
+TickerFactory = Callable[[str], yf.Ticker]
+
+
+class YFinanceGateway:
+    """Groups and de-duplicates yfinance lookups on a bounded thread pool."""
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        batch_window: float = 0.05,
+        max_batch: int = 20,
+        ticker_factory: Optional[TickerFactory] = None,
+    ):
+        """
+        Args:
+            max_workers: Threads running yfinance lookups concurrently
+            batch_window: Seconds to wait for more symbols before a batch is sent
+            max_batch: Symbols per batch; a full batch is sent immediately
+            ticker_factory: Builds the yf.Ticker of a symbol (tests); defaults to the shared session
+        """
+        self.max_workers = max_workers
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self._ticker_factory = ticker_factory or self._session_ticker
+        self._session: Optional[object] = None
+        self._session_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._in_flight: dict[tuple[str, str], asyncio.Future[object]] = {}
+        self._pending: dict[str, list[str]] = {}
+        self._flush_handles: dict[str, asyncio.TimerHandle] = {}
+        self.requests = 0
+        self.coalesced = 0
+        self.batches = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="yfinance")
+        return self._executor
+
+    async def news(self, symbol: str) -> list[dict[str, object]]:
+        """Raw yfinance news items of a symbol ([] if Yahoo has none)."""
+        news = await self._request(NEWS, symbol)
+        return news if isinstance(news, list) else []
+
+    async def info(self, symbol: str) -> dict[str, object]:
+        """Raw yfinance info dict of a symbol ({} if Yahoo has none)."""
+        info = await self._request(INFO, symbol)
+        return info if isinstance(info, dict) else {}
+
+    async def _request(self, kind: str, symbol: str) -> object:
+        symbol = symbol.upper()
+        key = (kind, symbol)
+        self.requests += 1
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            return await asyncio.shield(future)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._in_flight[key] = future
+        future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+
+        pending = self._pending.setdefault(kind, [])
+        pending.append(symbol)
+        if len(pending) >= self.max_batch:
+            self._flush(kind)
+        elif kind not in self._flush_handles:
+            self._flush_handles[kind] = loop.call_later(self.batch_window, self._flush, kind)
+        # Shielded: a cancelled caller must not cancel the lookup others wait for
+        return await asyncio.shield(future)
+
+    def _session_ticker(self, symbol: str) -> yf.Ticker:
+        """Worker thread: a yf.Ticker on the gateway's shared session."""
+        with self._session_lock:
+            if self._session is None:
+                self._session = new_session()
+        return yf.Ticker(symbol, session=self._session)
+
+    def _lookup(self, kind: str, symbol: str) -> object:
+        """Worker thread: one symbol's news or info."""
+        return _READERS[kind](self._ticker_factory(symbol))
+
+    def _flush(self, kind: str) -> None:
+        handle = self._flush_handles.pop(kind, None)
+        if handle is not None:
+            handle.cancel()
+        symbols = self._pending.pop(kind, [])
+        if not symbols:
+            return
+        self.batches += 1
+        loop = asyncio.get_running_loop()
+        for symbol in symbols:
+            try:
+                lookup = loop.run_in_executor(self._get_executor(), self._lookup, kind, symbol)
+            except Exception as e:  # e.g. the executor is shutting down
+                self._fail(kind, symbol, e)
+                continue
+            lookup.add_done_callback(functools.partial(self._resolve, kind, symbol))
+
+    def _fail(self, kind: str, symbol: str, error: BaseException) -> None:
+        future = self._in_flight.get((kind, symbol))
+        if future is not None and not future.done():
+            future.set_exception(error)
+
+    def _resolve(self, kind: str, symbol: str, done: asyncio.Future[object]) -> None:
+        future = self._in_flight.get((kind, symbol))
+        if future is None or future.done():
+            return
+        if done.cancelled():
+            future.cancel()
+            return
+        error = done.exception()
+        if error is not None:
+            self._fail(kind, symbol, error)
+        else:
+            future.set_result(done.result())
+
+    def shutdown(self) -> None:
+        """Stop the worker threads (restarted on demand)."""
+        for handle in self._flush_handles.values():
+            handle.cancel()
+        self._flush_handles.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "max_workers": self.max_workers,
+            "requests": self.requests,
+            "coalesced": self.coalesced,
+            "batches": self.batches,
+            "in_flight": len(self._in_flight),
+        }
+
+
+_gateway: Optional[YFinanceGateway] = None
+
+
+def get_yfinance_gateway() -> YFinanceGateway:
+    """Get or create the process-wide yfinance gateway from Settings."""
+    global _gateway
+    if _gateway is None:
+        settings = Settings()
+        _gateway = YFinanceGateway(
+            max_workers=settings.yfinance_workers,
+            batch_window=settings.yfinance_batch_window_seconds,
+            max_batch=settings.yfinance_max_batch,
+        )
+    return _gateway
+
+
+def shutdown_yfinance_gateway() -> None:
+    """Stop the shared gateway's threads (called on app shutdown)."""
+    if _gateway is not None:
+        _gateway.shutdown()
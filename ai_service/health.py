@@ -137,3 +137,82 @@ async def check_provider(provider_name: str):
         return {"provider": provider_name, "status": "configured"}
     else:
         return {"provider": provider_name, "status": "not_configured"}
+
+
+class SourceHealth(BaseModel):
+    """Circuit breaker state and fetch statistics of one news source."""
+    state: str  # "closed", "open", "half_open"
+    consecutive_failures: int
+    requests: int
+    successes: int
+    failures: int
+    rejected: int
+    success_rate: Optional[float] = None
+    latency_p50_ms: Optional[float] = None
+    latency_p95_ms: Optional[float] = None
+    avg_items: Optional[float] = None
+    retry_in_seconds: Optional[float] = None
+
+
+class SourceHealthResponse(BaseModel):
+    """Per-source health of the news fetcher."""
+    sources: dict[str, SourceHealth]
+    open_circuits: list[str]
+
+
+@router.get("/sources", response_model=SourceHealthResponse)
+async def source_health():
+    """
+    Health of every news source the fetcher has contacted.
+    Sources with an open circuit are currently skipped without a request.
+    """
+    from ai_service.fetchers import get_fetcher
+    
+    # The DEV_MODE mock fetcher makes no requests and tracks no sources
+    registry = getattr(get_fetcher(), "source_health", None)
+    statuses = registry.get_status() if registry is not None else {}
+    
+    return SourceHealthResponse(
+        sources={name: SourceHealth(**status) for name, status in statuses.items()},
+        open_circuits=[name for name, status in statuses.items() if status["state"] == "open"],
+    )
+
+
+class BrowserPoolHealth(BaseModel):
+    """State of the shared headless browser used for article extraction."""
+    healthy: bool  # Chromium launched and connected (it is launched on first use)
+    contexts: int
+    contexts_idle: int
+    max_pages_per_context: int
+    pages_served: int
+    contexts_recycled: int
+    launches: int
+    blocked: Optional[int] = None  # Requests aborted by the resource blocker
+    allowed: Optional[int] = None
+
+
+class ArticleCacheHealth(BaseModel):
+    """Usage of the extracted-article body cache."""
+    entries: int
+    bytes: int  # Compressed size
+    max_bytes: int
+    codec: str
+    hits: int
+    misses: int
+    hit_rate: Optional[float] = None
+    expired: int
+    evicted: int
+
+
+@router.get("/article-cache", response_model=ArticleCacheHealth)
+async def article_cache_health():
+    """Hit/miss counters and size of the article body cache."""
+    from ai_service.article_cache import get_article_cache
+    return ArticleCacheHealth(**get_article_cache().get_stats())
+
+
+@router.get("/browser", response_model=BrowserPoolHealth)
+async def browser_health():
+    """Health of the browser pool; launches after the first extraction count crash recoveries."""
+    from ai_service.processors.browser_pool import get_browser_pool
+    return BrowserPoolHealth(**get_browser_pool().get_stats())
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import signal
 import sys
@@ -17,7 +18,10 @@ from ai_service.health import router as health_router
 from ai_service.models.transaction import Transaction
 from ai_service.models.article import ArticleCollection, AnalysisResult
 from ai_service.pipeline.base import PipelineContext, PipelineConfig
+from ai_service.article_cache import get_article_cache
 from ai_service.processors.browser_extractor import BrowserExtractor
+from ai_service.processors.browser_pool import close_browser_pool, get_browser_pool
+from ai_service.processors.tiered_extractor import get_tiered_extractor
 from ai_service.processors.ticker_resolver import TickerResolver
 from ai_service.analyzers.essay_generator import EssayGenerator
 
@@ -85,15 +89,47 @@ signal.signal(signal.SIGINT, handle_sigint)
 
 # --- LIFECYCLE: Database & Resource Management ---
 
+async def _prewarm_browser_pool() -> None:
+    try:
+        await get_browser_pool().start()
+    except Exception as e:
+        logger.warning(f"Browser pool prewarm failed (extraction will retry on demand): {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup: Initialize Database
     from ai_service.database import init_db
     logger.info("💽 Initializing persistence layer (SQLite)...")
     init_db()
+    # Background watchlist ingestion (only with INGEST_WATCHLIST and DEV_MODE off)
+    from ai_service.api.engine import cache_fetched_news
+    from ai_service.fetchers.scheduler import get_ingestion_scheduler
+    scheduler = get_ingestion_scheduler()
+    if scheduler is not None:
+        scheduler.sink = cache_fetched_news
+        scheduler.start()
+    # Launch the extraction browser in the background so the first essay does not pay for it
+    settings = Settings()
+    prewarm = None
+    if settings.browser_pool_prewarm and not settings.dev_mode:
+        prewarm = asyncio.create_task(_prewarm_browser_pool())
     yield
-    # Shutdown: (Optional cleanup)
+    # Shutdown: stop ingestion, release pooled HTTP connections, parser, PDF and yfinance workers
     logger.info("🛑 Shutting down AI Service...")
+    if scheduler is not None:
+        await scheduler.stop()
+    if prewarm is not None:
+        prewarm.cancel()
+    await close_browser_pool()
+    from ai_service.fetchers.http_client import close_http_client
+    from ai_service.fetchers.feed_parser import shutdown_feed_parser
+    from ai_service.fetchers.pdf_extractor import shutdown_pdf_extractor
+    from ai_service.fetchers.yfinance_gateway import shutdown_yfinance_gateway
+    await close_http_client()
+    shutdown_feed_parser()
+    shutdown_pdf_extractor()
+    shutdown_yfinance_gateway()
 
 app = FastAPI(title="Stock News AI Service", version="1.0.0", lifespan=lifespan)
 
@@ -270,7 +306,7 @@ async def get_sector_news(sector: str):
 async def analyze_essay(request: ArticleCollection, language: str = "German", use_browser: bool = True):
     """Generate an essay from the provided articles."""
     if use_browser:
-        browser = BrowserExtractor()
+        browser = BrowserExtractor(pool=get_browser_pool(), tiered=get_tiered_extractor(), cache=get_article_cache())
         request = await browser._process_async(request)
 
     context = PipelineContext(
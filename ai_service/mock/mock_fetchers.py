@@ -2,8 +2,8 @@
 
 import logging
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
-from dataclasses import dataclass
+from typing import AsyncIterator, List, Dict, Optional, Tuple
+from dataclasses import dataclass, field
 
 from ai_service.mock.mock_data import (
     MOCK_STOCKS,
@@ -27,6 +27,7 @@ class MockFetchedNews:
     url: Optional[str] = None
     published: Optional[datetime] = None
     summary: Optional[str] = None
+    syndicated_by: List[str] = field(default_factory=list)
 
 
 class MockNewsFetcher:
@@ -101,6 +102,15 @@ class MockNewsFetcher:
             news = await self.fetch_for_ticker(ticker, max_per_ticker)
             all_news.extend(news)
         return all_news
+    
+    async def stream_multiple_tickers(
+        self, tickers: List[str], max_per_ticker: int = 5
+    ) -> AsyncIterator[Tuple[str, List[MockFetchedNews]]]:
+        """Stream news per ticker (one batch per ticker, labelled like NewsFetcher)."""
+        for ticker in tickers:
+            news = await self.fetch_for_ticker(ticker, max_per_ticker)
+            if news:
+                yield f"{ticker} / Mock", news
 
 
 class MockHistoricAnalyzer:
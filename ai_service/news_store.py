@@ -0,0 +1,427 @@
+"""Persistent, indexed news store.
+
+SQLite (WAL mode) table of news items with an index on (ticker, published)
+and a unique key on (ticker, canonical URL), so re-fetched or re-submitted
+articles are stored once per ticker. Inserts are batched in a single
+transaction.
+
+Items fetched within the last `hot_hours` are also kept in an in-memory hot
+tier; fresh-news lookups inside that window never touch the database.
+Rows older than `retention_days` are pruned on write; the same prune expires
+the hot tier, so tickers nobody reads do not accumulate there.
+
+An FTS5 index (external content, kept in sync by triggers) covers title,
+summary and article content for BM25-ranked full-text search.
+
+Incremental sources (e.g. StockTwits since-IDs) persist their cursors in
+the same database via `get_cursor`/`set_cursor`.
+"""
+
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Iterable, NamedTuple, Optional, Protocol
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from ai_service.config import Settings
+
+logger = logging.getLogger(__name__)
+
+# Query parameters that only track the click, not the article
+_TRACKING_PREFIXES = ("utm_", "guce_")
+_TRACKING_PARAMS = frozenset({"guccounter", "ncid", "cmpid", "mod", "fbclid", "gclid"})
+
+# Run retention at most this often (seconds)
+PRUNE_INTERVAL_SECONDS = 3600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS news (
+    id INTEGER PRIMARY KEY,
+    ticker TEXT NOT NULL,
+    title TEXT NOT NULL,
+    source TEXT NOT NULL,
+    url TEXT,
+    canonical_url TEXT NOT NULL,
+    published TEXT,
+    summary TEXT,
+    fetched_at TEXT NOT NULL,
+    content TEXT,
+    UNIQUE (ticker, canonical_url)
+);
+CREATE INDEX IF NOT EXISTS idx_news_ticker_published ON news (ticker, published);
+CREATE INDEX IF NOT EXISTS idx_news_ticker_fetched ON news (ticker, fetched_at);
+CREATE INDEX IF NOT EXISTS idx_news_fetched ON news (fetched_at);
+CREATE INDEX IF NOT EXISTS idx_news_canonical_url ON news (canonical_url);
+CREATE TABLE IF NOT EXISTS source_cursors (
+    source TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (source, key)
+);
+"""
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE news_fts USING fts5(
+    title, summary, content,
+    content='news', content_rowid='id', tokenize='porter unicode61', prefix='3 4'
+);
+CREATE TRIGGER news_fts_insert AFTER INSERT ON news BEGIN
+    INSERT INTO news_fts (rowid, title, summary, content) VALUES (new.id, new.title, new.summary, new.content);
+END;
+CREATE TRIGGER news_fts_delete AFTER DELETE ON news BEGIN
+    INSERT INTO news_fts (news_fts, rowid, title, summary, content)
+    VALUES ('delete', old.id, old.title, old.summary, old.content);
+END;
+CREATE TRIGGER news_fts_update AFTER UPDATE OF title, summary, content ON news BEGIN
+    INSERT INTO news_fts (news_fts, rowid, title, summary, content)
+    VALUES ('delete', old.id, old.title, old.summary, old.content);
+    INSERT INTO news_fts (rowid, title, summary, content) VALUES (new.id, new.title, new.summary, new.content);
+END;
+INSERT INTO news_fts (news_fts) VALUES ('rebuild');
+"""
+
+# BM25 column weights: title, summary, content
+_BM25_WEIGHTS = (10.0, 4.0, 1.0)
+
+_QUERY_TOKEN = re.compile(r"\w+\*?")
+MIN_PREFIX_CHARS = 3
+
+_COLUMNS = "ticker, title, source, url, published, summary, fetched_at"
+
+
+class NewsLike(Protocol):
+    """Anything shaped like a news item (NewsItem, FetchedNews, ...)."""
+    ticker: str
+    title: str
+    source: str
+    url: Optional[str]
+    published: Optional[datetime]
+    summary: Optional[str]
+
+
+class SearchHit(NamedTuple):
+    """One full-text search result (lower score = better match)."""
+    ticker: str
+    title: str
+    source: str
+    url: Optional[str]
+    published: Optional[datetime]
+    snippet: str
+    score: float
+
+
+class StoredNews(NamedTuple):
+    """One stored news row."""
+    ticker: str
+    title: str
+    source: str
+    url: Optional[str]
+    published: Optional[datetime]
+    summary: Optional[str]
+    fetched_at: datetime
+
+
+def canonical_url(url: Optional[str], title: str) -> str:
+    """Normalise a URL for de-duplication (falls back to the title when missing)."""
+    if not url:
+        return f"title:{title.strip().lower()}"
+    parts = urlsplit(url.strip())
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in _TRACKING_PARAMS and not key.lower().startswith(_TRACKING_PREFIXES)
+    ]
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(sorted(query)), ""))
+
+
+def to_fts_query(text: str) -> str:
+    """Turn free text into a safe FTS5 query: every word must match, "word*" is a prefix.
+
+    Prefixes shorter than MIN_PREFIX_CHARS are matched as whole words; they
+    would expand to a large part of the vocabulary and defeat the index.
+    """
+    terms = []
+    for token in _QUERY_TOKEN.findall(text):
+        word = token.rstrip("*")
+        is_prefix = token.endswith("*") and len(word) >= MIN_PREFIX_CHARS
+        terms.append(f'"{word}"*' if is_prefix else f'"{word}"')
+    return " ".join(terms)
+
+
+def _to_text(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat(sep=" ", timespec="seconds") if value else None
+
+
+def _from_text(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _row(row: tuple) -> StoredNews:
+    ticker, title, source, url, published, summary, fetched_at = row
+    return StoredNews(ticker, title, source, url, _from_text(published), summary, _from_text(fetched_at) or datetime.min)
+
+
+class NewsStore:
+    """SQLite news store with an in-memory hot tier."""
+
+    def __init__(self, path: str, hot_hours: float = 24.0, retention_days: float = 30.0):
+        """
+        Args:
+            path: SQLite file path, or ":memory:" (tests)
+            hot_hours: Items fetched within this window are also served from memory
+            retention_days: Rows older than this (by fetched_at) are deleted
+        """
+        self.path = path
+        self.hot_hours = hot_hours
+        self.retention_days = retention_days
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._migrate()
+        self._hot: dict[str, deque[StoredNews]] = {}
+        self._last_prune = 0.0
+        self.prune()  # Also starts the hourly prune clock for add_many
+        self._load_hot_tier()
+
+    def _migrate(self) -> None:
+        """Add the content column and FTS index to stores created before them."""
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(news)")}
+        if "content" not in columns:
+            self._conn.execute("ALTER TABLE news ADD COLUMN content TEXT")
+        has_fts = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'news_fts'"
+        ).fetchone()
+        if not has_fts:
+            with self._conn:
+                self._conn.executescript(_FTS_SCHEMA)
+            logger.info("News store: built full-text index")
+
+    def _load_hot_tier(self) -> None:
+        cutoff = datetime.now() - timedelta(hours=self.hot_hours)
+        rows = self._conn.execute(
+            f"SELECT {_COLUMNS} FROM news WHERE fetched_at >= ? ORDER BY id", (_to_text(cutoff),)
+        ).fetchall()
+        for row in rows:
+            item = _row(row)
+            self._hot.setdefault(item.ticker, deque()).append(item)
+        if rows:
+            logger.info(f"News store: loaded {len(rows)} items into hot tier")
+
+    def add_many(self, items: Iterable[NewsLike], fetched_at: Optional[datetime] = None) -> int:
+        """Insert items in one transaction, skipping (ticker, URL) duplicates. Returns rows inserted."""
+        now = datetime.now()
+        inserted: list[StoredNews] = []
+        with self._lock, self._conn:
+            for item in items:
+                stored = StoredNews(
+                    ticker=item.ticker.upper(),
+                    title=item.title,
+                    source=item.source,
+                    url=item.url,
+                    published=item.published,
+                    summary=item.summary,
+                    fetched_at=getattr(item, "fetched_at", None) or fetched_at or now,
+                )
+                cursor = self._conn.execute(
+                    f"INSERT OR IGNORE INTO news ({_COLUMNS}, canonical_url) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        stored.ticker, stored.title, stored.source, stored.url,
+                        _to_text(stored.published), stored.summary, _to_text(stored.fetched_at),
+                        canonical_url(stored.url, stored.title),
+                    ),
+                )
+                if cursor.rowcount == 1:
+                    inserted.append(stored)
+            # Backfilled items (old caller-supplied fetched_at) stay out of the hot tier
+            hot_cutoff = now - timedelta(hours=self.hot_hours)
+            for stored in inserted:
+                if stored.fetched_at >= hot_cutoff:
+                    self._hot.setdefault(stored.ticker, deque()).append(stored)
+        if time.monotonic() - self._last_prune > PRUNE_INTERVAL_SECONDS:
+            self.prune()
+        return len(inserted)
+
+    def _hot_items(self, ticker: str, cutoff: datetime) -> list[StoredNews]:
+        hot = self._hot.get(ticker)
+        if not hot:
+            return []
+        self._expire_hot(hot, datetime.now() - timedelta(hours=self.hot_hours))
+        return [item for item in hot if item.fetched_at >= cutoff]
+
+    @staticmethod
+    def _expire_hot(hot: deque[StoredNews], hot_cutoff: datetime) -> None:
+        # Expire from the front; items are appended in fetch order
+        while hot and hot[0].fetched_at < hot_cutoff:
+            hot.popleft()
+
+    def fresh(self, ticker: Optional[str] = None, max_age_hours: float = 24.0) -> list[StoredNews]:
+        """Items fetched within max_age_hours, oldest first (hot tier when possible)."""
+        cutoff = datetime.now() - timedelta(hours=max_age_hours)
+        with self._lock:
+            if ticker and max_age_hours <= self.hot_hours:
+                return self._hot_items(ticker.upper(), cutoff)
+            if ticker:
+                rows = self._conn.execute(
+                    f"SELECT {_COLUMNS} FROM news WHERE ticker = ? AND fetched_at >= ? ORDER BY id",
+                    (ticker.upper(), _to_text(cutoff)),
+                ).fetchall()
+            else:
+                rows = self._conn.execute(
+                    f"SELECT {_COLUMNS} FROM news WHERE fetched_at >= ? ORDER BY id", (_to_text(cutoff),)
+                ).fetchall()
+        return [_row(row) for row in rows]
+
+    def latest(self, tickers: Optional[Iterable[str]] = None, limit: int = 50) -> list[StoredNews]:
+        """Most recently stored items (optionally for some tickers), oldest first."""
+        with self._lock:
+            if tickers is not None:
+                symbols = [t.upper() for t in tickers]
+                if not symbols:
+                    return []
+                placeholders = ", ".join("?" * len(symbols))
+                rows = self._conn.execute(
+                    f"SELECT {_COLUMNS} FROM news WHERE ticker IN ({placeholders}) ORDER BY id DESC LIMIT ?",
+                    (*symbols, limit),
+                ).fetchall()
+            else:
+                rows = self._conn.execute(
+                    f"SELECT {_COLUMNS} FROM news ORDER BY id DESC LIMIT ?", (limit,)
+                ).fetchall()
+        return [_row(row) for row in reversed(rows)]
+
+    def between(self, ticker: str, start: datetime, end: Optional[datetime] = None, limit: int = 200) -> list[StoredNews]:
+        """Items for a ticker published in [start, end), newest first (index seek)."""
+        end_text = _to_text(end) or "9999"
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM news WHERE ticker = ? AND published >= ? AND published < ? "
+                "ORDER BY published DESC LIMIT ?",
+                (ticker.upper(), _to_text(start), end_text, limit),
+            ).fetchall()
+        return [_row(row) for row in rows]
+
+    def set_content(self, url: str, content: str) -> int:
+        """Attach extracted article text to every row of a URL (indexed for search)."""
+        key = canonical_url(url, "")
+        with self._lock, self._conn:
+            return self._conn.execute("UPDATE news SET content = ? WHERE canonical_url = ?", (content, key)).rowcount
+
+    def search(
+        self,
+        query: str,
+        ticker: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: int = 20,
+    ) -> list[SearchHit]:
+        """BM25-ranked full-text search over title, summary and content."""
+        match = to_fts_query(query)
+        if not match:
+            return []
+        sql = [
+            "SELECT n.ticker, n.title, n.source, n.url, n.published,",
+            "snippet(news_fts, -1, '<b>', '</b>', '…', 16),",
+            f"bm25(news_fts, {', '.join(map(str, _BM25_WEIGHTS))}) AS score",
+            "FROM news_fts JOIN news n ON n.id = news_fts.rowid",
+            "WHERE news_fts MATCH ?",
+        ]
+        params: list[object] = [match]
+        if ticker:
+            sql.append("AND n.ticker = ?")
+            params.append(ticker.upper())
+        if since:
+            sql.append("AND n.published >= ?")
+            params.append(_to_text(since))
+        if until:
+            sql.append("AND n.published < ?")
+            params.append(_to_text(until))
+        sql.append("ORDER BY score LIMIT ?")
+        params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(" ".join(sql), params).fetchall()
+        return [
+            SearchHit(ticker, title, source, url, _from_text(published), snippet, round(score, 3))
+            for ticker, title, source, url, published, snippet, score in rows
+        ]
+
+    def get_cursor(self, source: str, key: str) -> Optional[str]:
+        """Last persisted cursor of an incremental source (e.g. a since-ID per symbol)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM source_cursors WHERE source = ? AND key = ?", (source, key)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_cursor(self, source: str, key: str, value: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO source_cursors (source, key, value, updated_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (source, key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at",
+                (source, key, value, _to_text(datetime.now())),
+            )
+
+    def count(self, ticker: Optional[str] = None) -> int:
+        with self._lock:
+            if ticker:
+                return self._conn.execute("SELECT COUNT(*) FROM news WHERE ticker = ?", (ticker.upper(),)).fetchone()[0]
+            return self._conn.execute("SELECT COUNT(*) FROM news").fetchone()[0]
+
+    def prune(self) -> int:
+        """Delete rows older than the retention window and expire the hot tier."""
+        now = datetime.now()
+        cutoff = now - timedelta(days=self.retention_days)
+        hot_cutoff = now - timedelta(hours=self.hot_hours)
+        with self._lock, self._conn:
+            deleted = self._conn.execute("DELETE FROM news WHERE fetched_at < ?", (_to_text(cutoff),)).rowcount
+            # Tickers nobody reads are only trimmed here
+            for ticker in list(self._hot):
+                self._expire_hot(self._hot[ticker], hot_cutoff)
+                if not self._hot[ticker]:
+                    del self._hot[ticker]
+        self._last_prune = time.monotonic()
+        if deleted:
+            logger.info(f"News store: pruned {deleted} items older than {self.retention_days} days")
+        return deleted
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM news")
+            self._hot.clear()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_store: Optional[NewsStore] = None
+
+
+def get_news_store() -> NewsStore:
+    """Get or create the process-wide news store from Settings."""
+    global _store
+    if _store is None:
+        settings = Settings()
+        path = settings.news_store_path
+        if not path:
+            from ai_service.database import DATA_DIR
+            path = os.path.join(DATA_DIR, "news_store.db")
+        _store = NewsStore(
+            path,
+            hot_hours=settings.news_store_hot_hours,
+            retention_days=settings.news_store_retention_days,
+        )
+    return _store
+
+
+def set_news_store(store: NewsStore) -> None:
+    """Replace the process-wide store (e.g. an in-memory store in tests)."""
+    global _store
+    _store = store
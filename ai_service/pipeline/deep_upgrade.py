@@ -0,0 +1,144 @@
+"""Concurrent upgrade of deep-web sources with fetched text and AI summaries.
+
+The orchestrator used to fetch and summarise deep items one at a time,
+which took minutes for 6-12 items. `DeepSourceUpgrader` runs the stage as:
+
+- fetches fanned out, at most `fetch_concurrency` at once;
+- long texts queued for summarisation while the budget (`summary_budget`
+  AI summaries per report) lasts, drained by as many workers as the
+  summariser's provider tolerates (see `summary_concurrency`); a
+  provider that is currently rate limited gets no jobs;
+- every other fetched text, and any failed summary, becomes a snippet; a
+  failed or skipped summary gives its budget slot back to later texts;
+- one deadline for the whole stage: afterwards pending work is cancelled
+  and items keep whatever they already have. Fetches and summaries already
+  running in threads cannot be interrupted; they finish in the background
+  (bounded by the fetcher's and client's own timeouts) and their results
+  are discarded.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Callable, Optional
+
+from ai_service.analyzers.base_client import BaseAIClient
+from ai_service.models.contracts import DeepWebSource
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_MIN_CHARS = 1000  # Shorter texts get a snippet instead of an AI summary
+SNIPPET_MIN_CHARS = 200
+SNIPPET_CHARS = 300
+SUMMARY_INPUT_CHARS = 10000
+
+# Parallel summaries per client type; Gemini's shared RPM limiter serialises calls anyway
+_PROVIDER_CONCURRENCY = {"GeminiClient": 1, "FallbackClient": 1, "OpenAIClient": 3, "MockAIClient": 3}
+
+
+def summary_concurrency(client: BaseAIClient) -> int:
+    """Summaries the client's provider can run in parallel (1 for unknown providers)."""
+    return _PROVIDER_CONCURRENCY.get(type(client).__name__, 1)
+
+
+def _is_rate_limited(client: BaseAIClient) -> bool:
+    limiter = getattr(type(client), "_rate_limiter", None)
+    return bool(limiter is not None and limiter.get_status().get("rate_limited"))
+
+
+class DeepSourceUpgrader:
+    """Fetches and summarises deep-web sources concurrently under one deadline."""
+
+    def __init__(
+        self,
+        fetch: Callable[[str], Optional[str]],
+        summarizer: BaseAIClient,
+        fetch_concurrency: int = 4,
+        summary_budget: int = 3,
+        deadline: float = 45.0,
+    ):
+        """
+        Args:
+            fetch: Blocking URL -> text fetch (e.g. ContentFetcher.fetch_url), run in threads
+            summarizer: Client whose analyze_text writes the AI summaries
+            fetch_concurrency: Fetches in flight at once
+            summary_budget: AI summaries per run
+            deadline: Seconds for the whole stage
+        """
+        self.fetch = fetch
+        self.summarizer = summarizer
+        self.fetch_concurrency = fetch_concurrency
+        self.summary_budget = summary_budget
+        self.deadline = deadline
+        self.summarized = 0
+        self.snippets = 0
+        self.timed_out = False
+
+    async def upgrade(self, items: list[DeepWebSource]) -> None:
+        """Replace item summaries in place with AI summaries or snippets of the fetched text."""
+        if not items:
+            return
+        started = time.monotonic()
+        fetch_slots = asyncio.Semaphore(self.fetch_concurrency)
+        queue: asyncio.Queue[tuple[DeepWebSource, str]] = asyncio.Queue()
+        reserved = 0
+
+        async def fetch(item: DeepWebSource) -> None:
+            nonlocal reserved
+            try:
+                async with fetch_slots:
+                    text = await asyncio.to_thread(self.fetch, item.get('url', ''))
+            except Exception as e:
+                logger.warning(f"Could not upgrade content for {item.get('url', '')}: {e}")
+                return
+            if not text:
+                return
+            if len(text) > SUMMARY_MIN_CHARS and reserved < self.summary_budget:
+                reserved += 1
+                queue.put_nowait((item, text))
+            elif len(text) > SNIPPET_MIN_CHARS:
+                self._snippet(item, text)
+
+        async def summarize() -> None:
+            nonlocal reserved
+            while True:
+                item, text = await queue.get()
+                try:
+                    if _is_rate_limited(self.summarizer):
+                        reserved -= 1
+                        self._snippet(item, text)
+                        continue
+                    summary = await asyncio.to_thread(
+                        self.summarizer.analyze_text, text[:SUMMARY_INPUT_CHARS], "summarize"
+                    )
+                    item['summary'] = f"[AI SUMMARY] {summary}"
+                    self.summarized += 1
+                except Exception as e:
+                    logger.warning(f"Could not summarize {item.get('url', '')}: {e}")
+                    reserved -= 1  # Only successful summaries use up the budget
+                    self._snippet(item, text)
+                finally:
+                    queue.task_done()
+
+        async def run_all() -> None:
+            await asyncio.gather(*(fetch(item) for item in items))
+            await queue.join()
+
+        workers = [asyncio.create_task(summarize()) for _ in range(summary_concurrency(self.summarizer))]
+        try:
+            await asyncio.wait_for(run_all(), timeout=self.deadline)
+        except asyncio.TimeoutError:
+            self.timed_out = True
+            logger.warning(f"Deep source upgrade hit its {self.deadline}s deadline, continuing with finished items")
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+        logger.info(
+            f"Deep source upgrade: {self.summarized} AI summaries, {self.snippets} snippets "
+            f"for {len(items)} items in {time.monotonic() - started:.1f}s"
+        )
+
+    def _snippet(self, item: DeepWebSource, text: str) -> None:
+        item['summary'] = text[:SNIPPET_CHARS] + "..."
+        self.snippets += 1
@@ -80,9 +80,16 @@ class WorkflowOrchestrator:
         news_items = []
         try:
             from ai_service.fetchers import get_fetcher
-            fetcher = get_fetcher()
-            news_items = await fetcher.fetch_for_ticker(ticker, max_items=50)
-            logger.info(f"Fetched {len(news_items)} news items for report")
+            from ai_service.fetchers.scheduler import get_ingestion_scheduler
+            scheduler = get_ingestion_scheduler()
+            warm_items = scheduler.get_warm_news(ticker, max_items=50) if scheduler else None
+            if warm_items is not None:
+                news_items = warm_items
+                logger.info(f"Using {len(news_items)} warm news items from ingestion scheduler")
+            else:
+                fetcher = get_fetcher()
+                news_items = await fetcher.fetch_for_ticker(ticker, max_items=50)
+                logger.info(f"Fetched {len(news_items)} news items for report")
             
             # Convert to structured data for AI
             for n in news_items:
@@ -104,25 +111,19 @@ class WorkflowOrchestrator:
             
             # In DEV_MODE, skip content fetching and summarization (data is pre-made)
             if not self._is_dev_mode:
+                from ai_service.article_cache import get_article_cache
                 from ai_service.fetchers.content_fetcher import ContentFetcher
-                content_fetcher = ContentFetcher(self.settings)
-                summarizer = ProviderFactory.get_cheap_client(self.settings)
-                
-                summarized_count = 0
-                for d in deep_items:
-                    try:
-                        full_text = await asyncio.to_thread(content_fetcher.fetch_url, d['url'])
-                        
-                        if full_text and len(full_text) > 1000 and summarized_count < 3:
-                            smart_summary = await asyncio.to_thread(
-                                summarizer.analyze_text, full_text[:10000], "summarize"
-                            )
-                            d['summary'] = f"[AI SUMMARY] {smart_summary}"
-                            summarized_count += 1
-                        elif full_text and len(full_text) > 200:
-                            d['summary'] = full_text[:300] + "..."
-                    except Exception as e:
-                        logger.warning(f"Could not upgrade content for {d.get('url','')}: {e}")
+                from ai_service.pipeline.deep_upgrade import DeepSourceUpgrader
+                content_fetcher = ContentFetcher(self.settings, cache=get_article_cache())
+                upgrader = DeepSourceUpgrader(
+                    fetch=content_fetcher.fetch_url,
+                    summarizer=ProviderFactory.get_cheap_client(self.settings),
+                    fetch_concurrency=self.settings.deep_fetch_concurrency,
+                    summary_budget=self.settings.deep_summary_budget,
+                    deadline=self.settings.deep_upgrade_deadline_seconds,
+                )
+                # Fetches run in parallel; summaries are budgeted and the stage has a deadline
+                await upgrader.upgrade(deep_items)
             
             # Add deep items to news articles
             for d in deep_items:
@@ -1,54 +1,123 @@
 import logging
 import asyncio
+from typing import Optional
 
-from playwright.async_api import async_playwright, BrowserContext
+from playwright.async_api import Page, async_playwright
 
 from ai_service.models.article import Article, ArticleCollection
 from ai_service.pipeline.base import PipelineStep, PipelineContext
+from ai_service.article_cache import ArticleCache
+from ai_service.processors.browser_pool import BrowserPool, BrowserUnavailableError
+from ai_service.processors.resource_blocker import blocker_from_settings
+from ai_service.processors.tiered_extractor import TieredExtractor
 
 logger = logging.getLogger(__name__)
 
+# Paragraphs inside a typical article container; extraction starts once one is attached
+ARTICLE_SELECTOR = "article p, main p, [itemprop='articleBody'] p, .article-body p, .caas-body p"
+CONTAINER_TIMEOUT_MS = 5000
+# Max wait for the rest of the document once the container has appeared
+CONTENT_GRACE_MS = 1500
+
+EXTRACT_PARAGRAPHS_JS = r"""() => {
+        // Remove nav, footer, ads to clean up
+        const selectorsToRemove = ['nav', 'footer', 'header', 'aside', '.ad', '.advertisement', '.social-share'];
+        selectorsToRemove.forEach(sel => {
+            document.querySelectorAll(sel).forEach(el => el.remove());
+        });
+        
+        // Get all paragraphs
+        const paragraphs = Array.from(document.querySelectorAll('p'));
+        return paragraphs
+            .map(p => p.innerText.trim())
+            .filter(t => t.length > 50) // Filter out short snippets
+            .join('\n\n');
+    }"""
+
+
 class BrowserExtractor(PipelineStep[ArticleCollection, ArticleCollection]):
-    """Extract full text from articles using a headless browser."""
-    
+    """Extract full text from articles using a headless browser.
+
+    Pages are borrowed from a shared BrowserPool (see get_browser_pool), so
+    extraction does not pay Chromium's startup. Without a pool, a private
+    one is launched for the call and closed afterwards.
+
+    With a TieredExtractor, each article is first fetched with a plain GET and
+    only goes to the browser when that text scores too low. With an
+    ArticleCache, previously extracted articles are not fetched again.
+    """
+
     name = "browser_extractor"
-    
-    def __init__(self, max_concurrent: int = 3, timeout_ms: int = 30000):
+
+    def __init__(
+        self,
+        max_concurrent: int = 3,
+        timeout_ms: int = 30000,
+        pool: Optional[BrowserPool] = None,
+        tiered: Optional[TieredExtractor] = None,
+        cache: Optional[ArticleCache] = None,
+    ):
         self.max_concurrent = max_concurrent
         self.timeout_ms = timeout_ms
+        self.pool = pool
+        self.tiered = tiered
+        self.cache = cache
 
-    async def _extract_text_from_url(self, url: str, context: BrowserContext | None) -> str:
-        if context is None:
-            logger.info("Browser context unavailable; skipping extraction for %s", url)
+    async def _extract_text_from_url(self, url: str, pool: BrowserPool | None) -> str:
+        if self.cache is not None:
+            cached = await asyncio.to_thread(self.cache.get, url)
+            if cached is not None:
+                return cached.text
+        if self.tiered is not None:
+            text = await self.tiered.extract(url, lambda u: self._extract_with_browser(u, pool))
+        else:
+            text = await self._extract_with_browser(url, pool)
+        if text and self.cache is not None:
+            await asyncio.to_thread(self.cache.put, url, text, "text/html")
+        return text
+
+    async def _extract_with_browser(self, url: str, pool: BrowserPool | None) -> str:
+        if pool is None:
+            logger.info("Browser unavailable; skipping extraction for %s", url)
             return ""
-        page = await context.new_page()
         try:
-            # Go to URL with timeout
-            await page.goto(url, timeout=self.timeout_ms, wait_until="domcontentloaded")
-            
-            # Simple heuristic to extract main text (could be improved with Readability.js)
-            # For now, we get all paragraph text that looks substantial
-            text = await page.evaluate(r"""() => {
-                // Remove nav, footer, ads to clean up
-                const selectorsToRemove = ['nav', 'footer', 'header', 'aside', '.ad', '.advertisement', '.social-share'];
-                selectorsToRemove.forEach(sel => {
-                    document.querySelectorAll(sel).forEach(el => el.remove());
-                });
-                
-                // Get all paragraphs
-                const paragraphs = Array.from(document.querySelectorAll('p'));
-                return paragraphs
-                    .map(p => p.innerText.trim())
-                    .filter(t => t.length > 50) // Filter out short snippets
-                    .join('\n\n');
-            }""")
-            
-            return text
+            async with pool.page() as page:
+                return await self._extract_page_text(page, url)
+        except BrowserUnavailableError as e:
+            logger.info(f"Browser unavailable; skipping extraction for {url}: {e}")
+            return ""
         except Exception as e:
             logger.warning(f"Failed to extract {url}: {e}")
             return ""
+
+    async def _extract_page_text(self, page: Page, url: str) -> str:
+        # Don't wait for the whole document: start as soon as the response arrives
+        await page.goto(url, timeout=self.timeout_ms, wait_until="commit")
+        # Race a known article container against the parsed document, whichever comes first
+        container = asyncio.create_task(
+            page.wait_for_selector(ARTICLE_SELECTOR, state="attached", timeout=min(CONTAINER_TIMEOUT_MS, self.timeout_ms))
+        )
+        parsed = asyncio.create_task(page.wait_for_load_state("domcontentloaded", timeout=self.timeout_ms))
+        try:
+            done, _ = await asyncio.wait({container, parsed}, return_when=asyncio.FIRST_COMPLETED)
+            if parsed in done:
+                parsed.result()
+            elif container.exception() is None:
+                # Article paragraphs are streaming in; give the rest of the HTML a short grace period
+                done, _ = await asyncio.wait({parsed}, timeout=CONTENT_GRACE_MS / 1000)
+                if not done:
+                    logger.debug(f"Evaluating {url} before domcontentloaded")
+            else:
+                # No known article container: fall back to the parsed document
+                await parsed
         finally:
-            await page.close()
+            for task in (container, parsed):
+                task.cancel()
+            await asyncio.gather(container, parsed, return_exceptions=True)
+        
+        # Simple heuristic to extract main text (could be improved with Readability.js)
+        # For now, we get all paragraph text that looks substantial
+        return await page.evaluate(EXTRACT_PARAGRAPHS_JS)
 
     async def _process_async(self, input_data: ArticleCollection) -> ArticleCollection:
         tasks: list[asyncio.Task[None]] = []
@@ -56,37 +125,40 @@ class BrowserExtractor(PipelineStep[ArticleCollection, ArticleCollection]):
         # For now, process all defined in collection, but respect concurrency
         semaphore = asyncio.Semaphore(self.max_concurrent)
 
-        async def sem_task(article: Article, context: BrowserContext | None):
+        async def sem_task(article: Article, pool: BrowserPool | None):
             async with semaphore:
                 if not article.content or len(article.content) < 200:  # Only if content is missing or short
                     logger.info(f"Scraping {article.link}...")
-                    text = await self._extract_text_from_url(article.link, context)
+                    text = await self._extract_text_from_url(article.link, pool)
                     if text:
                         article.content = text
                     else:
                         logger.info(f"No text extracted for {article.link}")
 
-        async def run_tasks(context: BrowserContext | None):
+        async def run_tasks(pool: BrowserPool | None):
             tasks.clear()
             for article in input_data.articles:
-                tasks.append(asyncio.create_task(sem_task(article, context)))
+                tasks.append(asyncio.create_task(sem_task(article, pool)))
             await asyncio.gather(*tasks)
 
-        browser = None
+        # Shared pool if given, otherwise a one-off browser for this call
+        pool = self.pool or BrowserPool(
+            contexts=self.max_concurrent, blocker=blocker_from_settings(), playwright_factory=async_playwright
+        )
+        if self.tiered is None:
+            try:
+                await pool.start()
+            except BrowserUnavailableError as e:
+                logger.warning("Browser launch failed, falling back to no-op extraction: %s", e)
+                await run_tasks(None)
+                return input_data
+        # Tiered: Chromium is only launched if some article needs it
+
         try:
-            async with async_playwright() as p:
-                # Launch browser (headless by default)
-                browser = await p.chromium.launch()
-                context = await browser.new_context(
-                    user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-                )
-                await run_tasks(context)
-        except Exception as e:
-            logger.warning("Browser launch failed, falling back to no-op extraction: %s", e)
-            await run_tasks(None)
+            await run_tasks(pool)
         finally:
-            if browser is not None:
-                await browser.close()
+            if pool is not self.pool:
+                await pool.close()
 
         return input_data
 
@@ -0,0 +1,222 @@
+"""Long-lived headless Chromium shared by all browser extractions.
+
+Launching Chromium costs 1-3 s, more than most page loads. `BrowserPool`
+launches it once and lends pages from a fixed set of browser contexts:
+
+- `contexts` contexts are handed out one page at a time, which bounds
+  concurrent pages and keeps cookies/storage of parallel loads apart;
+- a context is closed and recreated after `max_pages_per_context` pages,
+  so leaked memory and accumulated cookies do not pile up;
+- every context routes its requests through the optional `ResourceBlocker`
+  (images, fonts, ad/tracker domains are aborted);
+- before lending, the browser is health-checked (`is_connected`); a
+  crashed or disconnected browser is relaunched and every context is
+  rebuilt on its next use. A page that cannot be opened gets its context
+  recreated (relaunching Chromium if it died) and is retried once.
+
+The app-wide pool is started lazily (or prewarmed on startup) and closed
+in the app lifespan.
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable, Optional
+
+from playwright.async_api import Browser, BrowserContext, Page, Playwright, PlaywrightContextManager, async_playwright
+
+from ai_service.config import Settings
+from ai_service.processors.resource_blocker import ResourceBlocker, blocker_from_settings
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+
+class BrowserUnavailableError(RuntimeError):
+    """Chromium could not be launched."""
+
+
+@dataclass
+class _ContextSlot:
+    context: Optional[BrowserContext] = None
+    generation: int = -1  # Browser generation the context belongs to
+    pages_served: int = 0
+
+
+class BrowserPool:
+    """Shared Chromium with a fixed number of recycled browser contexts."""
+
+    def __init__(
+        self,
+        contexts: int = 3,
+        max_pages_per_context: int = 50,
+        user_agent: str = USER_AGENT,
+        blocker: Optional[ResourceBlocker] = None,
+        playwright_factory: Callable[[], PlaywrightContextManager] = async_playwright,
+    ):
+        """
+        Args:
+            contexts: Browser contexts, i.e. max pages open at once
+            max_pages_per_context: Pages served before a context is recreated
+            user_agent: User agent of every context
+            blocker: Request filter installed on every context (None = load everything)
+            playwright_factory: Returns the async_playwright() context manager (tests)
+        """
+        self.contexts = contexts
+        self.max_pages_per_context = max_pages_per_context
+        self.user_agent = user_agent
+        self.blocker = blocker
+        self._playwright_factory = playwright_factory
+        self._playwright_cm: Optional[PlaywrightContextManager] = None
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._generation = 0
+        self._lock = asyncio.Lock()
+        self._slots: Optional[asyncio.Queue[_ContextSlot]] = None
+        self.launches = 0
+        self.pages_served = 0
+        self.contexts_recycled = 0
+
+    def _get_slots(self) -> "asyncio.Queue[_ContextSlot]":
+        if self._slots is None:
+            self._slots = asyncio.Queue()
+            for _ in range(self.contexts):
+                self._slots.put_nowait(_ContextSlot())
+        return self._slots
+
+    def is_healthy(self) -> bool:
+        """Whether the browser is launched and still connected."""
+        return self._browser is not None and self._browser.is_connected()
+
+    async def start(self) -> None:
+        """Launch Chromium if it is not running (or crashed)."""
+        async with self._lock:
+            if self.is_healthy():
+                return
+            await self._shutdown_browser()
+            try:
+                self._playwright_cm = self._playwright_factory()
+                self._playwright = await self._playwright_cm.__aenter__()
+                self._browser = await self._playwright.chromium.launch()
+            except Exception as e:
+                await self._shutdown_browser()
+                raise BrowserUnavailableError(f"Chromium launch failed: {e}") from e
+            self._generation += 1
+            self.launches += 1
+            logger.info(f"Browser pool: Chromium launched ({self.contexts} contexts, launch #{self.launches})")
+
+    async def _shutdown_browser(self) -> None:
+        browser, self._browser = self._browser, None
+        playwright_cm, self._playwright_cm = self._playwright_cm, None
+        self._playwright = None
+        try:
+            if browser is not None:
+                await browser.close()
+        except Exception as e:
+            logger.debug(f"Browser pool: closing browser failed: {e}")
+        try:
+            if playwright_cm is not None:
+                await playwright_cm.__aexit__(None, None, None)
+        except Exception as e:
+            logger.debug(f"Browser pool: stopping Playwright failed: {e}")
+
+    async def _context_for(self, slot: _ContextSlot) -> BrowserContext:
+        if not self.is_healthy():
+            if self._browser is not None:
+                logger.warning("Browser pool: Chromium disconnected, relaunching")
+            await self.start()
+        browser = self._browser
+        if browser is None:  # Shut down while we were relaunching
+            raise BrowserUnavailableError("Browser pool is shut down")
+        if slot.context is None or slot.generation != self._generation:
+            slot.context = await browser.new_context(user_agent=self.user_agent)
+            if self.blocker is not None:
+                await slot.context.route("**/*", self.blocker.handle)
+            slot.generation = self._generation
+            slot.pages_served = 0
+        return slot.context
+
+    async def _recycle(self, slot: _ContextSlot) -> None:
+        context, slot.context = slot.context, None
+        self.contexts_recycled += 1
+        try:
+            if context is not None:
+                await context.close()
+        except Exception as e:
+            logger.debug(f"Browser pool: closing context failed: {e}")
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Page]:
+        """Borrow a fresh page; waits while all contexts are in use.
+
+        Raises BrowserUnavailableError if Chromium cannot be (re)launched.
+        """
+        slots = self._get_slots()
+        slot = await slots.get()
+        try:
+            try:
+                page = await (await self._context_for(slot)).new_page()
+            except BrowserUnavailableError:
+                raise
+            except Exception as e:
+                # Broken context or crashed browser: rebuild (relaunching if needed) and retry once
+                logger.warning(f"Browser pool: opening page failed ({e}), recreating context")
+                await self._recycle(slot)
+                page = await (await self._context_for(slot)).new_page()
+            try:
+                yield page
+            finally:
+                slot.pages_served += 1
+                self.pages_served += 1
+                try:
+                    await page.close()
+                except Exception as e:
+                    logger.debug(f"Browser pool: closing page failed: {e}")
+                if slot.pages_served >= self.max_pages_per_context:
+                    await self._recycle(slot)
+        finally:
+            slots.put_nowait(slot)
+
+    async def close(self) -> None:
+        """Close the browser with all its contexts (relaunched on next use)."""
+        async with self._lock:
+            await self._shutdown_browser()
+
+    def get_stats(self) -> dict[str, object]:
+        return {
+            "healthy": self.is_healthy(),
+            "contexts": self.contexts,
+            "contexts_idle": self._slots.qsize() if self._slots is not None else self.contexts,
+            "max_pages_per_context": self.max_pages_per_context,
+            "pages_served": self.pages_served,
+            "contexts_recycled": self.contexts_recycled,
+            "launches": self.launches,
+            **(self.blocker.get_stats() if self.blocker is not None else {}),
+        }
+
+
+_pool: Optional[BrowserPool] = None
+
+
+def get_browser_pool() -> BrowserPool:
+    """Get or create the app-wide browser pool from Settings."""
+    global _pool
+    if _pool is None:
+        settings = Settings()
+        _pool = BrowserPool(
+            contexts=settings.browser_pool_contexts,
+            max_pages_per_context=settings.browser_pool_max_pages_per_context,
+            blocker=blocker_from_settings(settings),
+        )
+    return _pool
+
+
+async def close_browser_pool() -> None:
+    """Close the app-wide pool's browser (called on app shutdown)."""
+    if _pool is not None:
+        await _pool.close()
@@ -0,0 +1,66 @@
+"""Lightweight HTML-to-text cleaning for feed titles and summaries.
+
+Replaces building a BeautifulSoup tree per feed entry just to call
+`get_text()`. Tags, comments, declarations and the contents of
+script/style/template elements are dropped, CDATA content is kept and
+entities are decoded, matching `BeautifulSoup(text, "html.parser").get_text()`
+for well-formed feed markup.
+
+Strings without `<` or `&` (most titles) are returned unchanged without
+touching the regex engine.
+
+Known differences on malformed input: a bare `&` plus letters at the very
+end of the text ("Tesla boosts R&D") and unknown entities ("&foo;") are
+kept as written where html.parser mangles them, and entities without a
+semicolon follow `html.unescape` rules.
+"""
+
+import html
+import re
+from typing import Iterable, Optional
+
+# Elements whose text content is not part of get_text()
+_HIDDEN_ELEMENTS = re.compile(
+    r"<(script|style|template)\b(?:[^>\"']|\"[^\"]*\"|'[^']*')*>.*?</\1\s*>",
+    re.IGNORECASE | re.DOTALL,
+)
+_CDATA = re.compile(r"<!\[CDATA\[(.*?)\]\]>", re.DOTALL)
+_MARKUP = re.compile(
+    r"<!--.*?-->"  # Comments
+    r"|</?[A-Za-z][^\s/>]*(?:[^>\"']|\"[^\"]*\"|'[^']*')*>"  # Tags, quoted attributes may hold ">"
+    r"|<[!?][^>]*>",  # Doctype, processing instructions
+    re.DOTALL,
+)
+
+
+def _strip_markup(text: str) -> str:
+    if "<" in text:
+        if "<!" in text:
+            text = _CDATA.sub(lambda m: m.group(1).replace("&", "&amp;").replace("<", "&lt;"), text)
+        text = _HIDDEN_ELEMENTS.sub("", text)
+        text = _MARKUP.sub("", text)
+    return text
+
+
+def html_to_text(text: Optional[str]) -> str:
+    """Strip tags and decode entities from an HTML fragment.
+
+    Args:
+        text: HTML fragment (e.g. an RSS title or summary), may be None
+
+    Returns:
+        Plain text, "" for None/empty input
+    """
+    if not text:
+        return ""
+    if "<" not in text and "&" not in text:
+        return text
+    text = _strip_markup(text)
+    if "&" in text:
+        text = html.unescape(text)
+    return text
+
+
+def html_to_text_batch(texts: Iterable[Optional[str]]) -> list[str]:
+    """Clean every fragment of a feed in one call (same result as html_to_text per item)."""
+    return [html_to_text(text) for text in texts]
@@ -0,0 +1,228 @@
+"""Readability-style main-content extraction with lxml.
+
+Whole-page `get_text()` returns navigation, share bars, related-story
+lists and footers along with the article, and every one of those lines
+costs prompt tokens. `extract_main_content` keeps only the article body:
+
+1. Boilerplate elements (script, nav, header, footer, aside, forms, ...)
+   are removed.
+2. Every paragraph-like element with enough text scores its parent (full)
+   and grandparent (half): 1 + commas + one point per 100 characters
+   (max 3). Class/id names like "article" or "story" add to a container's
+   score, boilerplate-like names subtract. Scores are scaled by
+   (1 - link density), so link lists lose.
+3. The best container plus siblings scoring at least a fifth of it form
+   the article. Only then are elements whose class/id looks like
+   boilerplate ("share", "related", "newsletter", "cookie", ...) removed,
+   except those wrapping the article (a "page has-sidebar" layout div).
+   The article's paragraphs, headings, list items and quotes are returned
+   in document order.
+
+Pages without a scoring container fall back to every substantial <p>,
+whatever their wrappers are named.
+lxml builds the tree in C; `extract_main_content_from_tree` also accepts
+a tree built incrementally (ContentFetcher feeds a pull parser while the
+body downloads).
+"""
+
+import re
+from typing import NamedTuple, Optional, Union
+
+from lxml import etree
+
+MIN_PARAGRAPH_CHARS = 25
+
+_BOILERPLATE_TAGS = (
+    "script", "style", "noscript", "template", "nav", "header", "footer", "aside",
+    "form", "iframe", "svg", "button", "select", "dialog",
+)
+_NEGATIVE = re.compile(
+    r"comment|share|social|related|recommend|promo|newsletter|subscribe|sidebar|footer|masthead|"
+    r"menu|navbar|cookie|consent|banner|breadcrumb|popup|modal|sponsor|advert|\bads?\b|"
+    r"outbrain|taboola|widget|trending|most-popular|disclaimer",
+    re.IGNORECASE,
+)
+_POSITIVE = re.compile(r"article|body|content|entry|main|post|story|text|caas", re.IGNORECASE)
+_KEEP_CONTAINERS = frozenset({"html", "body", "article", "main"})
+
+_SCORED_TAGS = ("p", "pre", "blockquote", "td")
+_TAG_BONUS = {"article": 10, "main": 5, "div": 5, "section": 3, "td": 3, "blockquote": 3, "pre": 3}
+CLASS_WEIGHT = 25
+
+_OUTPUT_TAGS = frozenset({"p", "h1", "h2", "h3", "h4", "li", "blockquote", "pre"})
+_HEADINGS = frozenset({"h1", "h2", "h3", "h4"})
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+class MainContent(NamedTuple):
+    paragraphs: list[str]
+    visible_chars: int  # Text length of the page after boilerplate removal
+
+    @property
+    def text(self) -> str:
+        return "\n".join(self.paragraphs)
+
+
+def _text(element: etree._Element) -> str:
+    return _WHITESPACE.sub(" ", "".join(element.itertext())).strip()
+
+
+def _names(element: etree._Element) -> str:
+    return f"{element.get('class', '')} {element.get('id', '')}"
+
+
+def _class_weight(element: etree._Element) -> int:
+    names = _names(element)
+    weight = 0
+    if _NEGATIVE.search(names):
+        weight -= CLASS_WEIGHT
+    if _POSITIVE.search(names):
+        weight += CLASS_WEIGHT
+    return weight
+
+
+def _link_density(element: etree._Element, text_length: int) -> float:
+    if not text_length:
+        return 0.0
+    link_chars = sum(len(_text(link)) for link in element.iter("a"))
+    return min(link_chars / text_length, 1.0)
+
+
+def _drop(element: etree._Element) -> None:
+    """Remove an element, keeping the text that follows it."""
+    parent = element.getparent()
+    if parent is None:
+        return
+    if element.tail:
+        previous = element.getprevious()
+        if previous is not None:
+            previous.tail = (previous.tail or "") + element.tail
+        else:
+            parent.text = (parent.text or "") + element.tail
+    parent.remove(element)
+
+
+def _is_boilerplate_named(element: etree._Element) -> bool:
+    if element.tag in _KEEP_CONTAINERS:
+        return False
+    names = _names(element)
+    return bool(_NEGATIVE.search(names)) and not _POSITIVE.search(names)
+
+
+def _remove_boilerplate_tags(root: etree._Element) -> None:
+    doomed = [element for element in root.iter(*_BOILERPLATE_TAGS)]
+    doomed.extend(element for element in root.iter() if not isinstance(element.tag, str))  # Comments, PIs
+    for element in doomed:
+        _drop(element)
+
+
+def _remove_boilerplate_named(root: etree._Element, keep: list[etree._Element]) -> None:
+    """Drop boilerplate-named elements, except the kept elements and their ancestors."""
+    protected: set[etree._Element] = set()
+    for element in keep:
+        protected.add(element)
+        protected.update(element.iterancestors())
+    doomed = [
+        element for element in root.iter()
+        if element not in protected and _is_boilerplate_named(element)
+    ]
+    for element in doomed:
+        _drop(element)
+
+
+def _best_containers(root: etree._Element) -> list[etree._Element]:
+    scores: dict[etree._Element, float] = {}
+    for paragraph in root.iter(*_SCORED_TAGS):
+        length = len(_text(paragraph))
+        if length < MIN_PARAGRAPH_CHARS:
+            continue
+        score = 1 + "".join(paragraph.itertext()).count(",") + min(length // 100, 3)
+        parent = paragraph.getparent()
+        grandparent = parent.getparent() if parent is not None else None
+        for node, share in ((parent, 1.0), (grandparent, 0.5)):
+            if node is None:
+                continue
+            if node not in scores:
+                scores[node] = _class_weight(node) + _TAG_BONUS.get(node.tag, 0)
+            scores[node] += score * share
+    if not scores:
+        return []
+
+    for node in scores:
+        scores[node] *= 1 - _link_density(node, len(_text(node)))
+    top = max(scores, key=scores.__getitem__)
+    if scores[top] <= 0:
+        return []
+    parent = top.getparent()
+    if parent is None:
+        return [top]
+    threshold = max(10.0, scores[top] * 0.2)
+    return [node for node in parent if node is top or scores.get(node, 0.0) >= threshold]
+
+
+def _inside_output(element: etree._Element, container: etree._Element) -> bool:
+    """Whether an output element is nested in another (a <p> inside an <li>) below the container."""
+    for ancestor in element.iterancestors():
+        if ancestor is container:
+            return False
+        if ancestor.tag in _OUTPUT_TAGS:
+            return True
+    return False
+
+
+def _paragraphs(container: etree._Element) -> list[str]:
+    if container.tag in _OUTPUT_TAGS:
+        text = _text(container)
+        return [text] if len(text) >= MIN_PARAGRAPH_CHARS else []
+    paragraphs = []
+    for element in container.iter(*_OUTPUT_TAGS):
+        if _inside_output(element, container):
+            continue
+        text = _text(element)
+        if element.tag in _HEADINGS:
+            if len(text) >= 3:
+                paragraphs.append(text)
+        elif len(text) >= MIN_PARAGRAPH_CHARS and _link_density(element, len(text)) < 0.5:
+            paragraphs.append(text)
+    return paragraphs
+
+
+def extract_main_content_from_tree(root: Optional[etree._Element]) -> MainContent:
+    """Main content of a parsed (lxml) HTML tree; the tree is modified."""
+    if root is None:
+        return MainContent([], 0)
+    _remove_boilerplate_tags(root)
+
+    containers = _best_containers(root)
+    # Without a container, every substantial <p> is the article
+    fallback = [] if containers else [p for p in root.iter("p") if len(_text(p)) > 50]
+    _remove_boilerplate_named(root, containers or fallback)
+    body = root.find("body")
+    visible_chars = len(_text(body if body is not None else root))
+
+    paragraphs: list[str] = []
+    for container in containers:
+        paragraphs.extend(_paragraphs(container))
+    if not paragraphs:
+        paragraphs = [_text(p) for p in fallback] or [
+            text for text in (_text(p) for p in root.iter("p")) if len(text) > 50
+        ]
+    return MainContent(paragraphs, visible_chars)
+
+
+def extract_main_content(html: Union[str, bytes]) -> MainContent:
+    """Main article paragraphs of an HTML page."""
+    if not html or not html.strip():
+        return MainContent([], 0)
+    if isinstance(html, str):
+        # lxml rejects str input carrying an encoding declaration
+        html = html.encode("utf-8")
+        parser = etree.HTMLParser(encoding="utf-8")
+    else:
+        parser = etree.HTMLParser()
+    try:
+        root = etree.fromstring(html, parser)
+    except (etree.ParserError, ValueError):
+        return MainContent([], 0)
+    return extract_main_content_from_tree(root)
@@ -0,0 +1,112 @@
+"""Rolling per-ticker bullish/bearish message counts.
+
+Each window (1h, 24h) keeps a deque of one-minute buckets plus running
+totals: adding a message increments the newest bucket and the totals,
+and expiry pops whole buckets from the front. Both are O(1) amortised per
+message, and a snapshot reads only the totals.
+
+Messages are expected in roughly chronological order (the StockTwits
+consumer feeds each poll oldest-first). A message older than the newest
+bucket but still inside the window is counted in the newest bucket.
+"""
+
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Callable, NamedTuple, Optional
+
+BUCKET_SECONDS = 60
+WINDOWS = {"1h": 3600, "24h": 86400}
+
+BULLISH = "Bullish"
+BEARISH = "Bearish"
+_KINDS = (BULLISH, BEARISH, None)
+
+
+class SentimentCounts(NamedTuple):
+    bullish: int
+    bearish: int
+    unlabeled: int
+
+    @property
+    def total(self) -> int:
+        return self.bullish + self.bearish + self.unlabeled
+
+    @property
+    def bullish_ratio(self) -> Optional[float]:
+        """Share of bullish among labelled messages (None without labels)."""
+        labelled = self.bullish + self.bearish
+        return round(self.bullish / labelled, 3) if labelled else None
+
+
+class _Window:
+    """Bucketed counts over the last `seconds` seconds."""
+
+    def __init__(self, seconds: int):
+        self.span = seconds // BUCKET_SECONDS
+        self.buckets: deque[list[int]] = deque()  # [bucket, bullish, bearish, unlabeled]
+        self.totals = [0, 0, 0]
+
+    def add(self, bucket: int, kind: int) -> None:
+        if self.buckets and self.buckets[-1][0] >= bucket:
+            self.buckets[-1][kind + 1] += 1
+        else:
+            entry = [bucket, 0, 0, 0]
+            entry[kind + 1] = 1
+            self.buckets.append(entry)
+        self.totals[kind] += 1
+
+    def expire(self, now_bucket: int) -> None:
+        oldest = now_bucket - self.span
+        while self.buckets and self.buckets[0][0] <= oldest:
+            _, *counts = self.buckets.popleft()
+            for kind, count in enumerate(counts):
+                self.totals[kind] -= count
+
+
+class RollingSentiment:
+    """Per-ticker message sentiment counts over the WINDOWS."""
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        """
+        Args:
+            clock: Current epoch seconds (tests)
+        """
+        self._clock = clock
+        self._tickers: dict[str, dict[str, _Window]] = {}
+        self.last_update: dict[str, float] = {}
+
+    def add(self, ticker: str, sentiment: Optional[str], published: Optional[datetime] = None) -> None:
+        """Count one message (published is naive UTC or aware; None = now)."""
+        ticker = ticker.upper()
+        now = self._clock()
+        at = now if published is None else _timestamp(published)
+        if at <= now - max(WINDOWS.values()):
+            return
+        bucket = int(at // BUCKET_SECONDS)
+        kind = _KINDS.index(sentiment) if sentiment in _KINDS else 2
+        windows = self._tickers.setdefault(ticker, {name: _Window(seconds) for name, seconds in WINDOWS.items()})
+        now_bucket = int(now // BUCKET_SECONDS)
+        for name, window in windows.items():
+            if at > now - WINDOWS[name]:
+                window.add(bucket, kind)
+            window.expire(now_bucket)
+        self.last_update[ticker] = now
+
+    def get(self, ticker: str) -> dict[str, SentimentCounts]:
+        """Counts per window name ("1h", "24h"); zeros for unknown tickers."""
+        windows = self._tickers.get(ticker.upper())
+        if windows is None:
+            return {name: SentimentCounts(0, 0, 0) for name in WINDOWS}
+        now_bucket = int(self._clock() // BUCKET_SECONDS)
+        counts = {}
+        for name, window in windows.items():
+            window.expire(now_bucket)
+            counts[name] = SentimentCounts(*window.totals)
+        return counts
+
+
+def _timestamp(published: datetime) -> float:
+    if published.tzinfo is None:
+        published = published.replace(tzinfo=timezone.utc)
+    return published.timestamp()
@@ -0,0 +1,160 @@
+"""Multi-pattern ticker/company matcher for routing general-feed news.
+
+An Aho-Corasick automaton over all ticker symbols and company aliases
+tags a text with every ticker it mentions in a single linear scan,
+independent of how many tickers are on the watchlist.
+
+Matches must sit on word boundaries. Ticker symbols (and aliases of at
+most two letters such as "vw") are matched case-sensitively in their
+upper-case form, so "V" or "MA" only hit standalone capitalised symbols
+and never the article "a" or the German "ma". Longer aliases
+("mastercard", "deutsche bank") match case-insensitively.
+"""
+
+import logging
+from collections import deque
+from functools import lru_cache
+from typing import Iterable, Mapping, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+# Aliases up to this length are treated like symbols (exact upper-case match)
+SHORT_ALIAS_MAX_LEN = 2
+
+
+class _Pattern(NamedTuple):
+    ticker: str
+    length: int
+    exact: Optional[str]  # Required original-case spelling, None = case-insensitive
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def _fold(text: str) -> str:
+    """Lower-case text while keeping indices aligned with the original."""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    # Rare characters (e.g. "İ") lower-case to several code points
+    return "".join(c if len(c.lower()) != 1 else c.lower() for c in text)
+
+
+class TickerMatcher:
+    """Aho-Corasick automaton mapping symbol/alias mentions to tickers."""
+
+    def __init__(self, aliases: Mapping[str, Iterable[str]]):
+        """
+        Args:
+            aliases: Ticker -> extra names (company names, brands). The ticker
+                symbol itself is always added as a case-sensitive pattern.
+        """
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[_Pattern]] = [[]]
+
+        for ticker, names in aliases.items():
+            symbol = ticker.upper()
+            self._add(symbol.lower(), _Pattern(ticker, len(symbol), symbol))
+            for name in names:
+                name = name.strip().lower()
+                if not name:
+                    continue
+                exact = name.upper() if len(name) <= SHORT_ALIAS_MAX_LEN else None
+                self._add(name, _Pattern(ticker, len(name), exact))
+
+        self._build_failure_links()
+
+    def _add(self, key: str, pattern: _Pattern) -> None:
+        state = 0
+        for char in key:
+            nxt = self._goto[state].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][char] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append(pattern)
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[nxt] = self._goto[fallback].get(char, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def match(self, text: str) -> set[str]:
+        """Return every ticker mentioned in text (single pass)."""
+        found: set[str] = set()
+        if not text:
+            return found
+
+        folded = _fold(text)
+        goto, fail, out = self._goto, self._fail, self._out
+        size = len(text)
+        state = 0
+        for end, char in enumerate(folded, start=1):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if not out[state]:
+                continue
+            for pattern in out[state]:
+                if pattern.ticker in found:
+                    continue
+                start = end - pattern.length
+                if start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if end < size and _is_word_char(text[end]):
+                    continue
+                if pattern.exact is not None and text[start:end] != pattern.exact:
+                    continue
+                found.add(pattern.ticker)
+        return found
+
+    def match_all(self, *texts: Optional[str]) -> set[str]:
+        """Union of matches over several fields (e.g. title and summary)."""
+        found: set[str] = set()
+        for text in texts:
+            if text:
+                found |= self.match(text)
+        return found
+
+
+def _known_aliases() -> dict[str, list[str]]:
+    """Ticker -> aliases from NewsFetcher.COMPANY_NAMES and TickerResolver.COMMON_NAMES."""
+    from ai_service.fetchers import NewsFetcher
+    from ai_service.processors.ticker_resolver import TickerResolver
+
+    aliases: dict[str, list[str]] = {}
+    for ticker, name in NewsFetcher.COMPANY_NAMES.items():
+        aliases.setdefault(ticker.upper(), []).append(name)
+    for alias, (ticker, _name, _sector) in TickerResolver.COMMON_NAMES.items():
+        aliases.setdefault(ticker.upper(), []).append(alias)
+    return aliases
+
+
+@lru_cache(maxsize=32)
+def _cached_matcher(companies: tuple[tuple[str, str], ...]) -> TickerMatcher:
+    known = _known_aliases()
+    aliases: dict[str, list[str]] = {}
+    for ticker, company_name in companies:
+        names = list(known.get(ticker.upper(), []))
+        if company_name and company_name.upper() != ticker.upper():
+            names.append(company_name)
+        aliases[ticker] = names
+    logger.debug(f"Built ticker matcher for {len(aliases)} tickers")
+    return TickerMatcher(aliases)
+
+
+def get_ticker_matcher(companies: Mapping[str, str]) -> TickerMatcher:
+    """Matcher for the given ticker -> company name map (cached per ticker set)."""
+    return _cached_matcher(tuple(sorted(companies.items())))
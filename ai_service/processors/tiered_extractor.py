@@ -0,0 +1,180 @@
+"""Tiered article extraction: one plain GET first, headless browser as fallback.
+
+Most news pages render server-side, so the article text is already in the
+HTML a single GET returns. `TieredExtractor` extracts the main content of
+that HTML (processors.main_content), scores the result and only escalates to the browser when the score
+is below `min_score` (JS-rendered pages, consent walls, paywalls).
+
+`DomainTiers` remembers per domain which tier produced good text: domains
+that needed the browser go straight to it, and are re-probed over HTTP
+every `reprobe_every` requests in case the site changed.
+"""
+
+import asyncio
+import logging
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, NamedTuple, Optional
+from urllib.parse import urlsplit
+
+from ai_service.config import Settings
+from ai_service.fetchers.content_fetcher import ContentFetcher
+from ai_service.processors.main_content import extract_main_content
+
+logger = logging.getLogger(__name__)
+
+HTTP = "http"
+BROWSER = "browser"
+
+# Score targets: text this long / this many paragraphs count as a full article
+TARGET_CHARS = 1500
+TARGET_PARAGRAPHS = 5
+PAYWALL_PENALTY = 0.3
+
+# Matched against the raw HTML: reader-facing phrases and schema.org markup only,
+# not bare words like "paywall" that free pages use in class names and scripts
+_PAYWALL_MARKERS = re.compile(
+    r"subscribe to (?:continue|read)|to continue reading|already a subscriber|"
+    r"sign in to (?:continue|read)|register to continue|"
+    r"\"isaccessibleforfree\"\s*:\s*\"?false",
+    re.IGNORECASE,
+)
+
+
+class ExtractionQuality(NamedTuple):
+    """How complete an extracted article looks (score 0..1)."""
+    score: float
+    chars: int
+    paragraphs: int
+    density: float  # Share of the page's visible text inside article paragraphs
+    paywalled: bool
+
+
+def score_extraction(paragraphs: list[str], visible_chars: int, html: str = "") -> ExtractionQuality:
+    """Score extracted text by length, paragraph count/density and paywall markers."""
+    chars = sum(len(p) for p in paragraphs)
+    density = chars / visible_chars if visible_chars else 0.0
+    score = (
+        0.6 * min(chars / TARGET_CHARS, 1.0)
+        + 0.25 * min(len(paragraphs) / TARGET_PARAGRAPHS, 1.0)
+        + 0.15 * min(density / 0.5, 1.0)
+    )
+    paywalled = bool(_PAYWALL_MARKERS.search(html))
+    if paywalled:
+        score *= PAYWALL_PENALTY
+    return ExtractionQuality(round(score, 3), chars, len(paragraphs), round(density, 3), paywalled)
+
+
+def _domain(url: str) -> str:
+    host = (urlsplit(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+@dataclass
+class _DomainTier:
+    tier: str
+    requests: int = 0  # Requests since the tier was recorded
+
+
+class DomainTiers:
+    """Per-domain memory of the extraction tier that worked (LRU-bounded)."""
+
+    def __init__(self, reprobe_every: int = 20, max_domains: int = 2000):
+        """
+        Args:
+            reprobe_every: Browser-tier domains retry HTTP every N requests
+            max_domains: Domains remembered
+        """
+        self.reprobe_every = reprobe_every
+        self.max_domains = max_domains
+        self._tiers: "OrderedDict[str, _DomainTier]" = OrderedDict()
+
+    def preferred(self, url: str) -> str:
+        """Tier to try first for a URL."""
+        entry = self._tiers.get(_domain(url))
+        if entry is None or entry.tier == HTTP:
+            return HTTP
+        entry.requests += 1
+        return HTTP if entry.requests % self.reprobe_every == 0 else BROWSER
+
+    def record(self, url: str, tier: str) -> None:
+        """Remember the tier that produced good text for the URL's domain."""
+        domain = _domain(url)
+        entry = self._tiers.get(domain)
+        if entry is None or entry.tier != tier:
+            self._tiers[domain] = _DomainTier(tier)
+            logger.debug(f"Extraction tier for {domain}: {tier}")
+        self._tiers.move_to_end(domain)
+        while len(self._tiers) > self.max_domains:
+            self._tiers.popitem(last=False)
+
+    def get_stats(self) -> dict[str, int]:
+        browser = sum(1 for entry in self._tiers.values() if entry.tier == BROWSER)
+        return {"domains": len(self._tiers), "http": len(self._tiers) - browser, "browser": browser}
+
+
+class TieredExtractor:
+    """Extracts article text over HTTP, escalating to a browser when the result scores low."""
+
+    def __init__(
+        self,
+        content_fetcher: Optional[ContentFetcher] = None,
+        tiers: Optional[DomainTiers] = None,
+        min_score: float = 0.5,
+    ):
+        """
+        Args:
+            content_fetcher: Performs the plain GET
+            tiers: Per-domain tier memory (shared across requests)
+            min_score: HTTP results scoring below this go to the browser
+        """
+        self.content_fetcher = content_fetcher or ContentFetcher()
+        self.tiers = tiers or DomainTiers()
+        self.min_score = min_score
+        self.counts = {HTTP: 0, BROWSER: 0, "failed": 0}
+
+    async def extract_http(self, url: str) -> tuple[str, ExtractionQuality]:
+        """Plain-GET extraction and its quality (empty text on failure)."""
+        html = await asyncio.to_thread(self.content_fetcher.fetch_html, url)
+        if not html:
+            return "", ExtractionQuality(0.0, 0, 0, 0.0, False)
+        content = await asyncio.to_thread(extract_main_content, html)
+        return "\n\n".join(content.paragraphs), score_extraction(content.paragraphs, content.visible_chars, html)
+
+    async def extract(self, url: str, browser_extract: Callable[[str], Awaitable[str]]) -> str:
+        """Article text of a URL, from the cheapest tier that yields a good result."""
+        http_text = ""
+        if self.tiers.preferred(url) == HTTP:
+            http_text, quality = await self.extract_http(url)
+            if quality.score >= self.min_score:
+                self.tiers.record(url, HTTP)
+                self.counts[HTTP] += 1
+                return http_text
+            logger.info(f"HTTP extraction of {url} scored {quality.score} ({quality.chars} chars), using browser")
+
+        browser_text = await browser_extract(url)
+        if browser_text and len(browser_text) >= len(http_text):
+            self.tiers.record(url, BROWSER)
+            self.counts[BROWSER] += 1
+            return browser_text
+        if http_text:
+            # Browser did no better: keep the partial HTTP text
+            self.counts[HTTP] += 1
+            return http_text
+        self.counts["failed"] += 1
+        return ""
+
+    def get_stats(self) -> dict[str, object]:
+        return {**self.counts, "min_score": self.min_score, "domains": self.tiers.get_stats()}
+
+
+_tiered: Optional[TieredExtractor] = None
+
+
+def get_tiered_extractor() -> TieredExtractor:
+    """Get or create the app-wide tiered extractor (its domain memory is shared)."""
+    global _tiered
+    if _tiered is None:
+        _tiered = TieredExtractor(min_score=Settings().content_http_min_score)
+    return _tiered
@@ -5,3 +5,7 @@ from pathlib import Path
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "integration: exercises real external services (deselect with -m 'not integration')")
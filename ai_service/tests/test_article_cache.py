@@ -0,0 +1,80 @@
+"""Tests for the compressed article body cache."""
+
+from unittest.mock import MagicMock
+
+from ai_service import article_cache
+from ai_service.article_cache import PDF, ArticleCache
+from ai_service.fetchers.content_fetcher import ContentFetcher
+
+ARTICLE = "Revenue rose 12% year over year, driven by strong cloud demand. " * 40
+
+
+def test_round_trip_by_canonical_url_and_compressed():
+    cache = ArticleCache(":memory:")
+    cache.put("https://News.example.com/story/?utm_source=feed", ARTICLE, "text/html")
+
+    cached = cache.get("https://news.example.com/story")
+
+    assert cached is not None and cached.text == ARTICLE
+    assert cache.get("https://news.example.com/other") is None
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+    assert stats["bytes"] < len(ARTICLE) / 5
+
+
+def test_ttl_depends_on_kind():
+    now = 1_800_000_000.0
+    cache = ArticleCache(":memory:", news_ttl_hours=1, pdf_ttl_hours=48, clock=lambda: now)
+    cache.put("https://news.example.com/a", ARTICLE)
+    cache.put("https://ir.example.com/10-K.pdf", ARTICLE)
+
+    now += 2 * 3600
+
+    assert cache.get("https://news.example.com/a") is None
+    filing = cache.get("https://ir.example.com/10-K.pdf")
+    assert filing is not None and filing.kind == PDF
+    assert cache.get_stats()["expired"] == 1
+
+
+def test_evicts_least_recently_used_when_over_size():
+    now = 1_800_000_000.0
+
+    def clock() -> float:
+        return now
+
+    cache = ArticleCache(":memory:", clock=clock)
+    for i in range(3):
+        cache.put(f"https://news.example.com/{i}", f"{i} {ARTICLE}")
+        now += 1
+    cache.get("https://news.example.com/0")
+    entry_bytes = cache.get_stats()["bytes"] // 3
+    cache.max_bytes = entry_bytes * 3
+
+    cache.put("https://news.example.com/3", f"3 {ARTICLE}")
+
+    assert cache.get("https://news.example.com/1") is None
+    assert cache.get("https://news.example.com/0") is not None
+    assert cache.get_stats()["evicted"] == 1
+
+
+def test_zlib_fallback_entries_stay_readable(monkeypatch):
+    cache = ArticleCache(":memory:")
+    monkeypatch.setattr(article_cache, "zstandard", None)
+    cache.put("https://news.example.com/a", ARTICLE)
+    monkeypatch.undo()
+
+    cached = cache.get("https://news.example.com/a")
+    assert cached is not None and cached.text == ARTICLE
+
+
+def test_content_fetcher_downloads_each_url_once():
+    fetcher = ContentFetcher(cache=ArticleCache(":memory:"))
+    response = MagicMock(status_code=200, headers={"Content-Type": "text/html"})
+    response.iter_content.return_value = iter([f"<html><p>{ARTICLE}</p></html>".encode()])
+    fetcher._get = MagicMock(return_value=response)
+
+    first = fetcher.fetch_url("https://news.example.com/a")
+    second = fetcher.fetch_url("https://news.example.com/a")
+
+    assert first and first == second
+    assert fetcher._get.call_count == 1
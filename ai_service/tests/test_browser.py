@@ -1,6 +1,8 @@
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from ai_service.processors.browser_extractor import BrowserExtractor
+from ai_service.processors.browser_pool import BrowserPool
+from ai_service.processors.resource_blocker import ResourceBlocker
 from ai_service.models.article import Article, ArticleCollection
 
 @pytest.fixture
@@ -13,6 +15,7 @@ def mock_playwright():
         mock_context_manager.__aenter__.return_value = mock_playwright_obj
         
         mock_browser = AsyncMock()
+        mock_browser.is_connected = MagicMock(return_value=True)
         mock_playwright_obj.chromium.launch.return_value = mock_browser
         
         mock_browser_context = AsyncMock()
@@ -41,4 +44,114 @@ async def test_browser_extraction(mock_playwright):
     result = await extractor._process_async(collection)
     
     assert result.articles[0].content == "Full article content extracted from browser."
-    mock_playwright.goto.assert_called_with("http://example.com", timeout=30000, wait_until="domcontentloaded")
+    mock_playwright.goto.assert_called_with("http://example.com", timeout=30000, wait_until="commit")
+
+
+def _fake_playwright():
+    """async_playwright() stand-in recording every launched browser."""
+    launches = []
+
+    def factory():
+        manager = AsyncMock()
+        playwright = AsyncMock()
+        manager.__aenter__.return_value = playwright
+
+        async def launch():
+            browser = AsyncMock()
+            browser.is_connected = MagicMock(return_value=True)
+            page = AsyncMock()
+            page.evaluate.return_value = "Extracted text " * 20
+            browser.new_context.return_value.new_page.return_value = page
+            launches.append(browser)
+            return browser
+
+        playwright.chromium.launch.side_effect = launch
+        return manager
+
+    return factory, launches
+
+
+@pytest.mark.asyncio
+async def test_shared_pool_launches_browser_once():
+    factory, launches = _fake_playwright()
+    pool = BrowserPool(contexts=2, playwright_factory=factory)
+    extractor = BrowserExtractor(pool=pool)
+
+    for _ in range(3):
+        collection = ArticleCollection(
+            articles=[Article(title="T", link="http://example.com/a", source="S", published="2024-01-01")],
+            query_stocks=["ABSI"]
+        )
+        result = await extractor._process_async(collection)
+        assert result.articles[0].content.startswith("Extracted text")
+
+    assert len(launches) == 1
+    assert pool.get_stats()["pages_served"] == 3
+    launches[0].close.assert_not_called()  # The shared browser outlives each call
+
+
+@pytest.mark.asyncio
+async def test_pool_recycles_contexts_and_recovers_from_crash():
+    factory, launches = _fake_playwright()
+    pool = BrowserPool(contexts=1, max_pages_per_context=2, playwright_factory=factory)
+
+    for _ in range(3):
+        async with pool.page():
+            pass
+    assert launches[0].new_context.await_count == 2  # Recreated after 2 pages
+
+    launches[0].is_connected.side_effect = lambda: False  # Chromium crashed
+    async with pool.page() as page:
+        assert page is not None
+
+    assert len(launches) == 2
+    assert pool.get_stats()["launches"] == 2
+    await pool.close()
+    launches[1].close.assert_awaited()
+
+
+def test_resource_blocker_rules():
+    blocker = ResourceBlocker(domains=["doubleclick.net", "tracker.io"])
+
+    assert blocker.should_block("https://example.com/hero.jpg", "image")
+    assert blocker.should_block("https://securepubads.g.doubleclick.net/tag.js", "script")
+    assert blocker.should_block("https://tracker.io/pixel", "xhr")
+    assert not blocker.should_block("https://notdoubleclick.net/app.js", "script")
+    assert not blocker.should_block("https://example.com/article", "document")
+    assert not blocker.should_block("https://example.com/app.js", "script")
+
+
+@pytest.mark.asyncio
+async def test_pool_installs_blocker_on_every_context():
+    factory, launches = _fake_playwright()
+    blocker = ResourceBlocker()
+    pool = BrowserPool(contexts=1, blocker=blocker, playwright_factory=factory)
+
+    async with pool.page():
+        pass
+
+    launches[0].new_context.return_value.route.assert_awaited_once_with("**/*", blocker.handle)
+
+
+@pytest.mark.asyncio
+async def test_page_without_article_container_does_not_wait_for_selector_timeout():
+    import asyncio
+    import time
+
+    page = AsyncMock()
+    page.evaluate.return_value = "Parsed document text"
+
+    async def no_container(*args, **kwargs):
+        await asyncio.sleep(5)  # Playwright would time out here
+
+    async def parsed(*args, **kwargs):
+        await asyncio.sleep(0.05)
+
+    page.wait_for_selector.side_effect = no_container
+    page.wait_for_load_state.side_effect = parsed
+
+    started = time.monotonic()
+    text = await BrowserExtractor()._extract_page_text(page, "http://example.com")
+
+    assert text == "Parsed document text"
+    assert time.monotonic() - started < 1.0
@@ -0,0 +1,77 @@
+"""Tests for streamed, bounded downloads in ContentFetcher (no network)."""
+
+from typing import Iterator
+from unittest.mock import MagicMock
+
+from ai_service.config import Settings
+from ai_service.fetchers.content_fetcher import MAX_TEXT_CHARS, ContentFetcher, sniff_content_type
+
+
+class FakeStreamResponse:
+    """Streams a body in fixed-size chunks and records how much was read."""
+
+    def __init__(self, body: bytes, content_type: str = "", chunk: int = 1024):
+        self.status_code = 200
+        self.headers = {"Content-Type": content_type} if content_type else {}
+        self.encoding = None
+        self.body = body
+        self.chunk = chunk
+        self.bytes_read = 0
+        self.closed = False
+
+    def iter_content(self, chunk_size: int) -> Iterator[bytes]:
+        for start in range(0, len(self.body), self.chunk):
+            piece = self.body[start:start + self.chunk]
+            self.bytes_read += len(piece)
+            yield piece
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _fetcher(response: FakeStreamResponse, **settings) -> ContentFetcher:
+    fetcher = ContentFetcher(Settings(**settings))
+    fetcher._get = MagicMock(return_value=response)
+    return fetcher
+
+
+def test_endless_html_stops_once_enough_text_is_extracted():
+    paragraph = "<p>" + "Quarterly revenue beat estimates on strong demand. " * 4 + "</p>\n"
+    body = ("<html><head><script>var tracking = 1;</script></head><body><nav>Menu</nav>" + paragraph * 5000).encode()
+    response = FakeStreamResponse(body)
+
+    text = _fetcher(response).fetch_url("https://news.example.com/story")
+
+    assert len(text) == MAX_TEXT_CHARS
+    assert "tracking" not in text and "Menu" not in text
+    assert text.startswith("Quarterly revenue")
+    assert response.bytes_read < 64 * 1024 < len(body)
+    assert response.closed
+
+
+def test_pdf_is_sniffed_from_bytes_and_bounded():
+    response = FakeStreamResponse(b"%PDF-1.7\n" + b"0" * 50_000, content_type="application/octet-stream")
+
+    fetcher = _fetcher(response, CONTENT_MAX_PDF_BYTES=10_000)
+
+    assert fetcher.fetch_url("https://ir.example.com/download?id=10-K") is None
+    assert response.bytes_read <= 10_000 + response.chunk
+    assert sniff_content_type(b"  <!DOCTYPE html><html>", "application/pdf") == "text/html"
+
+
+def test_fetch_html_is_cut_at_byte_ceiling():
+    body = b"<html><body>" + "<p>caf\xc3\xa9</p>".encode("latin-1") * 10_000
+    response = FakeStreamResponse(body, content_type="text/html; charset=utf-8")
+
+    html = _fetcher(response, CONTENT_MAX_HTML_BYTES=4096).fetch_html("https://news.example.com/a")
+
+    assert html.startswith("<html><body><p>café</p>")
+    assert len(html.encode("utf-8")) <= 4096
+
+
+def test_pdf_over_declared_length_is_skipped_after_first_chunk():
+    response = FakeStreamResponse(b"%PDF-1.7\n" + b"0" * 50_000, content_type="application/pdf")
+    response.headers["Content-Length"] = str(len(response.body))
+
+    assert _fetcher(response, CONTENT_MAX_PDF_BYTES=10_000).fetch_url("https://ir.example.com/filing") is None
+    assert response.bytes_read == response.chunk
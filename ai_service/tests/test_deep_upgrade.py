@@ -0,0 +1,90 @@
+"""Tests for the concurrent deep-source upgrade stage (no network, fake summarizer)."""
+
+import threading
+import time
+
+import pytest
+
+from ai_service.pipeline.deep_upgrade import DeepSourceUpgrader
+
+LONG_TEXT = "Analysts expect margins to recover in the second half. " * 40
+
+
+class FakeSummarizer:
+    def __init__(self):
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def analyze_text(self, text: str, analysis_type: str = "summarize") -> str:
+        with self._lock:
+            self.calls += 1
+        return "Margins recover."
+
+
+def _items(count: int) -> list[dict]:
+    return [{"title": f"Item {i}", "url": f"https://research.example.com/{i}", "summary": ""} for i in range(count)]
+
+
+@pytest.mark.asyncio
+async def test_fetches_fan_out_and_summaries_respect_budget():
+    def fetch(url: str) -> str:
+        time.sleep(0.2)
+        return LONG_TEXT
+
+    items = _items(8)
+    summarizer = FakeSummarizer()
+    upgrader = DeepSourceUpgrader(fetch, summarizer, fetch_concurrency=8, summary_budget=3)
+
+    started = time.monotonic()
+    await upgrader.upgrade(items)
+
+    assert time.monotonic() - started < 1.0  # Sequentially: 8 x 0.2s
+    assert summarizer.calls == 3
+    assert sum(item["summary"].startswith("[AI SUMMARY]") for item in items) == 3
+    assert all(item["summary"] for item in items)
+
+
+@pytest.mark.asyncio
+async def test_deadline_keeps_finished_items():
+    release = threading.Event()
+
+    def fetch(url: str) -> str:
+        if url.endswith("/0"):
+            release.wait(5)  # Stuck source
+            return LONG_TEXT
+        return "Short filing note. " * 20
+
+    items = _items(3)
+    upgrader = DeepSourceUpgrader(fetch, FakeSummarizer(), deadline=0.5)
+    try:
+        started = time.monotonic()
+        await upgrader.upgrade(items)
+        elapsed = time.monotonic() - started
+    finally:
+        release.set()
+
+    assert elapsed < 2.0 and upgrader.timed_out
+    assert items[0]["summary"] == ""
+    assert items[1]["summary"].startswith("Short filing note.")
+
+
+@pytest.mark.asyncio
+async def test_failed_summaries_give_their_budget_slot_back():
+    class FlakySummarizer(FakeSummarizer):
+        def analyze_text(self, text: str, analysis_type: str = "summarize") -> str:
+            with self._lock:
+                self.calls += 1
+                if self.calls <= 2:
+                    raise RuntimeError("provider error")
+            return "Margins recover."
+
+    def fetch(url: str) -> str:
+        time.sleep(0.1 * int(url.rsplit("/", 1)[1]))  # Texts arrive one after another
+        return LONG_TEXT
+
+    items = _items(6)
+    upgrader = DeepSourceUpgrader(fetch, FlakySummarizer(), fetch_concurrency=6, summary_budget=3)
+    await upgrader.upgrade(items)
+
+    assert upgrader.summarized == 3
+    assert sum(item["summary"].startswith("[AI SUMMARY]") for item in items) == 3
@@ -1,5 +1,7 @@
 """Tests for Engine API endpoints."""
 
+import json
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -14,13 +16,12 @@ def client():
 
 @pytest.fixture(autouse=True)
 def clear_caches():
-    """Clear caches before each test."""
-    global _news_cache, _analysis_cache
+    """Use a fresh in-memory news store and clear caches for each test."""
     from ai_service.api import engine
-    engine._news_cache = []
+    from ai_service.news_store import NewsStore, set_news_store
+    set_news_store(NewsStore(":memory:"))
     engine._analysis_cache = {}
     yield
-    engine._news_cache = []
     engine._analysis_cache = {}
 
 
@@ -112,6 +113,43 @@ class TestNewsEndpoints:
         assert len(data["items"]) == 2  # Only AAPL items
 
 
+    def test_fetch_stream_ndjson(self, client):
+        """Streaming fetch emits item frames and a final summary (DEV_MODE mock fetcher)."""
+        response = client.post("/api/engine/fetch/stream", json={"tickers": ["ACME", "NOVA"], "max_per_ticker": 3})
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        
+        frames = [json.loads(line) for line in response.text.splitlines() if line]
+        assert frames[-1]["type"] == "summary"
+        item_frames = [f for f in frames if f["type"] == "items"]
+        assert sum(len(f["items"]) for f in item_frames) == frames[-1]["fetched"] > 0
+    
+    def test_fetch_stream_sse(self, client):
+        """format=sse wraps the same frames as Server-Sent Events."""
+        response = client.post("/api/engine/fetch/stream?format=sse", json={"tickers": ["ACME"]})
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert "event: summary" in response.text
+
+
+    def test_search_news(self, client):
+        """Full-text search over submitted news."""
+        payload = {
+            "items": [
+                {"ticker": "AAPL", "title": "Apple unveils new iPhone", "source": "Reuters", "url": "https://x.com/a"},
+                {"ticker": "MSFT", "title": "Microsoft cloud growth slows", "source": "CNBC", "url": "https://x.com/m"},
+            ],
+            "request_analysis": False
+        }
+        client.post("/api/engine/news", json=payload)
+        
+        response = client.get("/api/engine/news/search", params={"q": "iphone"})
+        assert response.status_code == 200
+        data = response.json()
+        assert [hit["ticker"] for hit in data["hits"]] == ["AAPL"]
+        assert "<b>iPhone</b>" in data["hits"][0]["snippet"]
+
+
 class TestAnalysisEndpoints:
     """Test analysis request and caching."""
     
@@ -198,3 +236,25 @@ class TestDBEndpoints:
         response = client.post("/api/engine/db/store", json=payload)
         assert response.status_code == 200
         assert response.json()["stored"] is True
+
+
+class TestSentimentEndpoint:
+    """Test the rolling StockTwits sentiment endpoint."""
+    
+    def test_sentiment_is_served_from_memory(self, client, monkeypatch):
+        """Counts come from the consumer's aggregate, no StockTwits call."""
+        from ai_service.fetchers import stocktwits_fetcher
+        from ai_service.news_store import NewsStore
+        consumer = stocktwits_fetcher.StockTwitsConsumer(cursor_store=NewsStore(":memory:"))
+        consumer.sentiment.add("NVDA", "Bullish")
+        consumer.sentiment.add("NVDA", "Bearish")
+        consumer.sentiment.add("NVDA", "Bullish")
+        monkeypatch.setattr(stocktwits_fetcher, "_stocktwits_consumer", consumer)
+        
+        response = client.get("/api/engine/sentiment/nvda")
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert data["ticker"] == "NVDA"
+        assert data["windows"]["1h"]["bullish"] == 2
+        assert data["windows"]["24h"]["bullish_ratio"] == 0.667
@@ -0,0 +1,45 @@
+"""Tests for feed parsing and the parser process pool."""
+
+import pytest
+
+from ai_service.fetchers.feed_parser import FeedParserPool, parse_feed
+
+FEED = b"""<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0"><channel><title>Markets</title>
+<item><title>Apple &amp; Partners launch device</title><link>https://example.com/a</link>
+<description>&lt;p&gt;Launch &lt;b&gt;details&lt;/b&gt;&lt;/p&gt;</description>
+<pubDate>Mon, 05 Jan 2026 10:00:00 GMT</pubDate></item>
+<item><title>M\xc3\xbcnchener R\xc3\xbcck raises outlook</title><link>https://example.com/b</link></item>
+</channel></rss>"""
+
+
+def test_parse_feed_returns_clean_entries():
+    entries = parse_feed(FEED)
+
+    assert [e.title for e in entries] == ["Apple & Partners launch device", "Münchener Rück raises outlook"]
+    assert entries[0].summary == "Launch details"
+    assert entries[0].published is not None and entries[0].published.year == 2026
+    assert entries[1].summary is None
+
+
+@pytest.mark.asyncio
+async def test_small_feeds_are_parsed_in_thread():
+    pool = FeedParserPool(workers=2, min_pool_bytes=len(FEED) + 1)
+
+    entries = await pool.parse(FEED)
+
+    assert len(entries) == 2
+    assert pool.get_stats()["inline"] == 1
+    assert pool._executor is None  # No workers started
+
+
+@pytest.mark.asyncio
+async def test_large_feeds_are_parsed_in_worker_process():
+    pool = FeedParserPool(workers=1, min_pool_bytes=0)
+    try:
+        entries = await pool.parse(FEED)
+    finally:
+        pool.shutdown()
+
+    assert entries == parse_feed(FEED)
+    assert pool.get_stats()["pooled"] == 1
@@ -72,6 +72,14 @@ class TestHealthEndpoints:
         """Test checking an unknown provider."""
         response = client.get("/health/providers/unknown")
         assert response.status_code == 404
+    
+    def test_source_health_endpoint(self, client):
+        """Test per-source circuit breaker status."""
+        response = client.get("/health/sources")
+        assert response.status_code == 200
+        data = response.json()
+        assert isinstance(data["sources"], dict)
+        assert isinstance(data["open_circuits"], list)
 
 
 class TestSettingsValidation:
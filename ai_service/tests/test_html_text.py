@@ -0,0 +1,35 @@
+"""Tests for the lightweight HTML-to-text cleaner."""
+
+import json
+from pathlib import Path
+
+import pytest
+from bs4 import BeautifulSoup
+
+from ai_service.processors.html_text import html_to_text, html_to_text_batch
+
+# Titles and summaries as they come out of feedparser for our feeds
+FIXTURE_PATH = Path(__file__).parent / "fixtures" / "feed_fragments.json"
+FIXTURE_CORPUS: list[str] = json.loads(FIXTURE_PATH.read_text())
+
+
+@pytest.mark.parametrize("fragment", FIXTURE_CORPUS)
+def test_matches_beautifulsoup_on_fixture_corpus(fragment):
+    assert html_to_text(fragment) == BeautifulSoup(fragment, "html.parser").get_text()
+
+
+def test_plain_text_is_returned_unchanged():
+    text = "Microsoft announces buyback"
+    assert html_to_text(text) is text
+    assert html_to_text(None) == ""
+
+
+def test_bare_ampersand_is_kept():
+    # html.parser drops a trailing "&D" as an unterminated entity
+    assert BeautifulSoup("Tesla boosts R&D", "html.parser").get_text() == "Tesla boosts RD"
+    assert html_to_text("Tesla boosts R&D") == "Tesla boosts R&D"
+    assert html_to_text("AT&T raises dividend") == "AT&T raises dividend"
+
+
+def test_batch_matches_single_calls():
+    assert html_to_text_batch(FIXTURE_CORPUS + [None]) == [html_to_text(f) for f in FIXTURE_CORPUS] + [""]
@@ -3,8 +3,26 @@ import json
 from unittest.mock import MagicMock, AsyncMock, patch
 from datetime import datetime
 
+from ai_service import article_cache, main
+from ai_service.article_cache import ArticleCache
 from ai_service.models.article import Article, ArticleCollection
 from ai_service.main import analyze_essay
+from ai_service.processors.tiered_extractor import TieredExtractor
+
+
+class _NoHttpFetcher:
+    """Plain-GET tier that never finds a page, so extraction falls through to the (mocked) browser."""
+
+    def fetch_html(self, url):
+        return None
+
+
+@pytest.fixture(autouse=True)
+def isolated_extraction(monkeypatch):
+    """Keep the pipeline off the network and out of the developer's article cache."""
+    monkeypatch.setattr(article_cache, "_cache", ArticleCache(":memory:"))
+    tiered = TieredExtractor(content_fetcher=_NoHttpFetcher())
+    monkeypatch.setattr(main, "get_tiered_extractor", lambda: tiered)
 
 @pytest.mark.asyncio
 async def test_end_to_end_pipeline():
@@ -0,0 +1,53 @@
+"""Tests for main-content extraction over the stored news page corpus."""
+
+from pathlib import Path
+
+import pytest
+
+from ai_service.processors.main_content import extract_main_content
+
+CORPUS_DIR = Path(__file__).parent / "fixtures" / "news_pages"
+CORPUS = {path.stem: path.read_bytes() for path in sorted(CORPUS_DIR.glob("*.html"))}
+
+# (page, sentence of the article, boilerplate that must not survive)
+EXPECTED = [
+    ("wire_earnings", "Data center revenue, which includes the H100", ["Most Read", "Related stories", "cookies", "Sign up"]),
+    ("portal_analysis", "Bulls point to energy storage and autonomy", ["Trending tickers", "TSLA to the moon", "Recommended"]),
+    ("press_release", "The study met its primary endpoint", ["More from Acme Biotech", "distribution service"]),
+    ("blog_commentary", "Credit costs in office portfolios", ["Share this", "Great post", "Subscribe by email"]),
+]
+
+
+@pytest.mark.parametrize("page, sentence, boilerplate", EXPECTED)
+def test_keeps_article_and_drops_boilerplate(page, sentence, boilerplate):
+    content = extract_main_content(CORPUS[page])
+
+    assert sentence in content.text
+    for text in boilerplate:
+        assert text not in content.text
+    assert len(content.text) < content.visible_chars
+
+
+def test_pages_without_container_fall_back_to_paragraphs():
+    paragraph = "Shares rose after the company raised its full-year guidance for the second time."
+    html = f"<html><body><p>{paragraph}</p><p>Short</p></body></html>"
+
+    assert extract_main_content(html).paragraphs == [paragraph]
+    assert extract_main_content("").paragraphs == []
+
+
+@pytest.mark.parametrize("wrapper", ['div class="page has-sidebar"', 'section class="commentary"', 'div class="menu-open"'])
+def test_boilerplate_named_wrappers_keep_the_article(wrapper):
+    paragraph = "Shares rose after the company raised its full-year guidance, citing demand, margins and buybacks."
+    tag = wrapper.split()[0]
+    html = (
+        f"<html><body><{wrapper}><article>{f'<p>{paragraph}</p>' * 4}</article>"
+        '<div class="related">Related stories: <a href="/x">Other story about something else</a></div>'
+        f"</{tag}></body></html>"
+    )
+
+    content = extract_main_content(html)
+
+    assert content.paragraphs == [paragraph] * 4
+    assert content.visible_chars >= len(paragraph) * 4
+    assert "Related stories" not in content.text
@@ -0,0 +1,53 @@
+"""Tests for near-duplicate story clustering."""
+
+from ai_service.fetchers import FetchedNews, NewsFetcher
+from ai_service.processors.near_duplicates import NearDuplicateIndex, normalize_title
+
+HEADLINE = "Apple beats quarterly revenue estimates on strong iPhone demand"
+
+
+def test_normalize_title_strips_syndication_markers():
+    assert normalize_title(f"UPDATE 2-{HEADLINE} - Reuters") == HEADLINE
+
+
+def test_syndicated_copies_share_a_cluster():
+    index: NearDuplicateIndex[str] = NearDuplicateIndex()
+
+    _, first = index.add("google", f"{HEADLINE} - Reuters", f"{HEADLINE}  Reuters", "Google Finance")
+    _, second = index.add(
+        "yahoo",
+        HEADLINE,
+        "Apple Inc on Thursday reported quarterly revenue above Wall Street estimates, driven by strong iPhone demand.",
+        "Yahoo Finance",
+    )
+    cluster, third = index.add("benzinga", "Apple beats revenue estimates on strong iPhone demand", None, "Benzinga")
+
+    assert (first, second, third) == (True, False, False)
+    assert len(index) == 1
+    assert cluster.canonical == "google"
+    assert cluster.size == 3
+    assert cluster.sources["Yahoo Finance"] == 1
+
+
+def test_different_stories_stay_apart():
+    index: NearDuplicateIndex[str] = NearDuplicateIndex()
+
+    index.add("a", HEADLINE)
+    index.add("b", "Microsoft beats quarterly revenue estimates on strong cloud demand")
+    index.add("c", "Tesla shares jump after delivery report")
+    index.add("d", "Tesla shares fall after delivery report")
+
+    assert len(index) == 4
+
+
+def test_fetcher_dedupe_records_syndicating_sources():
+    items = [
+        FetchedNews(ticker="AAPL", title=f"{HEADLINE} - Reuters", source="Google Finance"),
+        FetchedNews(ticker="AAPL", title=HEADLINE, source="Yahoo Finance"),
+        FetchedNews(ticker="AAPL", title="Apple unveils new Vision Pro", source="Benzinga"),
+    ]
+
+    unique = NewsFetcher._dedupe(items)
+
+    assert [n.source for n in unique] == ["Google Finance", "Benzinga"]
+    assert unique[0].syndicated_by == ["Yahoo Finance"]
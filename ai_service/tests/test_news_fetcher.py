@@ -0,0 +1,284 @@
+"""Tests for the multi-source NewsFetcher."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from ai_service.fetchers import FetchedNews, NewsFetcher
+from ai_service.fetchers.feed_cache import FeedCache
+from ai_service.fetchers.http_client import build_http_client, close_http_client, set_http_client
+
+
+def _item(ticker: str, title: str, source: str) -> FetchedNews:
+    return FetchedNews(ticker=ticker, title=title, source=source)
+
+
+@pytest.mark.asyncio
+async def test_sources_run_concurrently_and_slow_source_is_dropped(monkeypatch):
+    """A slow source times out without holding up the fast ones."""
+    fetcher = NewsFetcher(source_timeout=0.2, deadline=1.0)
+
+    async def fast(label: str):
+        await asyncio.sleep(0.05)
+        return [_item("AAPL", f"{label} headline", label)]
+
+    async def slow():
+        await asyncio.sleep(5)
+        return [_item("AAPL", "too late", "slow")]
+
+    def sources(*args):
+        return {"fast_a": fast("A"), "slow": slow(), "fast_b": fast("B")}
+
+    monkeypatch.setattr(fetcher, "_ticker_sources", sources)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    news = await fetcher.fetch_for_ticker("AAPL")
+    elapsed = loop.time() - started
+
+    assert [n.title for n in news] == ["A headline", "B headline"]
+    assert elapsed < 1.0
+
+
+@pytest.mark.asyncio
+async def test_global_deadline_cancels_pending_sources(monkeypatch):
+    fetcher = NewsFetcher(source_timeout=10, deadline=0.2)
+    cancelled = asyncio.Event()
+
+    async def hanging():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return []
+
+    async def quick():
+        return [_item("TSLA", "Tesla update", "quick")]
+
+    monkeypatch.setattr(fetcher, "_ticker_sources", lambda *a: {"hang": hanging(), "quick": quick()})
+
+    news = await fetcher.fetch_for_ticker("TSLA")
+
+    assert [n.title for n in news] == ["Tesla update"]
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_dedup_prefers_source_priority_over_arrival(monkeypatch):
+    fetcher = NewsFetcher(source_timeout=1, deadline=1)
+
+    async def delayed(delay: float, source: str):
+        await asyncio.sleep(delay)
+        return [_item("MSFT", "Microsoft beats estimates", source)]
+
+    monkeypatch.setattr(
+        fetcher, "_ticker_sources",
+        lambda *a: {"primary": delayed(0.1, "primary"), "secondary": delayed(0.0, "secondary")},
+    )
+
+    news = await fetcher.fetch_for_ticker("MSFT")
+
+    assert len(news) == 1
+    assert news[0].source == "primary"
+
+
+RSS_FIXTURE = """<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Test</title>
+<item><title>Apple &amp; Partners launch device</title><link>https://example.com/a</link>
+<description>&lt;p&gt;Launch &lt;b&gt;details&lt;/b&gt;&lt;/p&gt;</description>
+<pubDate>Mon, 05 Jan 2026 10:00:00 GMT</pubDate></item>
+</channel></rss>"""
+
+
+@pytest.mark.asyncio
+async def test_rss_is_fetched_through_shared_async_client():
+    requested: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        return httpx.Response(200, text=RSS_FIXTURE)
+
+    set_http_client(build_http_client(transport=httpx.MockTransport(handler)))
+    try:
+        news = await NewsFetcher()._fetch_rss("AAPL", "yahoo_finance", 5)
+    finally:
+        await close_http_client()
+
+    assert requested and "s=AAPL" in requested[0]
+    assert len(news) == 1
+    assert news[0].title == "Apple & Partners launch device"
+    assert news[0].summary == "Launch details"
+    assert news[0].source == "Yahoo Finance"
+
+
+@pytest.mark.asyncio
+async def test_feed_cache_revalidates_with_etag_and_reuses_entries_on_304():
+    seen_headers: list[dict[str, str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(dict(request.headers))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, text=RSS_FIXTURE, headers={"ETag": '"v1"'})
+
+    cache = FeedCache(ttl_floor_seconds=0)
+    fetcher = NewsFetcher(feed_cache=cache)
+    set_http_client(build_http_client(transport=httpx.MockTransport(handler)))
+    try:
+        first = await fetcher._fetch_rss("AAPL", "yahoo_finance", 5)
+        second = await fetcher._fetch_rss("AAPL", "yahoo_finance", 5)
+    finally:
+        await close_http_client()
+
+    assert "if-none-match" not in seen_headers[0]
+    assert seen_headers[1]["if-none-match"] == '"v1"'
+    assert [n.title for n in second] == [n.title for n in first]
+    assert cache.get_stats()["revalidated"] == 1
+
+
+@pytest.mark.asyncio
+async def test_feed_cache_ttl_floor_skips_network():
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(200, text=RSS_FIXTURE)
+
+    fetcher = NewsFetcher(feed_cache=FeedCache(ttl_floor_seconds=60))
+    set_http_client(build_http_client(transport=httpx.MockTransport(handler)))
+    try:
+        await fetcher._fetch_rss("AAPL", "yahoo_finance", 5)
+        news = await fetcher._fetch_rss("AAPL", "yahoo_finance", 5)
+    finally:
+        await close_http_client()
+
+    assert calls == 1
+    assert len(news) == 1
+
+
+GENERAL_FIXTURE = """<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Markets</title>
+<item><title>Tesla shares jump after delivery report</title><link>https://example.com/1</link></item>
+<item><title>Apple and Microsoft lead tech rally</title><link>https://example.com/2</link></item>
+<item><title>Oil prices slide</title><link>https://example.com/3</link></item>
+</channel></rss>"""
+
+
+@pytest.mark.asyncio
+async def test_batch_fetches_general_feeds_once_and_routes_entries(monkeypatch):
+    requested: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        return httpx.Response(200, text=GENERAL_FIXTURE)
+
+    fetcher = NewsFetcher()
+
+    async def no_ticker_sources(*args):
+        return []
+
+    monkeypatch.setattr(
+        fetcher, "_ticker_sources",
+        lambda ticker, company, max_items, include_general: {"none": no_ticker_sources()},
+    )
+    monkeypatch.setattr(fetcher, "_fetch_reddit_batch", lambda *args: no_ticker_sources())
+    set_http_client(build_http_client(transport=httpx.MockTransport(handler)))
+    try:
+        news = await fetcher.fetch_multiple_tickers(["AAPL", "MSFT", "TSLA", "NVDA"])
+    finally:
+        await close_http_client()
+
+    assert len(requested) == len(NewsFetcher.GENERAL_FEEDS)
+    by_ticker: dict[str, set[str]] = {}
+    for item in news:
+        by_ticker.setdefault(item.ticker, set()).add(item.title)
+    assert by_ticker["TSLA"] == {"Tesla shares jump after delivery report"}
+    assert by_ticker["AAPL"] == {"Apple and Microsoft lead tech rally"}
+    assert by_ticker["MSFT"] == {"Apple and Microsoft lead tech rally"}
+    assert "NVDA" not in by_ticker
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_each_source_as_it_completes(monkeypatch):
+    fetcher = NewsFetcher(source_timeout=1, deadline=1)
+    fetcher.GENERAL_FEEDS = []
+    headline = "Apple beats quarterly revenue estimates on strong iPhone demand"
+
+    async def fast():
+        return [_item("AAPL", headline, "Yahoo Finance")]
+
+    async def slow():
+        await asyncio.sleep(0.2)
+        return [_item("AAPL", f"{headline} - Reuters", "Google Finance"), _item("AAPL", "Apple unveils new Mac", "Google Finance")]
+
+    monkeypatch.setattr(fetcher, "_ticker_sources", lambda *a, **kw: {"Google Finance": slow(), "Yahoo RSS": fast()})
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    batches = []
+    async for label, items in fetcher.stream_multiple_tickers(["AAPL"]):
+        batches.append((label, [n.title for n in items], loop.time() - started))
+
+    assert batches[0][0] == "AAPL / Yahoo RSS"
+    assert batches[0][2] < 0.1  # First headline does not wait for the slow source
+    # The syndicated copy from the slower source is suppressed
+    assert batches[1][:2] == ("AAPL / Google Finance", ["Apple unveils new Mac"])
+
+
+@pytest.mark.asyncio
+async def test_batch_reddit_search_is_bounded_by_source_timeout(monkeypatch):
+    fetcher = NewsFetcher(source_timeout=0.2, deadline=1.0)
+
+    async def no_sources(*args, **kwargs):
+        return []
+
+    async def slow_reddit(*args):
+        await asyncio.sleep(5)
+        return [_item("AAPL", "too late", "r/stocks")]
+
+    monkeypatch.setattr(fetcher, "fetch_for_ticker", no_sources)
+    monkeypatch.setattr(fetcher, "fetch_general_batch", no_sources)
+    monkeypatch.setattr(fetcher, "_fetch_reddit_batch", slow_reddit)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    assert await fetcher.fetch_multiple_tickers(["AAPL", "MSFT"]) == []
+    assert loop.time() - started < 1.0
+
+
+def test_ticker_source_labels_match_sources():
+    fetcher = NewsFetcher()
+    sources = fetcher._ticker_sources("AAPL", "Apple", 5, include_general=False)
+    for coro in sources.values():
+        coro.close()
+
+    assert list(sources) == fetcher.ticker_source_labels()
+
+
+@pytest.mark.asyncio
+async def test_stocktwits_is_capped_per_batch(monkeypatch):
+    fetcher = NewsFetcher(stocktwits_per_batch=2)
+    polled: list[str] = []
+
+    async def no_news(*args):
+        return []
+
+    async def stocktwits(ticker: str, max_items: int):
+        polled.append(ticker)
+        return []
+
+    monkeypatch.setattr(
+        fetcher, "_ticker_sources",
+        lambda ticker, company, max_items, include_general: {
+            "Yahoo RSS": no_news(), "StockTwits": stocktwits(ticker, max_items),
+        },
+    )
+    monkeypatch.setattr(fetcher, "_fetch_reddit_batch", lambda *args: no_news())
+    monkeypatch.setattr(fetcher, "fetch_general_batch", lambda *args: no_news())
+
+    await fetcher.fetch_multiple_tickers(["AAPL", "MSFT", "TSLA", "NVDA"])
+
+    assert polled == ["AAPL", "MSFT"]
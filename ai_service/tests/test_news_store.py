@@ -0,0 +1,110 @@
+"""Tests for the persistent news store."""
+
+from datetime import datetime, timedelta
+
+from ai_service import news_store
+from ai_service.fetchers import FetchedNews
+from ai_service.news_store import NewsStore, canonical_url
+
+
+def _news(title: str, url: str, ticker: str = "AAPL", hours_ago: float = 0) -> FetchedNews:
+    return FetchedNews(
+        ticker=ticker, title=title, source="Test", url=url,
+        published=datetime.now() - timedelta(hours=hours_ago),
+    )
+
+
+def test_canonical_url_drops_tracking_and_fragment():
+    assert canonical_url("HTTPS://Finance.Yahoo.com/news/apple/?utm_source=x&id=3#top", "t") == "https://finance.yahoo.com/news/apple?id=3"
+    assert canonical_url(None, " Apple Rises ") == "title:apple rises"
+    # Only exact tracking names are dropped, not parameters that merely start with one
+    assert canonical_url("https://x.com/a?mod=rss&mode=dark&model=m1", "t") == "https://x.com/a?mode=dark&model=m1"
+
+
+def test_duplicates_by_canonical_url_are_skipped_per_ticker():
+    store = NewsStore(":memory:")
+
+    first = store.add_many([_news("Apple rises", "https://x.com/a?utm_medium=rss"), _news("Apple rises", "https://x.com/a", ticker="MSFT")])
+    second = store.add_many([_news("Apple rises (updated)", "https://x.com/a/")])
+
+    assert (first, second) == (2, 0)
+    assert store.count("aapl") == 1
+    assert [n.title for n in store.fresh("AAPL")] == ["Apple rises"]
+
+
+def test_persists_across_reopen_and_reloads_hot_tier(tmp_path):
+    path = str(tmp_path / "news.db")
+    store = NewsStore(path)
+    store.add_many([_news("Old story", "https://x.com/old")], fetched_at=datetime.now() - timedelta(days=3))
+    store.add_many([_news("New story", "https://x.com/new")])
+    store.close()
+
+    reopened = NewsStore(path, hot_hours=24)
+    assert [n.title for n in reopened.fresh("AAPL", max_age_hours=24)] == ["New story"]
+    assert [n.title for n in reopened.fresh("AAPL", max_age_hours=24 * 7)] == ["Old story", "New story"]
+    assert reopened.latest(["AAPL"], limit=1)[0].title == "New story"
+
+
+def test_retention_prunes_old_rows():
+    store = NewsStore(":memory:", retention_days=1)
+    store.add_many([_news("Old story", "https://x.com/old")], fetched_at=datetime.now() - timedelta(days=2))
+    store.add_many([_news("New story", "https://x.com/new")])
+
+    assert store.prune() == 1
+    assert store.count() == 1
+    assert [n.title for n in store.latest(["AAPL"])] == ["New story"]
+
+
+def test_hot_tier_stays_bounded(monkeypatch):
+    store = NewsStore(":memory:", hot_hours=1)
+    store.add_many([_news("Backfilled", "https://x.com/old")], fetched_at=datetime.now() - timedelta(days=2))
+    store.add_many([_news(f"Story {i}", f"https://x.com/{i}", ticker=f"T{i}") for i in range(100)])
+    assert "AAPL" not in store._hot
+    assert len(store._hot) == 100
+
+    class _TwoHoursLater(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime.now(tz) + timedelta(hours=2)
+
+    # None of the tickers is ever read; prune alone must expire them
+    monkeypatch.setattr(news_store, "datetime", _TwoHoursLater)
+    store.prune()
+
+    assert store._hot == {}
+    assert store.count() == 101
+
+
+def test_ticker_time_range_uses_index():
+    store = NewsStore(":memory:")
+    store.add_many([_news(f"Story {i}", f"https://x.com/{i}", hours_ago=i) for i in range(10)])
+
+    items = store.between("AAPL", datetime.now() - timedelta(hours=3.5))
+    plan = store._conn.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM news WHERE ticker = ? AND published >= ? ORDER BY published DESC",
+        ("AAPL", "2026-01-01"),
+    ).fetchall()
+
+    assert [n.title for n in items] == ["Story 0", "Story 1", "Story 2", "Story 3"]
+    assert "idx_news_ticker_published" in str(plan)
+
+
+def test_full_text_search_ranks_title_matches_first():
+    store = NewsStore(":memory:")
+    store.add_many([
+        FetchedNews(ticker="NVDA", title="Chip stocks rally", source="A", url="https://x.com/1",
+                    summary="Nvidia earnings lift semiconductor names", published=datetime(2026, 1, 5)),
+        FetchedNews(ticker="NVDA", title="Nvidia earnings beat estimates", source="B", url="https://x.com/2",
+                    published=datetime(2026, 1, 6)),
+        FetchedNews(ticker="AMD", title="AMD earnings preview", source="C", url="https://x.com/3",
+                    published=datetime(2026, 1, 7)),
+    ])
+    store.set_content("https://x.com/3", "Analysts compare AMD with Nvidia ahead of earnings.")
+
+    hits = store.search("nvidia earning*")
+    assert [h.url for h in hits] == ["https://x.com/2", "https://x.com/1", "https://x.com/3"]
+    assert "<b>Nvidia</b>" in hits[0].snippet
+
+    assert [h.url for h in store.search("nvidia", ticker="amd")] == ["https://x.com/3"]
+    assert [h.url for h in store.search("earnings", since=datetime(2026, 1, 6), until=datetime(2026, 1, 7))] == ["https://x.com/2"]
+    assert store.search('" OR (') == []
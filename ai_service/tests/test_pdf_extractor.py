@@ -0,0 +1,62 @@
+"""Tests for the isolated PDF extraction pool."""
+
+import io
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from pypdf import PdfWriter
+
+from ai_service.fetchers.pdf_extractor import PdfExtractorPool, extract_pdf_text
+
+
+def _hang_or_echo(pdf_bytes: bytes, max_pages: int, max_chars: int) -> str:
+    """Stands in for pypdf in worker processes: b"hang" never finishes, b"slow..." takes 0.6s."""
+    if pdf_bytes == b"hang":
+        time.sleep(60)
+    if pdf_bytes.startswith(b"slow"):
+        time.sleep(0.6)
+    return pdf_bytes.decode()[:max_chars]
+
+
+def test_stuck_document_is_killed_and_pool_recovers():
+    pool = PdfExtractorPool(workers=1, timeout=1.0, max_bytes=100, extract_func=_hang_or_echo)
+    try:
+        started = time.monotonic()
+        assert pool.extract(b"hang") == ""
+        assert time.monotonic() - started < 10
+
+        assert pool.extract(b"10-K filing text") == "10-K filing text"
+        assert pool.extract(b"x" * 101) == ""
+    finally:
+        pool.shutdown()
+
+    stats = pool.get_stats()
+    assert (stats["timeouts"], stats["restarts"], stats["extracted"], stats["oversized"]) == (1, 1, 1, 1)
+
+
+def test_queued_jobs_do_not_time_out_while_waiting_for_a_worker():
+    pool = PdfExtractorPool(workers=1, timeout=1.0, extract_func=_hang_or_echo)
+    documents = [f"slow {i}".encode() for i in range(4)]
+    try:
+        with ThreadPoolExecutor(max_workers=4) as callers:
+            results = list(callers.map(pool.extract, documents))
+    finally:
+        pool.shutdown()
+
+    # 4 x 0.6s on one worker is longer than the 1s limit, but each job only runs 0.6s
+    assert results == [d.decode() for d in documents]
+    assert (pool.get_stats()["timeouts"], pool.get_stats()["restarts"]) == (0, 0)
+
+
+def test_extract_pdf_text_in_thread():
+    writer = PdfWriter()
+    for _ in range(3):
+        writer.add_blank_page(width=200, height=200)
+    buffer = io.BytesIO()
+    writer.write(buffer)
+
+    pool = PdfExtractorPool(workers=0)
+
+    assert pool.extract(buffer.getvalue()) == extract_pdf_text(buffer.getvalue())
+    assert pool.extract(b"not a pdf") == ""
+    assert pool.get_stats()["failed"] == 1
@@ -0,0 +1,133 @@
+"""Tests for per-host fetch rate limiting."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from ai_service.fetchers import http_client
+from ai_service.fetchers.http_client import build_http_client, close_http_client, set_http_client
+from ai_service.fetchers.rate_limiter import (
+    HostLimit,
+    HostRateLimiter,
+    HostThrottled,
+    RateLimiterRegistry,
+    parse_host_limits,
+    parse_retry_after,
+)
+
+
+def test_parse_host_limits_skips_invalid_parts():
+    limits = parse_host_limits("news.google.com=2:5:4, broken, www.reddit.com=0.5:2:1")
+
+    assert limits == {
+        "news.google.com": HostLimit(2.0, 5, 4),
+        "www.reddit.com": HostLimit(0.5, 2, 1),
+    }
+    # A zero rate would divide by zero when computing waits
+    assert parse_host_limits("news.google.com=0:5:4") == {}
+
+
+def test_parse_retry_after_seconds_and_date():
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_spaces_requests_after_burst():
+    limiter = HostRateLimiter("example.com", HostLimit(rate=20.0, burst=2, max_in_flight=10))
+
+    started = time.monotonic()
+    for _ in range(4):
+        async with limiter.acquire():
+            pass
+    elapsed = time.monotonic() - started
+
+    # Two burst tokens are free, the next two wait 1/20s each
+    assert 0.08 <= elapsed < 0.5
+
+
+@pytest.mark.asyncio
+async def test_in_flight_cap():
+    limiter = HostRateLimiter("example.com", HostLimit(rate=1000.0, burst=100, max_in_flight=2))
+    active = 0
+    peak = 0
+
+    async def request():
+        nonlocal active, peak
+        async with limiter.acquire():
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(request() for _ in range(6)))
+
+    assert peak == 2
+
+
+def test_retry_after_blocks_host():
+    limiter = HostRateLimiter("example.com", HostLimit(rate=1000.0, burst=100, max_in_flight=2), max_wait=60.0)
+
+    assert limiter.record_response(200) is None
+    assert limiter.record_response(429, "30") == 30.0
+    assert limiter._reserve() > 29
+    assert limiter.get_status()["throttled"] == 1
+
+
+def test_waits_beyond_max_wait_raise_instead_of_sleeping():
+    limiter = HostRateLimiter("example.com", HostLimit(rate=1000.0, burst=100, max_in_flight=2), max_wait=1.0)
+    limiter.record_response(429, "30")
+
+    started = time.monotonic()
+    with pytest.raises(HostThrottled):
+        with limiter.acquire_sync():
+            pass
+
+    assert time.monotonic() - started < 0.5
+    assert limiter.get_status()["rejected"] == 1
+    assert limiter.get_status()["requests"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiters_return_their_tokens():
+    limiter = HostRateLimiter("example.com", HostLimit(rate=1.0, burst=3, max_in_flight=40), max_wait=60.0)
+
+    async def request():
+        async with limiter.acquire():
+            pass
+
+    tasks = [asyncio.create_task(request()) for _ in range(40)]
+    await asyncio.wait(tasks, timeout=0.2)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    # Only the three burst tokens were used; nothing is owed for the cancelled waiters
+    assert limiter._reserve() < 1.1
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_get_retries_after_short_retry_after(monkeypatch):
+    registry = RateLimiterRegistry(default=HostLimit(rate=1000.0, burst=100, max_in_flight=4), max_retry_after=1.0)
+    monkeypatch.setattr(http_client, "get_rate_limiter_registry", lambda: registry)
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            return httpx.Response(429, headers={"Retry-After": "0.05"})
+        return httpx.Response(200, text="ok")
+
+    set_http_client(build_http_client(transport=httpx.MockTransport(handler)))
+    try:
+        response = await http_client.rate_limited_get("https://example.com/feed")
+    finally:
+        await close_http_client()
+
+    assert response.status_code == 200
+    assert calls == 2
+    assert registry.get_status()["example.com"]["throttled"] == 1
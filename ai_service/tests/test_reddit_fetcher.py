@@ -0,0 +1,49 @@
+"""Tests for the Reddit fetcher's batch mode (HTTP mocked)."""
+
+import httpx
+import pytest
+
+from ai_service.fetchers.http_client import build_http_client, close_http_client, set_http_client
+from ai_service.fetchers.reddit_fetcher import RedditFetcher, build_queries
+
+
+def test_build_queries_respects_length_limit():
+    tickers = [f"T{i:03d}" for i in range(200)]
+
+    groups = build_queries(tickers, max_chars=100)
+
+    assert [t for group in groups for t in group] == tickers
+    assert all(len(" OR ".join(group)) <= 100 for group in groups)
+    assert len(groups[0]) == 13  # 13 * 4 chars + 12 * len(" OR ") == 100
+
+
+def _listing(*posts: dict) -> dict:
+    return {"data": {"children": [{"data": post} for post in posts]}}
+
+
+@pytest.mark.asyncio
+async def test_batch_searches_each_subreddit_once_and_attributes_posts():
+    queries: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        queries.append(request.url.params["q"])
+        subreddit = request.url.path.split("/")[2]
+        return httpx.Response(200, json=_listing(
+            {"title": "$AAPL to the moon", "score": 50, "permalink": f"/r/{subreddit}/1"},
+            {"title": "Microsoft and Apple both up", "score": 10, "permalink": f"/r/{subreddit}/2"},
+            {"title": "Unrelated rant", "score": 99, "permalink": f"/r/{subreddit}/3"},
+        ))
+
+    set_http_client(build_http_client(transport=httpx.MockTransport(handler)))
+    try:
+        posts = await RedditFetcher().fetch_for_tickers(
+            ["AAPL", "MSFT"], max_items=10, company_names={"AAPL": "Apple", "MSFT": "Microsoft"}
+        )
+    finally:
+        await close_http_client()
+
+    assert queries == ["AAPL OR MSFT"] * len(RedditFetcher.SUBREDDITS)
+    assert len(posts["AAPL"]) == 2 * len(RedditFetcher.SUBREDDITS)
+    assert posts["AAPL"][0].score == 50  # Sorted by score
+    assert {p.title for p in posts["MSFT"]} == {"Microsoft and Apple both up"}
+    assert all(p.ticker == "MSFT" for p in posts["MSFT"])
@@ -0,0 +1,101 @@
+"""Tests for background watchlist ingestion."""
+
+import asyncio
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from ai_service.fetchers import FetchedNews, NewsFetcher
+from ai_service.fetchers.scheduler import (
+    IngestionScheduler,
+    SourceCursor,
+    parse_source_intervals,
+)
+
+
+def _item(title: str, published: datetime, ticker: str = "AAPL") -> FetchedNews:
+    return FetchedNews(ticker=ticker, title=title, source="Test", url=f"https://example.com/{title}", published=published)
+
+
+def test_cursor_only_returns_new_items():
+    cursor = SourceCursor()
+    now = datetime(2026, 1, 5, 12, 0)
+
+    first = cursor.take_new([_item("a", now - timedelta(hours=1)), _item("b", now)])
+    second = cursor.take_new([_item("b", now), _item("c", now + timedelta(minutes=5))])
+
+    assert [n.title for n in first] == ["a", "b"]
+    assert [n.title for n in second] == ["c"]
+    assert cursor.high_water == now + timedelta(minutes=5)
+
+
+def test_parse_source_intervals():
+    assert parse_source_intervals("Reddit=900, bad, General=600") == {"Reddit": 900.0, "General": 600.0}
+
+
+class _FakeFetcher(NewsFetcher):
+    """Two per-ticker sources, each returning a growing list of headlines."""
+
+    TICKER_SOURCES = ["Fast", "Slow"]
+
+    def __init__(self):
+        super().__init__()
+        self.calls: list[tuple[str, str]] = []
+
+    def _ticker_sources(self, ticker, company_name, max_items, include_general=True):
+        async def source(label: str) -> list[FetchedNews]:
+            self.calls.append((ticker, label))
+            count = sum(1 for call in self.calls if call == (ticker, label))
+            now = datetime(2026, 1, 5, 12, 0)
+            return [_item(f"{label}-{i}", now + timedelta(minutes=i), ticker) for i in range(count)]
+
+        return {"Fast": source("Fast"), "Slow": source("Slow")}
+
+    async def fetch_general_batch(self, companies, max_items=5):
+        return []
+
+
+@pytest.mark.asyncio
+async def test_scheduler_polls_per_source_and_stores_only_new_items():
+    fetcher = _FakeFetcher()
+    sunk: list[FetchedNews] = []
+    scheduler = IngestionScheduler(
+        fetcher,
+        ["aapl"],
+        interval_seconds=10,
+        source_intervals={"Fast": 0.05},
+        jitter=0.1,
+        sink=sunk.extend,
+        rng=random.Random(1),
+    )
+
+    assert scheduler.get_warm_news("AAPL") is None
+    scheduler.start()
+    await asyncio.sleep(1.5)
+    await scheduler.stop()
+
+    fast_polls = fetcher.calls.count(("AAPL", "Fast"))
+    assert fast_polls >= 2
+    assert fetcher.calls.count(("AAPL", "Slow")) <= 1
+    # Each poll returns all earlier headlines again; only the new one is stored
+    assert len([n for n in sunk if n.title.startswith("Fast")]) == fast_polls
+    assert len({n.title for n in sunk}) == len(sunk)
+    # Warm once every per-ticker source has completed a poll
+    assert scheduler.is_warm("AAPL") == (("AAPL", "Slow") in fetcher.calls)
+
+
+@pytest.mark.asyncio
+async def test_warm_news_expires_when_polls_stop():
+    fetcher = _FakeFetcher()
+    scheduler = IngestionScheduler(fetcher, ["AAPL"], interval_seconds=10, jitter=0, warm_max_age=3, rng=random.Random(1))
+
+    scheduler.start()
+    await asyncio.sleep(0.2)
+    await scheduler.stop()
+    assert scheduler.get_warm_news("AAPL") is not None
+
+    # Last polls 31s ago: older than 3 intervals of 10s
+    scheduler._polled_at = {key: at - 31 for key, at in scheduler._polled_at.items()}
+    assert scheduler.get_warm_news("AAPL") is None
+    assert not scheduler.is_warm("AAPL")
@@ -0,0 +1,128 @@
+"""Tests for per-source circuit breakers."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from ai_service.fetchers import NewsFetcher
+from ai_service.fetchers.feed_cache import FeedCache
+from ai_service.fetchers.http_client import (
+    build_http_client,
+    close_http_client,
+    set_http_client,
+)
+from ai_service.fetchers.source_health import (
+    BreakerState,
+    SourceCircuit,
+    SourceHealthRegistry,
+)
+
+
+def test_circuit_opens_after_consecutive_failures():
+    circuit = SourceCircuit("reuters_business", failure_threshold=3, cooldown_seconds=300)
+
+    circuit.record_failure(0.1)
+    circuit.record_success(0.2, 10)
+    circuit.record_failure(0.1)
+    circuit.record_failure(0.1)
+    assert circuit.state == BreakerState.CLOSED
+
+    circuit.record_failure(0.1)
+    assert circuit.state == BreakerState.OPEN
+    assert circuit.allow() is False
+
+    status = circuit.get_status()
+    assert status["rejected"] == 1
+    assert status["success_rate"] == 0.2
+    assert status["avg_items"] == 10
+    assert status["retry_in_seconds"] is not None
+
+
+def test_half_open_allows_single_probe():
+    circuit = SourceCircuit("cnbc", failure_threshold=1, cooldown_seconds=0)
+    circuit.record_failure(0.1)
+
+    assert circuit.allow() is True
+    assert circuit.state == BreakerState.HALF_OPEN
+    assert circuit.allow() is False  # Probe already in flight
+
+    circuit.record_success(0.1, 3)
+    assert circuit.state == BreakerState.CLOSED
+    assert circuit.allow() is True
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_skips_source_without_request():
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(500)
+
+    fetcher = NewsFetcher(
+        feed_cache=FeedCache(ttl_floor_seconds=0),
+        source_health=SourceHealthRegistry(failure_threshold=2, cooldown_seconds=300),
+    )
+    set_http_client(build_http_client(transport=httpx.MockTransport(handler)))
+    try:
+        for _ in range(4):
+            assert await fetcher._fetch_rss("AAPL", "yahoo_finance", 5) == []
+    finally:
+        await close_http_client()
+
+    assert calls == 2
+    status = fetcher.source_health.get_status()["yahoo_finance"]
+    assert status["state"] == "open"
+    assert status["failures"] == 2
+    assert status["rejected"] == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_fetches_do_not_count_as_failures():
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(1)
+        return httpx.Response(200, content=b"<rss><channel></channel></rss>")
+
+    fetcher = NewsFetcher(
+        feed_cache=FeedCache(ttl_floor_seconds=0),
+        source_health=SourceHealthRegistry(failure_threshold=2, cooldown_seconds=300),
+    )
+    set_http_client(build_http_client(transport=httpx.MockTransport(handler)))
+    try:
+        for _ in range(3):
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(fetcher._fetch_feed("https://feeds.example.com/rss", "cnbc", "AAPL", 5), 0.05)
+    finally:
+        await close_http_client()
+
+    status = fetcher.source_health.get_status()["cnbc"]
+    assert status["state"] == "closed"
+    assert status["failures"] == 0
+    assert fetcher.source_health.get("cnbc").allow() is True
+
+
+@pytest.mark.asyncio
+async def test_uncovered_ticker_404s_do_not_open_the_circuit():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if "MBG.DE" in str(request.url):
+            return httpx.Response(404)
+        return httpx.Response(200, content=b"<rss><channel><item><title>Apple news</title></item></channel></rss>")
+
+    fetcher = NewsFetcher(
+        feed_cache=FeedCache(ttl_floor_seconds=0),
+        source_health=SourceHealthRegistry(failure_threshold=2, cooldown_seconds=300),
+    )
+    set_http_client(build_http_client(transport=httpx.MockTransport(handler)))
+    try:
+        for _ in range(3):
+            assert await fetcher._fetch_rss("MBG.DE", "yahoo_finance", 5) == []
+        news = await fetcher._fetch_rss("AAPL", "yahoo_finance", 5)
+    finally:
+        await close_http_client()
+
+    assert [n.title for n in news] == ["Apple news"]
+    status = fetcher.source_health.get_status()["yahoo_finance"]
+    assert status["state"] == "closed"
+    assert status["failures"] == 0
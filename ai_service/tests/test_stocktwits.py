@@ -0,0 +1,70 @@
+"""Tests for incremental StockTwits consumption and rolling sentiment (HTTP mocked)."""
+
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+
+from ai_service.fetchers.http_client import build_http_client, close_http_client, set_http_client
+from ai_service.fetchers.stocktwits_fetcher import StockTwitsConsumer, StockTwitsFetcher
+from ai_service.news_store import NewsStore
+from ai_service.processors.rolling_sentiment import RollingSentiment
+
+
+def _message(message_id: int, sentiment: str = "Bullish") -> dict:
+    return {
+        "id": message_id,
+        "body": f"message {message_id}",
+        "created_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "user": {"username": "trader"},
+        "entities": {"sentiment": {"basic": sentiment}},
+    }
+
+
+@pytest.mark.asyncio
+async def test_consumer_requests_only_messages_after_persisted_cursor():
+    stream = [_message(3), _message(2, "Bearish"), _message(1)]
+    seen_params: list[dict[str, str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        params = dict(request.url.params)
+        seen_params.append(params)
+        since = int(params.get("since", 0))
+        return httpx.Response(200, json={"messages": [m for m in stream if m["id"] > since]})
+
+    store = NewsStore(":memory:")
+    set_http_client(build_http_client(transport=httpx.MockTransport(handler)))
+    try:
+        consumer = StockTwitsConsumer(StockTwitsFetcher(), cursor_store=store)
+        first = await consumer.poll("aapl")
+        stream.insert(0, _message(4))
+        # A new consumer (e.g. after a restart) resumes from the stored cursor
+        resumed = StockTwitsConsumer(StockTwitsFetcher(), cursor_store=store)
+        second = await resumed.poll("AAPL")
+    finally:
+        await close_http_client()
+
+    assert [m.message_id for m in first] == [1, 2, 3]
+    assert seen_params == [{}, {"since": "3"}]
+    assert [m.message_id for m in second] == [4]
+    assert store.get_cursor("stocktwits", "AAPL") == "4"
+    counts = consumer.sentiment.get("AAPL")["1h"]
+    assert (counts.bullish, counts.bearish, counts.total) == (2, 1, 3)
+
+
+def test_rolling_sentiment_expires_old_buckets():
+    now = 1_800_000_000.0
+    sentiment = RollingSentiment(clock=lambda: now)
+
+    sentiment.add("TSLA", "Bullish", datetime.fromtimestamp(now - 7200, timezone.utc))
+    sentiment.add("TSLA", "Bearish", datetime.fromtimestamp(now - 60, timezone.utc))
+    sentiment.add("TSLA", None)
+    sentiment.add("TSLA", "Bullish", datetime.fromtimestamp(now - 90000, timezone.utc))  # Outside 24h
+
+    counts = sentiment.get("TSLA")
+    assert counts["1h"].total == 2 and counts["1h"].bullish_ratio == 0.0
+    assert counts["24h"].bullish == 1 and counts["24h"].total == 3
+
+    now += 3600
+    assert sentiment.get("TSLA")["1h"].total == 0
+    assert sentiment.get("TSLA")["24h"].total == 3
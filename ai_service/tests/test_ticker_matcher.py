@@ -0,0 +1,46 @@
+"""Tests for the Aho-Corasick ticker matcher."""
+
+from ai_service.processors.ticker_matcher import TickerMatcher, get_ticker_matcher
+
+
+def test_matches_symbols_and_aliases_in_one_pass():
+    matcher = TickerMatcher({
+        "AAPL": ["apple"],
+        "MSFT": ["microsoft"],
+        "DBK.DE": ["deutsche bank", "db"],
+    })
+
+    text = "Apple and MSFT rally while Deutsche Bank slips"
+
+    assert matcher.match(text) == {"AAPL", "MSFT", "DBK.DE"}
+
+
+def test_short_tickers_require_word_boundary_and_upper_case():
+    matcher = TickerMatcher({"V": ["visa"], "MA": ["mastercard"]})
+
+    assert matcher.match("Markets are volatile as a vote nears") == set()
+    assert matcher.match("Die Aktie legte ma deutlich zu") == set()
+    assert matcher.match("EMA crossover signals") == set()
+    assert matcher.match("Payment stocks: V and MA gain") == {"V", "MA"}
+    assert matcher.match("Visa beats, Mastercard in line") == {"V", "MA"}
+
+
+def test_aliases_do_not_match_inside_words():
+    matcher = TickerMatcher({"INTC": ["intel"], "META": ["meta"]})
+
+    assert matcher.match("Intelligence report on metadata") == set()
+    assert matcher.match("Intel and Meta announce partnership") == {"INTC", "META"}
+
+
+def test_overlapping_patterns_are_all_found():
+    matcher = TickerMatcher({"LLY": ["eli lilly", "lilly"], "DTE.DE": ["deutsche telekom", "telekom"]})
+
+    assert matcher.match("Eli Lilly partners with Deutsche Telekom") == {"LLY", "DTE.DE"}
+
+
+def test_known_aliases_are_included():
+    matcher = get_ticker_matcher({"TSLA": "Tesla", "VOW3.DE": "Volkswagen", "NVDA": "NVIDIA"})
+
+    assert matcher.match_all("VW cuts guidance", None) == {"VOW3.DE"}
+    assert matcher.match_all("Chip stocks", "Nvidia surges on AI demand") == {"NVDA"}
+    assert matcher.match("vw is not a symbol here") == set()
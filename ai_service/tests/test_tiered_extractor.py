@@ -0,0 +1,88 @@
+"""Tests for tiered (HTTP first, browser fallback) article extraction."""
+
+from typing import Optional
+
+import pytest
+
+from ai_service.processors.tiered_extractor import (
+    BROWSER,
+    HTTP,
+    DomainTiers,
+    TieredExtractor,
+    score_extraction,
+)
+from ai_service.processors.main_content import extract_main_content
+
+PARAGRAPH = "Shares of the company rose after it reported quarterly revenue above analyst estimates. " * 3
+
+ARTICLE_HTML = (
+    "<html><body><nav>Markets | Tech | Opinion</nav><article>"
+    + "".join(f"<p>{PARAGRAPH}</p>" for _ in range(6))
+    + "</article><footer>Copyright</footer></body></html>"
+)
+JS_SHELL_HTML = '<html><body><div id="root"></div><script>render()</script><p>Loading...</p></body></html>'
+PAYWALL_HTML = (
+    "<html><body><article>"
+    + f"<p>{PARAGRAPH}</p><p>{PARAGRAPH}</p>"
+    + "<p>Subscribe to continue reading this article and get unlimited access.</p>"
+    + "</article></body></html>"
+)
+
+
+class FakeContentFetcher:
+    def __init__(self, pages: dict[str, str]):
+        self.pages = pages
+        self.requested: list[str] = []
+
+    def fetch_html(self, url: str) -> Optional[str]:
+        self.requested.append(url)
+        return self.pages.get(url)
+
+
+def _score(html: str) -> float:
+    content = extract_main_content(html)
+    return score_extraction(content.paragraphs, content.visible_chars, html).score
+
+
+def test_scoring_separates_articles_from_shells_and_paywalls():
+    assert len(extract_main_content(ARTICLE_HTML).paragraphs) == 6
+    assert _score(ARTICLE_HTML) >= 0.9
+    assert _score(JS_SHELL_HTML) < 0.5
+    assert _score(PAYWALL_HTML) < 0.5
+    # Free pages naming CSS classes or scripts after a paywall are not penalised
+    free_page = ARTICLE_HTML.replace("<article>", '<article class="no-paywall"><script>initPaywall()</script>')
+    assert _score(free_page) >= 0.9
+
+
+@pytest.mark.asyncio
+async def test_escalates_to_browser_and_remembers_domain():
+    fetcher = FakeContentFetcher({
+        "https://news.example.com/a": ARTICLE_HTML,
+        "https://www.app.example.org/1": JS_SHELL_HTML,
+        "https://app.example.org/2": JS_SHELL_HTML,
+    })
+    browser_calls: list[str] = []
+
+    async def browser_extract(url: str) -> str:
+        browser_calls.append(url)
+        return "Rendered article text " * 50
+
+    extractor = TieredExtractor(content_fetcher=fetcher)
+
+    assert (await extractor.extract("https://news.example.com/a", browser_extract)).startswith("Shares")
+    assert browser_calls == []
+
+    assert await extractor.extract("https://www.app.example.org/1", browser_extract)
+    # Known browser domain: the plain GET is skipped
+    assert await extractor.extract("https://app.example.org/2", browser_extract)
+
+    assert fetcher.requested == ["https://news.example.com/a", "https://www.app.example.org/1"]
+    assert browser_calls == ["https://www.app.example.org/1", "https://app.example.org/2"]
+    assert extractor.get_stats()["domains"] == {"domains": 2, "http": 1, "browser": 1}
+
+
+def test_browser_domains_are_reprobed_over_http():
+    tiers = DomainTiers(reprobe_every=3)
+    tiers.record("https://app.example.org/1", BROWSER)
+
+    assert [tiers.preferred("https://app.example.org/x") for _ in range(3)] == [BROWSER, BROWSER, HTTP]
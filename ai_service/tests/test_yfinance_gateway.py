@@ -0,0 +1,114 @@
+"""Tests for the batched yfinance gateway (no network: yf.Ticker is faked)."""
+
+import asyncio
+import time
+
+import pytest
+
+from ai_service.fetchers.yfinance_gateway import YFinanceGateway
+
+
+class FakeTicker:
+    def __init__(self, symbol: str):
+        self.symbol = symbol
+
+    @property
+    def news(self):
+        if self.symbol.startswith("SLOW"):
+            time.sleep(0.2)  # One blocking Yahoo request
+        return [{"title": f"{self.symbol} news"}]
+
+    @property
+    def info(self):
+        if self.symbol == "BAD":
+            raise ValueError("no data")
+        return {"symbol": self.symbol}
+
+
+class FakeFactory:
+    """Builds FakeTicker objects, failing like yfinance does for an empty symbol."""
+
+    def __init__(self):
+        self.symbols: list[str] = []
+
+    def __call__(self, symbol: str) -> FakeTicker:
+        if not symbol:
+            raise ValueError("Empty ticker name")
+        self.symbols.append(symbol)
+        return FakeTicker(symbol)
+
+
+@pytest.fixture
+def factory():
+    return FakeFactory()
+
+
+@pytest.fixture
+def gateway(factory):
+    gw = YFinanceGateway(max_workers=2, batch_window=0.01, ticker_factory=factory)
+    yield gw
+    gw.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_symbols_share_one_batch(gateway, factory):
+    results = await asyncio.gather(*(gateway.news(s) for s in ["aapl", "MSFT", "NVDA"]))
+
+    assert [r[0]["title"] for r in results] == ["AAPL news", "MSFT news", "NVDA news"]
+    assert sorted(factory.symbols) == ["AAPL", "MSFT", "NVDA"]
+    assert gateway.get_stats()["batches"] == 1
+
+
+@pytest.mark.asyncio
+async def test_duplicate_requests_are_coalesced(gateway, factory):
+    results = await asyncio.gather(*(gateway.info("AAPL") for _ in range(5)))
+
+    assert all(r == {"symbol": "AAPL"} for r in results)
+    assert factory.symbols == ["AAPL"]
+    assert gateway.get_stats()["coalesced"] == 4
+
+
+@pytest.mark.asyncio
+async def test_failures_are_per_symbol(gateway):
+    good, bad = await asyncio.gather(gateway.info("AAPL"), gateway.info("BAD"), return_exceptions=True)
+
+    assert good == {"symbol": "AAPL"}
+    assert isinstance(bad, ValueError)
+    assert gateway.get_stats()["batches"] == 1
+
+
+@pytest.mark.asyncio
+async def test_unconstructible_symbol_fails_only_its_callers(gateway):
+    good, empty = await asyncio.wait_for(
+        asyncio.gather(gateway.news("AAPL"), gateway.news(""), return_exceptions=True), timeout=5
+    )
+
+    assert good == [{"title": "AAPL news"}]
+    assert isinstance(empty, ValueError)
+    assert gateway.get_stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_full_batch_is_sent_without_waiting(factory):
+    gateway = YFinanceGateway(batch_window=60, max_batch=2, ticker_factory=factory)
+    try:
+        await asyncio.wait_for(asyncio.gather(gateway.news("A"), gateway.news("B")), timeout=5)
+    finally:
+        gateway.shutdown()
+
+    assert gateway.get_stats()["batches"] == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_symbols_are_read_in_parallel(factory):
+    gateway = YFinanceGateway(max_workers=4, batch_window=0.01, ticker_factory=factory)
+    try:
+        started = time.monotonic()
+        await asyncio.gather(*(gateway.news(f"SLOW{i}") for i in range(4)))
+        elapsed = time.monotonic() - started
+    finally:
+        gateway.shutdown()
+
+    assert gateway.get_stats()["batches"] == 1
+    # Four 0.2s lookups on four threads, not one after another
+    assert elapsed < 0.6